@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-call overhead of the interceptor chain.
+
+Runs fully offline: the HTTP layer is replaced by a canned response, so
+only the client's own request path is measured.
+
+Usage:
+    python benchmarks/bench_interceptors.py [--count 200000] [--depth 4]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from curl_cffi.requests import Headers, Response
+
+from jup_python_sdk.clients.jupiter_client import AsyncJupiterClient, JupiterClient
+from jup_python_sdk.transport.interceptors import AsyncInterceptor, Interceptor
+
+URL = "https://api.jup.ag/ultra/v1/balances/wallet"
+
+
+def canned_response() -> Response:
+    response = Response()
+    response.status_code = 200
+    response.ok = True
+    response.reason = "OK"
+    response.content = b"{}"
+    response.headers = Headers({})
+    return response
+
+
+def offline_client(interceptors: list[Interceptor]) -> JupiterClient:
+    response = canned_response()
+    client = JupiterClient(interceptors=interceptors)
+    client._send = lambda method, url, **kwargs: response  # type: ignore
+    return client
+
+
+def offline_async_client(
+    interceptors: list[AsyncInterceptor],
+) -> AsyncJupiterClient:
+    response = canned_response()
+
+    async def send(method: str, url: str, **kwargs: Any) -> Response:
+        return response
+
+    client = AsyncJupiterClient(interceptors=interceptors)
+    client._send = send  # type: ignore
+    return client
+
+
+def report(label: str, elapsed: float, count: int) -> None:
+    print(f"{label:<32} {elapsed * 1000:9.2f} ms  {elapsed / count * 1e9:8.0f} ns/call")
+
+
+def timed(label: str, fn: Callable[[], Any], count: int) -> None:
+    start = time.perf_counter()
+    fn()
+    report(label, time.perf_counter() - start, count)
+
+
+async def atimed(label: str, coro: Awaitable[Any], count: int) -> None:
+    start = time.perf_counter()
+    await coro
+    report(label, time.perf_counter() - start, count)
+
+
+def run_sync(client: JupiterClient, count: int) -> None:
+    request = client._request
+    for _ in range(count):
+        request("balances", "GET", URL)
+
+
+def run_direct(client: JupiterClient, count: int) -> None:
+    send = client._send_with_retries
+    for _ in range(count):
+        send("balances", "GET", URL, None, {})
+
+
+async def run_async(client: AsyncJupiterClient, count: int) -> None:
+    request = client._request
+    for _ in range(count):
+        await request("balances", "GET", URL)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--depth", type=int, default=4)
+    args = parser.parse_args()
+    count, depth = args.count, args.depth
+
+    print(f"{count} calls per case")
+
+    bare = offline_client([])
+    timed("sync, retry loop called directly", lambda: run_direct(bare, count), count)
+    timed("sync, no interceptors", lambda: run_sync(bare, count), count)
+    chained = offline_client([Interceptor() for _ in range(depth)])
+    timed(f"sync, {depth} no-op interceptors", lambda: run_sync(chained, count), count)
+    bare.close()
+    chained.close()
+
+    async def run_all() -> None:
+        bare = offline_async_client([])
+        await atimed("async, no interceptors", run_async(bare, count), count)
+        chained = offline_async_client([AsyncInterceptor() for _ in range(depth)])
+        await atimed(
+            f"async, {depth} no-op interceptors", run_async(chained, count), count
+        )
+        await bare.close()
+        await chained.close()
+
+    asyncio.run(run_all())
+
+
+if __name__ == "__main__":
+    main()
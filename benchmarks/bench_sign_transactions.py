@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: batch transaction signing vs. the per-transaction loop.
+
+Runs fully offline against locally built unsigned v0 transactions.
+
+Usage:
+    python benchmarks/bench_sign_transactions.py [--count 500] [--workers 4]
+"""
+
+import argparse
+import base64
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.solders import Hash, Keypair, MessageV0, Signature, VersionedTransaction
+from solders.system_program import TransferParams, transfer
+
+from jup_python_sdk.clients.jupiter_client import JupiterClient
+from jup_python_sdk.signing.signer import KeypairSigner
+
+
+def build_unsigned_transactions(keypair: Keypair, count: int) -> list[str]:
+    """Build `count` distinct unsigned base64 transactions for `keypair`."""
+    transactions = []
+    for i in range(count):
+        instructions = [
+            set_compute_unit_limit(200_000),
+            set_compute_unit_price(1_000 + i),
+        ] + [
+            transfer(
+                TransferParams(
+                    from_pubkey=keypair.pubkey(),
+                    to_pubkey=Keypair().pubkey(),
+                    lamports=1 + i,
+                )
+            )
+            for _ in range(8)
+        ]
+        message = MessageV0.try_compile(
+            keypair.pubkey(), instructions, [], Hash.new_unique()
+        )
+        transaction = VersionedTransaction.populate(message, [Signature.default()])
+        transactions.append(base64.b64encode(bytes(transaction)).decode("utf-8"))
+    return transactions
+
+
+def timed(label: str, fn: Callable[[], list[str]], count: int) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<32} {elapsed * 1000:9.2f} ms  "
+        f"{elapsed / count * 1e6:8.1f} us/tx  {count / elapsed:10.0f} tx/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    args = parser.parse_args()
+
+    keypair = Keypair()
+    client = JupiterClient(signer=KeypairSigner(keypair))
+    transactions = build_unsigned_transactions(keypair, args.count)
+
+    print(f"Signing {args.count} transactions")
+
+    timed(
+        "per-transaction loop",
+        lambda: [
+            client._serialize_versioned_transaction(client._sign_base64_transaction(tx))
+            for tx in transactions
+        ],
+        args.count,
+    )
+    timed(
+        "sign_transactions", lambda: client.sign_transactions(transactions), args.count
+    )
+
+    with ThreadPoolExecutor(args.workers) as pool:
+        timed(
+            f"sign_transactions (threads={args.workers})",
+            lambda: client.sign_transactions(
+                transactions, executor=pool, chunk_size=args.chunk_size
+            ),
+            args.count,
+        )
+
+    with ProcessPoolExecutor(args.workers) as pool:
+        # Spin the workers up so start-up cost is not measured
+        list(pool.map(abs, range(args.workers)))
+        timed(
+            f"sign_transactions (procs={args.workers})",
+            lambda: client.sign_transactions(
+                transactions, executor=pool, chunk_size=args.chunk_size
+            ),
+            args.count,
+        )
+
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
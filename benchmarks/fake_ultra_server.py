@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Jupiter Ultra API, for load tests.
+
+Serves /ultra/v1/order, /ultra/v1/execute, /ultra/v1/balances/{address} and
+/ultra/v1/shield with realistic bodies. Orders carry unsigned v0
+transactions paid by the taker, so the SDK can sign them, and execute
+checks the signatures. Each endpoint's latency is drawn from a configurable
+distribution, and a share of requests can be failed with 500 or 429.
+
+Usage:
+    python benchmarks/fake_ultra_server.py [--port 8899]
+        [--latency order=lognormal:80:0.4] [--latency execute=uniform:150:400]
+        [--error-rate 0.01] [--rate-limit-rate 0.02] [--retry-after 0.1]
+"""
+
+import argparse
+import base64
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.solders import (
+    Hash,
+    MessageV0,
+    Pubkey,
+    Signature,
+    VersionedTransaction,
+)
+from solders.system_program import TransferParams, transfer
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+ENDPOINTS = ("order", "execute", "balances", "shield")
+
+_WARNINGS = (
+    ("NOT_VERIFIED", "This token is not verified", "info"),
+    ("LOW_ORGANIC_ACTIVITY", "This token has low organic activity", "warning"),
+    ("HAS_FREEZE_AUTHORITY", "The authority can freeze token accounts", "critical"),
+    ("HAS_MINT_AUTHORITY", "The authority can mint more tokens", "warning"),
+)
+
+
+class Latency:
+    """
+    Distribution of simulated server time.
+
+    Specs are `kind:args` with milliseconds as the unit:
+
+    - `fixed:MS`, or just `MS`
+    - `uniform:LOW:HIGH`
+    - `normal:MEAN:STDDEV` (negative draws are clamped to 0)
+    - `lognormal:MEDIAN:SIGMA` (long right tail, like real API latency)
+    - `exponential:MEAN`
+    """
+
+    def __init__(self, spec: str = "0"):
+        self.spec = spec
+        kind, _, rest = spec.partition(":")
+        if not rest:
+            kind, rest = "fixed", kind
+        args = [float(arg) for arg in rest.split(":")]
+        expected = {
+            "fixed": 1,
+            "uniform": 2,
+            "normal": 2,
+            "lognormal": 2,
+            "exponential": 1,
+        }
+        if kind not in expected:
+            raise ValueError(f"Unknown latency distribution {kind!r}")
+        if len(args) != expected[kind]:
+            raise ValueError(f"{kind} latency takes {expected[kind]} argument(s)")
+        self.kind = kind
+        self.args = args
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency, in seconds."""
+        args = self.args
+        if self.kind == "fixed":
+            ms = args[0]
+        elif self.kind == "uniform":
+            ms = rng.uniform(args[0], args[1])
+        elif self.kind == "normal":
+            ms = rng.gauss(args[0], args[1])
+        elif self.kind == "lognormal":
+            ms = args[0] * rng.lognormvariate(0, args[1])
+        else:
+            ms = rng.expovariate(1 / args[0]) if args[0] > 0 else 0.0
+        return max(0.0, ms) / 1000
+
+    def __repr__(self) -> str:
+        return f"Latency({self.spec!r})"
+
+
+def build_order_transaction(taker: Pubkey, rng: random.Random) -> str:
+    """
+    Build an unsigned v0 swap-sized transaction paid by `taker`.
+
+    The taker is the only required signer, so the SDK can sign it with the
+    taker's keypair just like a real Ultra order.
+    """
+    instructions = [
+        set_compute_unit_limit(rng.randint(150_000, 400_000)),
+        set_compute_unit_price(rng.randint(1_000, 100_000)),
+    ] + [
+        transfer(
+            TransferParams(
+                from_pubkey=taker,
+                to_pubkey=Pubkey.new_unique(),
+                lamports=rng.randint(1, 10_000),
+            )
+        )
+        for _ in range(6)
+    ]
+    message = MessageV0.try_compile(taker, instructions, [], Hash.new_unique())
+    transaction = VersionedTransaction.populate(message, [Signature.default()])
+    return base64.b64encode(bytes(transaction)).decode("utf-8")
+
+
+class FakeUltraServer:
+    """
+    In-process fake Ultra API on a background thread.
+
+    Use it as a context manager, or call start() and stop(). Point a client
+    at it by setting `client.base_url = server.base_url`.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Optional[Mapping[str, Latency]] = None,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            host: Interface to listen on.
+            port: Port to listen on, 0 for a free one.
+            latency: Latency distribution per endpoint name. A "*" entry
+                applies to endpoints without their own.
+            error_rate: Share of requests answered with 500.
+            rate_limit_rate: Share of requests answered with 429.
+            retry_after: Retry-After seconds sent with 429s, or None to
+                omit the header.
+            seed: Seed for latencies, faults and payloads.
+        """
+        latency = dict(latency or {})
+        default = latency.pop("*", Latency())
+        self.latency = {name: latency.get(name, default) for name in ENDPOINTS}
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)  # noqa: S311
+        self.stats: Counter[tuple[str, int]] = Counter()
+        self._orders: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeUltraServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-ultra", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def __enter__(self) -> "FakeUltraServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def handle(
+        self, method: str, path: str, query: dict[str, list[str]], body: bytes
+    ) -> tuple[int, dict[str, str], Any]:
+        """Route one request; returns status, extra headers and JSON body."""
+        endpoint, handler = self._route(method, path)
+        if handler is None:
+            return 404, {}, {"error": f"No route for {method} {path}"}
+
+        time.sleep(self.latency[endpoint].sample(self.rng))
+        roll = self.rng.random()
+        if roll < self.rate_limit_rate:
+            status, headers, payload = 429, {}, {"error": "Too many requests"}
+            if self.retry_after is not None:
+                headers["Retry-After"] = f"{self.retry_after:g}"
+        elif roll < self.rate_limit_rate + self.error_rate:
+            status, headers, payload = 500, {}, {"error": "Internal server error"}
+        else:
+            status, payload = handler(path, query, body)
+            headers = {}
+        with self._lock:
+            self.stats[(endpoint, status)] += 1
+        return status, headers, payload
+
+    def _route(self, method: str, path: str) -> tuple[str, Any]:
+        if method == "GET" and path == "/ultra/v1/order":
+            return "order", self._order
+        if method == "POST" and path == "/ultra/v1/execute":
+            return "execute", self._execute
+        if method == "GET" and path.startswith("/ultra/v1/balances/"):
+            return "balances", self._balances
+        if method == "GET" and path == "/ultra/v1/shield":
+            return "shield", self._shield
+        return "", None
+
+    def _order(
+        self, path: str, query: dict[str, list[str]], body: bytes
+    ) -> tuple[int, Any]:
+        params = {key: values[0] for key, values in query.items()}
+        missing = {"inputMint", "outputMint", "amount"} - params.keys()
+        if missing:
+            return 400, {"error": f"Missing parameters: {sorted(missing)}"}
+        amount = int(params["amount"])
+        out_amount = amount * self.rng.randint(140, 160) // 1000
+        slippage_bps = int(params.get("slippageBps", 50))
+        request_id = str(uuid.uuid4())
+        order: dict[str, Any] = {
+            "mode": "ultra",
+            "inputMint": params["inputMint"],
+            "outputMint": params["outputMint"],
+            "inAmount": str(amount),
+            "outAmount": str(out_amount),
+            "otherAmountThreshold": str(out_amount * (10_000 - slippage_bps) // 10_000),
+            "swapMode": "ExactIn",
+            "slippageBps": slippage_bps,
+            "priceImpactPct": "0.0001",
+            "routePlan": [
+                {
+                    "swapInfo": {
+                        "ammKey": str(Pubkey.new_unique()),
+                        "label": label,
+                        "inputMint": params["inputMint"],
+                        "outputMint": params["outputMint"],
+                        "inAmount": str(amount * percent // 100),
+                        "outAmount": str(out_amount * percent // 100),
+                        "feeAmount": "0",
+                        "feeMint": params["inputMint"],
+                    },
+                    "percent": percent,
+                }
+                for label, percent in (("Whirlpool", 60), ("Meteora DLMM", 40))
+            ],
+            "feeBps": 10,
+            "prioritizationType": "ComputeBudget",
+            "swapType": "aggregator",
+            "router": "iris",
+            "gasless": False,
+            "requestId": request_id,
+            "transaction": None,
+            "taker": params.get("taker"),
+        }
+        taker = params.get("taker")
+        if taker:
+            transaction = build_order_transaction(Pubkey.from_string(taker), self.rng)
+            order["transaction"] = transaction
+            with self._lock:
+                self._orders[request_id] = base64.b64decode(transaction)
+                if len(self._orders) > 100_000:
+                    self._orders.popitem(last=False)
+        return 200, order
+
+    def _execute(
+        self, path: str, query: dict[str, list[str]], body: bytes
+    ) -> tuple[int, Any]:
+        try:
+            payload = json.loads(body)
+            request_id = payload["requestId"]
+            signed = base64.b64decode(payload["signedTransaction"])
+        except (ValueError, KeyError, TypeError):
+            return 400, {"error": "Invalid request body"}
+        with self._lock:
+            unsigned = self._orders.pop(request_id, None)
+        if unsigned is None:
+            return 400, {"error": "Unknown requestId", "code": -1}
+
+        transaction = VersionedTransaction.from_bytes(signed)
+        if bytes(transaction.message) != bytes(
+            VersionedTransaction.from_bytes(unsigned).message
+        ) or not all(transaction.verify_with_results()):
+            return 200, {
+                "status": "Failed",
+                "code": -2,
+                "error": "Invalid signature",
+                "signature": "",
+            }
+        return 200, {
+            "status": "Success",
+            "code": 0,
+            "signature": str(transaction.signatures[0]),
+            "slot": str(self.rng.randint(300_000_000, 400_000_000)),
+            "inputAmountResult": "0",
+            "outputAmountResult": "0",
+        }
+
+    def _balances(
+        self, path: str, query: dict[str, list[str]], body: bytes
+    ) -> tuple[int, Any]:
+        slot = self.rng.randint(300_000_000, 400_000_000)
+        balances: dict[str, Any] = {
+            "SOL": {
+                "amount": "2547891234",
+                "uiAmount": 2.547891234,
+                "slot": slot,
+                "isFrozen": False,
+            }
+        }
+        for _ in range(self.rng.randint(5, 40)):
+            amount = self.rng.randint(1, 10**12)
+            balances[str(Pubkey.new_unique())] = {
+                "amount": str(amount),
+                "uiAmount": amount / 10**6,
+                "slot": slot,
+                "isFrozen": False,
+            }
+        return 200, balances
+
+    def _shield(
+        self, path: str, query: dict[str, list[str]], body: bytes
+    ) -> tuple[int, Any]:
+        mints = [mint for mint in query.get("mints", [""])[0].split(",") if mint]
+        if not mints:
+            return 400, {"error": "Missing mints"}
+        warnings = {}
+        for mint in mints:
+            count = 0 if mint == SOL_MINT else self.rng.randint(0, 2)
+            warnings[mint] = [
+                {"type": kind, "message": message, "severity": severity}
+                for kind, message, severity in self.rng.sample(_WARNINGS, count)
+            ]
+        return 200, {"warnings": warnings}
+
+
+def _make_handler(server: FakeUltraServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately; without this, Nagle's
+        # algorithm holds the body back on keep-alive connections.
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self._serve("GET")
+
+        def do_POST(self) -> None:
+            self._serve("POST")
+
+        def _serve(self, method: str) -> None:
+            parts = urlsplit(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            status, headers, payload = server.handle(
+                method, parts.path, parse_qs(parts.query), body
+            )
+            content = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+def parse_latencies(specs: list[str]) -> dict[str, Latency]:
+    """Parse `endpoint=spec` (or bare `spec` for all endpoints) options."""
+    latency = {}
+    for spec in specs:
+        endpoint, _, distribution = spec.rpartition("=")
+        endpoint = endpoint or "*"
+        if endpoint != "*" and endpoint not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint {endpoint!r}")
+        latency[endpoint] = Latency(distribution)
+    return latency
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the fake server's options to a command line parser."""
+    parser.add_argument(
+        "--latency",
+        action="append",
+        default=[],
+        metavar="[ENDPOINT=]SPEC",
+        help="Latency distribution, e.g. order=lognormal:80:0.4 (repeatable)",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def server_from_arguments(
+    args: argparse.Namespace, host: str = "127.0.0.1", port: int = 0
+) -> FakeUltraServer:
+    """Create a fake server from parsed add_server_arguments() options."""
+    return FakeUltraServer(
+        host,
+        port,
+        latency=parse_latencies(args.latency),
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8899)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = server_from_arguments(args, args.host, args.port)
+    print(f"Fake Ultra API listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for (endpoint, status), count in sorted(server.stats.items()):
+            print(f"{endpoint:<10} {status}  {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Load test: drive UltraApiClient / AsyncUltraApiClient against a fake server.
+
+Starts benchmarks/fake_ultra_server.py in-process (or targets one already
+running with --url) and, for each concurrency level, runs a fixed number of
+operations and reports throughput, p50/p99 latency and per-attempt outcomes.
+Run the server in its own process for the most accurate client numbers.
+
+Usage:
+    python benchmarks/load_test.py [--mode async] [--operation swap]
+        [--concurrency 1,8,32] [--requests 500]
+        [--latency order=lognormal:80:0.4] [--rate-limit-rate 0.02]
+        [--retries 3] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from fake_ultra_server import SOL_MINT, add_server_arguments, server_from_arguments
+from solders.solders import Keypair
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.models.ultra_api.ultra_order_request_model import (
+    UltraOrderRequest,
+)
+from jup_python_sdk.signing.signer import KeypairSigner
+from jup_python_sdk.transport.metrics import LatencyHistogram, MetricsRegistry
+from jup_python_sdk.transport.retry_policy import RetryPolicy
+
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+OPERATIONS = ("order", "swap", "balances", "shield")
+
+
+def client_kwargs(args: argparse.Namespace, metrics: MetricsRegistry) -> dict[str, Any]:
+    retry_policy = None
+    if args.retries > 1:
+        retry_policy = RetryPolicy(max_attempts=args.retries, backoff_base=0.01)
+    return {
+        "signer": KeypairSigner(args.keypair),
+        "client_kwargs": {"impersonate": args.impersonate, "timeout": args.timeout},
+        "retry_policy": retry_policy,
+        "metrics": metrics,
+    }
+
+
+def order_request(args: argparse.Namespace, i: int) -> UltraOrderRequest:
+    return UltraOrderRequest(
+        input_mint=SOL_MINT,
+        output_mint=USDC_MINT,
+        amount=10_000_000 + i,
+        taker=str(args.keypair.pubkey()),
+    )
+
+
+def sync_operation(
+    client: UltraApiClient, args: argparse.Namespace
+) -> Callable[[int], Any]:
+    wallet = str(args.keypair.pubkey())
+    mints = [SOL_MINT, USDC_MINT, str(Keypair().pubkey())]
+    return {
+        "order": lambda i: client.order(order_request(args, i)),
+        "swap": lambda i: client.order_and_execute(order_request(args, i)),
+        "balances": lambda i: client.balances(wallet),
+        "shield": lambda i: client.shield(mints),
+    }[args.operation]
+
+
+def async_operation(
+    client: AsyncUltraApiClient, args: argparse.Namespace
+) -> Callable[[int], Awaitable[Any]]:
+    wallet = str(args.keypair.pubkey())
+    mints = [SOL_MINT, USDC_MINT, str(Keypair().pubkey())]
+    return {
+        "order": lambda i: client.order(order_request(args, i)),
+        "swap": lambda i: client.order_and_execute(order_request(args, i)),
+        "balances": lambda i: client.balances(wallet),
+        "shield": lambda i: client.shield(mints),
+    }[args.operation]
+
+
+def is_failure(result: Any) -> bool:
+    return isinstance(result, dict) and result.get("status") == "Failed"
+
+
+def run_sync_level(
+    args: argparse.Namespace, concurrency: int, metrics: MetricsRegistry
+) -> tuple[float, LatencyHistogram, int]:
+    client = UltraApiClient(pool_size=concurrency, **client_kwargs(args, metrics))
+    client.base_url = args.url
+    operation = sync_operation(client, args)
+    histogram = LatencyHistogram()
+    errors = 0
+
+    def timed_call(i: int) -> tuple[float, bool]:
+        start = time.perf_counter()
+        try:
+            failed = is_failure(operation(i))
+        except Exception:
+            failed = True
+        return time.perf_counter() - start, failed
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        # Open the pooled connections before timing
+        list(pool.map(timed_call, range(concurrency)))
+        start = time.perf_counter()
+        for elapsed, failed in pool.map(timed_call, range(args.requests)):
+            histogram.record(elapsed)
+            errors += failed
+    wall = time.perf_counter() - start
+    client.close()
+    return wall, histogram, errors
+
+
+async def run_async_level(
+    args: argparse.Namespace, concurrency: int, metrics: MetricsRegistry
+) -> tuple[float, LatencyHistogram, int]:
+    client = AsyncUltraApiClient(**client_kwargs(args, metrics))
+    client.base_url = args.url
+    operation = async_operation(client, args)
+    histogram = LatencyHistogram()
+    errors = 0
+    next_index = iter(range(args.requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in next_index:
+            start = time.perf_counter()
+            try:
+                failed = is_failure(await operation(i))
+            except Exception:
+                failed = True
+            histogram.record(time.perf_counter() - start)
+            errors += failed
+
+    # Open the connections before timing
+    await asyncio.gather(
+        *(operation(i) for i in range(concurrency)), return_exceptions=True
+    )
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+    await client.close()
+    return wall, histogram, errors
+
+
+def attempt_counts(metrics: MetricsRegistry) -> dict[str, int]:
+    counts = {"success": 0, "error": 0, "rate_limited": 0}
+    for endpoints in metrics.snapshot().values():
+        for endpoint in endpoints.values():
+            for outcome in counts:
+                counts[outcome] += endpoint[outcome]
+    return counts
+
+
+def run_level(args: argparse.Namespace, concurrency: int) -> dict[str, Any]:
+    metrics = MetricsRegistry()
+    if args.mode == "async":
+        wall, histogram, errors = asyncio.run(
+            run_async_level(args, concurrency, metrics)
+        )
+    else:
+        wall, histogram, errors = run_sync_level(args, concurrency, metrics)
+    return {
+        "concurrency": concurrency,
+        "operations": histogram.count,
+        "failed": errors,
+        "seconds": wall,
+        "throughput": histogram.count / wall,
+        "p50_ms": histogram.percentile(50) * 1000,
+        "p99_ms": histogram.percentile(99) * 1000,
+        "max_ms": histogram.max * 1000,
+        "attempts": attempt_counts(metrics),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mode", choices=("sync", "async"), default="async")
+    parser.add_argument("--operation", choices=OPERATIONS, default="order")
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--retries", type=int, default=1, help="Max attempts")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--impersonate", default="chrome")
+    parser.add_argument("--url", help="Use a fake server that is already running")
+    parser.add_argument("--output", help="Write results as JSON")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    args.keypair = Keypair()
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    server = None
+    if args.url is None:
+        server = server_from_arguments(args).start()
+        args.url = server.base_url
+
+    print(f"{args.mode} {args.operation} x {args.requests} against {args.url}")
+    print(
+        f"{'concurrency':>11} {'ops/s':>10} {'p50 ms':>9} {'p99 ms':>9} "
+        f"{'max ms':>9} {'failed':>7} {'429s':>6}"
+    )
+    results = []
+    try:
+        for concurrency in levels:
+            result = run_level(args, concurrency)
+            results.append(result)
+            print(
+                f"{concurrency:>11} {result['throughput']:>10.1f} "
+                f"{result['p50_ms']:>9.2f} {result['p99_ms']:>9.2f} "
+                f"{result['max_ms']:>9.2f} {result['failed']:>7} "
+                f"{result['attempts']['rate_limited']:>6}"
+            )
+    finally:
+        if server is not None:
+            server.stop()
+
+    if args.output:
+        report: dict[str, Optional[Any]] = {
+            "mode": args.mode,
+            "operation": args.operation,
+            "requests": args.requests,
+            "server": {
+                "latency": args.latency,
+                "error_rate": args.error_rate,
+                "rate_limit_rate": args.rate_limit_rate,
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
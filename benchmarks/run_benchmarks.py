@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks of the client's CPU-bound hot paths.
+
+Runs fully offline: transactions are built locally and response bodies are
+read from the recorded payloads in benchmarks/fixtures. Results are written
+as JSON so runs on different commits can be compared.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--rounds 7] [--min-time 0.2]
+        [--filter sign] [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import base58
+from bench_sign_transactions import build_unsigned_transactions
+from pydantic.alias_generators import to_camel
+from solders.solders import Keypair
+
+from jup_python_sdk.clients.jupiter_client import JupiterClient
+from jup_python_sdk.models.ultra_api.ultra_balances_response_model import (
+    UltraBalancesResponse,
+)
+from jup_python_sdk.models.ultra_api.ultra_execute_request_model import (
+    UltraExecuteRequest,
+)
+from jup_python_sdk.models.ultra_api.ultra_order_request_model import (
+    UltraOrderRequest,
+)
+from jup_python_sdk.models.ultra_api.ultra_order_response_model import (
+    UltraOrderResponse,
+)
+from jup_python_sdk.models.ultra_api.ultra_shield_response_model import (
+    UltraShieldResponse,
+)
+from jup_python_sdk.signing.signer import EnvVarSigner, KeypairSigner
+from jup_python_sdk.transport.json_codec import JsonCodec, get_codec
+
+FIXTURES = Path(__file__).parent / "fixtures"
+KEY_ENV_VAR = "JUP_BENCH_PRIVATE_KEY"
+
+
+def load_fixture(name: str) -> bytes:
+    """Read a recorded response body."""
+    return (FIXTURES / f"{name}.json").read_bytes()
+
+
+def measure(fn: Callable[[], Any], rounds: int, min_time: float) -> dict[str, Any]:
+    """
+    Time `fn` in `rounds` rounds of a calibrated number of calls.
+
+    The call count per round is doubled until one round takes at least
+    `min_time` seconds, so fast and slow cases are timed equally well.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - start >= min_time:
+            break
+        number *= 2
+
+    per_call = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        per_call.append((time.perf_counter() - start) / number * 1e9)
+
+    return {
+        "calls_per_round": number,
+        "rounds": rounds,
+        "min_ns": min(per_call),
+        "median_ns": statistics.median(per_call),
+        "mean_ns": statistics.fmean(per_call),
+        "stdev_ns": statistics.stdev(per_call) if rounds > 1 else 0.0,
+    }
+
+
+def build_cases() -> dict[str, Callable[[], Any]]:
+    """Set up every benchmark case, keyed by name."""
+    keypair = Keypair()
+    os.environ[KEY_ENV_VAR] = str(keypair)
+    key_array = json.dumps(list(bytes(keypair)))
+    client = JupiterClient(signer=KeypairSigner(keypair), api_key="bench-key")
+    [transaction] = build_unsigned_transactions(keypair, 1)
+    signed = client._sign_base64_transaction(transaction)
+    order_request = UltraOrderRequest(
+        input_mint="So11111111111111111111111111111111111111112",
+        output_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+        amount=10000000,
+        taker=str(keypair.pubkey()),
+        referral_account=str(Keypair().pubkey()),
+        referral_fee=50,
+    )
+    bodies = {name: load_fixture(name) for name in ("order", "balances", "shield")}
+
+    cases: dict[str, Callable[[], Any]] = {
+        "key_loading.base58": lambda: (
+            KeypairSigner(
+                Keypair.from_bytes(base58.b58decode(os.environ[KEY_ENV_VAR]))
+            ).pubkey
+        ),
+        "key_loading.env_var": lambda: EnvVarSigner(KEY_ENV_VAR).pubkey,
+        "key_loading.uint8_array": lambda: Keypair.from_bytes(
+            bytes(json.loads(key_array))
+        ),
+        "sign_base64_transaction": lambda: client._sign_base64_transaction(transaction),
+        "serialize_versioned_transaction": (
+            lambda: client._serialize_versioned_transaction(signed)
+        ),
+        "order_request.construct": lambda: UltraOrderRequest(
+            input_mint=order_request.input_mint,
+            output_mint=order_request.output_mint,
+            amount=order_request.amount,
+            taker=order_request.taker,
+        ),
+        "order_request.model_dump": lambda: {
+            to_camel(key): value
+            for key, value in order_request.model_dump(exclude_none=True).items()
+        },
+        "order_request.to_dict": order_request.to_dict,
+        "order_request.to_query_string": order_request.to_query_string,
+        "execute_request.construct": lambda: UltraExecuteRequest(
+            signed_transaction=transaction, request_id="request-id"
+        ),
+        "execute_request.to_dict": UltraExecuteRequest(
+            signed_transaction=transaction, request_id="request-id"
+        ).to_dict,
+        "headers.get": client._get_headers,
+        "headers.post": client._post_headers,
+    }
+
+    codecs: dict[str, JsonCodec] = {"json": get_codec("json")}
+    for name in ("orjson", "msgspec"):
+        try:
+            codecs[name] = get_codec(name)
+        except ImportError:
+            continue
+    for name, body in bodies.items():
+        for codec_name, codec in codecs.items():
+            cases[f"decode.{name}.{codec_name}"] = lambda codec=codec, body=body: (
+                codec.loads(body)
+            )
+    cases["parse.order"] = lambda: UltraOrderResponse.from_json(bodies["order"])
+    cases["parse.balances"] = lambda: UltraBalancesResponse.from_json(
+        bodies["balances"]
+    )
+    cases["parse.shield"] = lambda: UltraShieldResponse.from_json(bodies["shield"])
+    return cases
+
+
+def git_commit() -> str:
+    git = shutil.which("git")
+    if git is None:
+        return "unknown"
+    try:
+        return subprocess.run(  # noqa: S603
+            [git, "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_results(
+    results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]]
+) -> None:
+    header = f"{'case':<40} {'median':>12} {'min':>12}"
+    print(header + ("  vs baseline" if baseline else ""))
+    for name, result in results.items():
+        line = f"{name:<40} {result['median_ns']:>9.0f} ns {result['min_ns']:>9.0f} ns"
+        before = baseline.get(name)
+        if before:
+            change = result["median_ns"] / before["median_ns"] - 1
+            line += f"  {change:+8.1%}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--filter", default="", help="Only run matching cases")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, help="Earlier JSON results")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+
+    results = {}
+    for name, fn in build_cases().items():
+        if args.filter in name:
+            results[name] = measure(fn, args.rounds, args.min_time)
+
+    print_results(results, baseline)
+
+    if args.output:
+        report = {
+            "machine": {
+                "python": sys.version.split()[0],
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "processor": platform.machine(),
+            },
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,26 +5,13 @@ Advanced example: Concurrent requests with async Jupiter SDK
 
 import asyncio
 import time
-from typing import Any
 
 from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient
-
-
-async def check_token_safety(client: AsyncUltraApiClient, mint: str) -> dict[str, Any]:
-    """Check a single token for safety warnings"""
-    try:
-        response = await client.shield(mints=[mint])
-        return {
-            "mint": mint,
-            "warnings": response.get("warnings", {}).get(mint, []),
-            "success": True,
-        }
-    except Exception as e:
-        return {"mint": mint, "error": str(e), "success": False}
+from jup_python_sdk.transport.rate_limiter import RateLimiter
 
 
 async def concurrent_token_check():
-    """Check multiple tokens concurrently"""
+    """Check multiple tokens with bounded concurrency"""
 
     # Popular Solana tokens
     tokens = {
@@ -43,32 +30,31 @@ async def concurrent_token_check():
     start_time = time.time()
 
     try:
-        # Create tasks for all tokens
-        tasks = [check_token_safety(client, mint) for mint in tokens.keys()]
-
-        # Execute all requests concurrently
-        results = await asyncio.gather(*tasks)
-
-        # Process results
         print("=== Token Safety Check Results ===\n")
 
         safe_tokens = []
         warning_tokens = []
 
-        for result in results:
-            if result["success"]:
-                token_name = tokens.get(result["mint"], "Unknown")
-
-                if result["warnings"]:
-                    warning_tokens.append((token_name, result))
-                    print(f"⚠️  {token_name} ({result['mint'][:8]}...)")
-                    for warning in result["warnings"]:
+        # Two mints per request and at most 3 requests in flight; results
+        # arrive as each request completes
+        async for result in client.shield_many(
+            list(tokens), chunk_size=2, concurrency=3
+        ):
+            if not result.ok:
+                print(f"❌ Failed to check {result.item}: {result.error}")
+                continue
+
+            warnings = result.value.get("warnings", {})
+            for mint in result.item:
+                token_name = tokens.get(mint, "Unknown")
+                if warnings.get(mint):
+                    warning_tokens.append(token_name)
+                    print(f"⚠️  {token_name} ({mint[:8]}...)")
+                    for warning in warnings[mint]:
                         print(f"   - {warning.get('type')}: {warning.get('message')}")
                 else:
                     safe_tokens.append(token_name)
-                    print(f"✅ {token_name} ({result['mint'][:8]}...) - No warnings")
-            else:
-                print(f"❌ Failed to check {result['mint']}: {result.get('error')}")
+                    print(f"✅ {token_name} ({mint[:8]}...) - No warnings")
 
         # Summary
         elapsed = time.time() - start_time
@@ -77,14 +63,13 @@ async def concurrent_token_check():
         print(f"Safe tokens: {len(safe_tokens)}")
         print(f"Tokens with warnings: {len(warning_tokens)}")
         print(f"Time elapsed: {elapsed:.2f} seconds")
-        print(f"Average time per request: {elapsed / len(tokens):.3f} seconds")
 
     finally:
         await client.close()
 
 
 async def batch_balance_check():
-    """Check balances for multiple addresses concurrently"""
+    """Check balances for multiple addresses with bounded concurrency"""
 
     # Example addresses (you can replace with real ones)
     addresses = [
@@ -97,29 +82,18 @@ async def batch_balance_check():
 
     client = AsyncUltraApiClient()
 
-    async def get_balance(address: str):
-        try:
-            balance = await client.balances(address)
-            return {"address": address, "balance": balance, "success": True}
-        except Exception as e:
-            return {"address": address, "error": str(e), "success": False}
-
     try:
-        # Check all balances concurrently
-        tasks = [get_balance(addr) for addr in addresses]
-        results = await asyncio.gather(*tasks)
-
-        # Display results
-        for result in results:
-            if result["success"]:
-                print(f"Address: {result['address'][:16]}...")
-                if result["balance"]:
-                    for token, details in result["balance"].items():
-                        print(f"  {token}: {details.get('uiAmount', 0)}")
-                else:
-                    print("  No balances found")
+        async for result in client.balances_many(addresses, concurrency=2):
+            if not result.ok:
+                print(f"Failed to check {result.item}: {result.error}")
+                continue
+
+            print(f"Address: {result.item[:16]}...")
+            if result.value:
+                for token, details in result.value.items():
+                    print(f"  {token}: {details.get('uiAmount', 0)}")
             else:
-                print(f"Failed to check {result['address']}: {result['error']}")
+                print("  No balances found")
 
     finally:
         await client.close()
@@ -130,21 +104,9 @@ async def rate_limited_requests():
 
     print("\n=== Rate-Limited Concurrent Requests ===\n")
 
-    # Semaphore to limit concurrent requests
-    max_concurrent = 3
-    semaphore = asyncio.Semaphore(max_concurrent)
-
-    async def rate_limited_request(
-        client: AsyncUltraApiClient, mint: str, delay: float
-    ):
-        async with semaphore:  # Acquire semaphore
-            print(f"🔄 Checking {mint[:8]}...")
-            await asyncio.sleep(delay)  # Simulate some processing
-            result = await client.shield(mints=[mint])
-            print(f"✓ Completed {mint[:8]}...")
-            return result
-
-    client = AsyncUltraApiClient()
+    # The limiter queues requests beyond 2 per second instead of letting
+    # the API reject them; concurrency caps requests in flight
+    client = AsyncUltraApiClient(rate_limiter=RateLimiter(rate=2, burst=2))
 
     mints = [
         "So11111111111111111111111111111111111111112",
@@ -155,19 +117,15 @@ async def rate_limited_requests():
     ]
 
     try:
-        msg = (
-            f"Processing {len(mints)} requests with max {max_concurrent} concurrent..."
-        )
-        print(f"{msg}\n")
-
-        tasks = [rate_limited_request(client, mint, 0.5) for mint in mints]
+        print(f"Processing {len(mints)} requests at 2 requests per second...\n")
 
         start = time.time()
-        await asyncio.gather(*tasks)
+        async for result in client.shield_many(mints, chunk_size=1, concurrency=3):
+            status = "✓" if result.ok else "❌"
+            print(f"{status} Completed {result.item[0][:8]}...")
         elapsed = time.time() - start
 
         print(f"\nCompleted in {elapsed:.2f} seconds")
-        print(f"(Would take {len(mints) * 0.5:.2f} seconds sequentially)")
 
     finally:
         await client.close()
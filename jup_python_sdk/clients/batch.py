@@ -0,0 +1,346 @@
+import asyncio
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Generic, Optional, TypeVar, Union
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+Stage = tuple[Callable[[Any], Awaitable[Any]], int]
+
+
+class BatchResult(Generic[ItemT, ResultT]):
+    """
+    Outcome of one item in a batch call: either a value or the exception
+    the call raised.
+    """
+
+    __slots__ = ("index", "item", "value", "error")
+
+    def __init__(
+        self,
+        index: int,
+        item: ItemT,
+        value: Optional[ResultT] = None,
+        error: Optional[BaseException] = None,
+    ):
+        """
+        Initialize the batch result.
+
+        Args:
+            index: Position of the item in the input.
+            item: The input item, e.g. a wallet address.
+            value: The call's return value, if it succeeded.
+            error: The exception raised by the call, if it failed.
+        """
+        self.index = index
+        self.item = item
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> ResultT:
+        """
+        Get the value, re-raising the call's exception if it failed.
+
+        Returns:
+            The call's return value.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error else f"value={self.value!r}"
+        return f"BatchResult(index={self.index}, item={self.item!r}, {outcome})"
+
+
+def chunked(items: Sequence[ItemT], size: int) -> list[list[ItemT]]:
+    """
+    Split a sequence into lists of at most `size` items.
+
+    Args:
+        items: The items to split.
+        size: Maximum chunk length.
+
+    Returns:
+        The chunks, in order.
+
+    Raises:
+        ValueError: If `size` is less than 1.
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    return [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+
+async def run_bounded(
+    items: Iterable[ItemT],
+    call: Callable[[ItemT], Awaitable[ResultT]],
+    concurrency: int,
+) -> AsyncIterator[BatchResult[ItemT, ResultT]]:
+    """
+    Call `call` for every item with at most `concurrency` calls in flight,
+    yielding results as they complete.
+
+    Items are pulled from `items` lazily, and workers wait for the consumer
+    to take finished results before starting new calls, so a slow consumer
+    slows the batch down instead of buffering unbounded results. Leaving
+    the iteration early cancels the calls still in flight.
+
+    Args:
+        items: Inputs for `call`; may be a lazy iterable.
+        call: Coroutine function to run for each item.
+        concurrency: Maximum number of calls in flight.
+
+    Yields:
+        One BatchResult per item, in completion order.
+
+    Raises:
+        ValueError: If `concurrency` is less than 1.
+        Exception: Whatever iterating `items` raised, after the items
+            taken before it have been yielded.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    pending = enumerate(items)
+    iteration_error: Optional[Exception] = None
+    results: asyncio.Queue[Optional[BatchResult[ItemT, ResultT]]] = asyncio.Queue(
+        maxsize=concurrency
+    )
+
+    async def worker() -> None:
+        nonlocal iteration_error
+        # The iterator is shared; next() never yields to the loop, so each
+        # item is taken by exactly one worker
+        try:
+            for index, item in pending:
+                result: BatchResult[ItemT, ResultT]
+                try:
+                    result = BatchResult(index, item, value=await call(item))
+                except Exception as e:
+                    result = BatchResult(index, item, error=e)
+                await results.put(result)
+        except Exception as e:
+            # Finish the calls already started, then re-raise to the consumer
+            iteration_error = e
+        await results.put(None)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    try:
+        running = len(workers)
+        while running:
+            result = await results.get()
+            if result is None:
+                running -= 1
+            else:
+                yield result
+        if iteration_error is not None:
+            raise iteration_error
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def run_bounded_threads(
+    items: Iterable[ItemT],
+    call: Callable[[ItemT], ResultT],
+    concurrency: int,
+    executor: Optional[Executor] = None,
+) -> Iterator[BatchResult[ItemT, ResultT]]:
+    """
+    Call `call` for every item on a thread pool with at most `concurrency`
+    calls in flight, yielding results as they complete.
+
+    A new call is only submitted when a finished result is handed to the
+    consumer, so a slow consumer slows the batch down. Leaving the
+    iteration early cancels calls that have not started yet.
+
+    Args:
+        items: Inputs for `call`; may be a lazy iterable.
+        call: Function to run for each item.
+        concurrency: Maximum number of calls in flight.
+        executor: Optional executor to run calls on. If omitted, a thread
+            pool with `concurrency` workers is created for the batch.
+
+    Yields:
+        One BatchResult per item, in completion order.
+
+    Raises:
+        ValueError: If `concurrency` is less than 1.
+        Exception: Whatever iterating `items` raised, after the items
+            taken before it have been yielded.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    pool = executor or ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="jup-batch"
+    )
+    pending_items = enumerate(items)
+    in_flight: dict[Future[ResultT], tuple[int, ItemT]] = {}
+    iteration_error: Optional[Exception] = None
+
+    def submit_next() -> None:
+        nonlocal iteration_error
+        if iteration_error is not None:
+            return
+        try:
+            for index, item in pending_items:
+                in_flight[pool.submit(call, item)] = (index, item)
+                return
+        except Exception as e:
+            # Finish the calls already started, then re-raise to the consumer
+            iteration_error = e
+
+    try:
+        for _ in range(concurrency):
+            submit_next()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = in_flight.pop(future)
+                submit_next()
+                error = future.exception()
+                if error is None:
+                    yield BatchResult(index, item, value=future.result())
+                else:
+                    yield BatchResult(index, item, error=error)
+        if iteration_error is not None:
+            raise iteration_error
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=True)
+
+
+async def run_pipeline(
+    items: Union[Iterable[ItemT], AsyncIterable[ItemT]],
+    stages: Sequence[Stage],
+    queue_depth: int,
+) -> AsyncIterator[BatchResult[ItemT, Any]]:
+    """
+    Pass every item through a chain of stages, each with its own workers,
+    yielding results as they leave the last stage.
+
+    Stages run concurrently on different items, so e.g. one item can be
+    signed while the next is being fetched. Each stage reads from a queue
+    holding at most `queue_depth` items; when a later stage or the consumer
+    falls behind, the queues fill up and earlier stages wait. An item whose
+    stage raises skips the remaining stages and is yielded with `error`
+    set. Leaving the iteration early cancels all stages.
+
+    Args:
+        items: Inputs for the first stage; may be a lazy or async iterable.
+        stages: (call, concurrency) pairs. Each call is a coroutine function
+            taking the previous stage's output.
+        queue_depth: Maximum number of items waiting before each stage and
+            before the consumer.
+
+    Yields:
+        One BatchResult per item, holding the last stage's output, in
+        completion order.
+
+    Raises:
+        ValueError: If there are no stages, or a concurrency or
+            `queue_depth` is less than 1.
+        Exception: Whatever iterating `items` raised, after the items
+            taken before it have been yielded.
+    """
+    if not stages:
+        raise ValueError("at least one stage is required")
+    if queue_depth < 1 or any(concurrency < 1 for _, concurrency in stages):
+        raise ValueError("concurrency and queue_depth must be at least 1")
+
+    queues: list[asyncio.Queue[Optional[BatchResult[ItemT, Any]]]] = [
+        asyncio.Queue(maxsize=queue_depth) for _ in range(len(stages) + 1)
+    ]
+
+    feed_error: Optional[Exception] = None
+
+    async def feed() -> None:
+        nonlocal feed_error
+        index = 0
+        try:
+            if isinstance(items, AsyncIterable):
+                async for item in items:
+                    await queues[0].put(BatchResult(index, item, value=item))
+                    index += 1
+            else:
+                for item in items:
+                    await queues[0].put(BatchResult(index, item, value=item))
+                    index += 1
+        except Exception as e:
+            # Finish the items already fed, then re-raise to the consumer
+            feed_error = e
+
+    async def work(
+        call: Callable[[Any], Awaitable[Any]],
+        source: asyncio.Queue[Optional[BatchResult[ItemT, Any]]],
+        sink: asyncio.Queue[Optional[BatchResult[ItemT, Any]]],
+    ) -> None:
+        while True:
+            result = await source.get()
+            if result is None:
+                return
+            if result.error is None:
+                try:
+                    result.value = await call(result.value)
+                except Exception as e:
+                    result.value, result.error = None, e
+            await sink.put(result)
+
+    async def run_stage(
+        producers: Sequence["asyncio.Future[None]"],
+        sink: asyncio.Queue[Optional[BatchResult[ItemT, Any]]],
+        consumers: int,
+    ) -> None:
+        # Close the next stage once everything feeding it has finished
+        await asyncio.gather(*producers)
+        for _ in range(consumers):
+            await sink.put(None)
+
+    tasks: list[asyncio.Future[None]] = []
+    producers: list[asyncio.Future[None]] = [asyncio.ensure_future(feed())]
+    tasks.extend(producers)
+    for position, (call, concurrency) in enumerate(stages):
+        source, sink = queues[position], queues[position + 1]
+        tasks.append(asyncio.ensure_future(run_stage(producers, source, concurrency)))
+        producers = [
+            asyncio.ensure_future(work(call, source, sink)) for _ in range(concurrency)
+        ]
+        tasks.extend(producers)
+    tasks.append(asyncio.ensure_future(run_stage(producers, queues[-1], 1)))
+
+    try:
+        while True:
+            result = await queues[-1].get()
+            if result is None:
+                break
+            yield result
+        if feed_error is not None:
+            raise feed_error
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
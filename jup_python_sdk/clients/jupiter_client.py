@@ -1,11 +1,78 @@
+import asyncio
 import base64
+import functools
 import json
-import os
-from typing import Any, Optional
+import logging
+import threading
+import time
+from collections.abc import Hashable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Optional, TypeVar, Union
 
-import base58
 from curl_cffi import AsyncSession, requests
-from solders.solders import Keypair, VersionedTransaction
+from curl_cffi.requests.exceptions import RequestException
+from solders.solders import VersionedTransaction
+
+from jup_python_sdk.signing.signer import EnvVarSigner, Signer
+from jup_python_sdk.signing.transaction_signing import (
+    sign_base64_transaction,
+    sign_base64_transactions,
+    sign_versioned_transaction,
+)
+from jup_python_sdk.transport.connection_options import ConnectionOptions
+from jup_python_sdk.transport.deadline import Deadline
+from jup_python_sdk.transport.interceptors import (
+    AsyncHandler,
+    AsyncInterceptor,
+    Handler,
+    Interceptor,
+    RequestCall,
+    build_async_chain,
+    build_chain,
+)
+from jup_python_sdk.transport.json_codec import JsonCodec, get_codec
+from jup_python_sdk.transport.metrics import MetricsRegistry
+from jup_python_sdk.transport.rate_limiter import RateLimiter
+from jup_python_sdk.transport.request_timing import (
+    TIMING_INFOS,
+    RequestTiming,
+    TimingRecorder,
+)
+from jup_python_sdk.transport.retry_policy import RetryPolicy
+from jup_python_sdk.transport.session_pool import SessionPool
+from jup_python_sdk.transport.single_flight import (
+    AsyncSingleFlight,
+    SingleFlight,
+    request_key,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_KEEPALIVE_INTERVAL = 20.0
+
+
+def _load_signing_keys(signer: Signer) -> None:
+    """Resolve and cache a signer's keys."""
+    _ = signer.signing_keys
+
+
+def _attempt_timeout(deadline: Deadline, timeout: Any) -> Any:
+    """
+    Cap a curl_cffi timeout, a number of seconds or a (connect, read) pair,
+    at the time left before `deadline`. A None timeout means no limit.
+    """
+    if isinstance(timeout, tuple):
+        return tuple(deadline.timeout(part) for part in timeout)
+    return deadline.timeout(timeout)
+
+
+def _decode_body(content: bytes, codec: Optional[JsonCodec]) -> Any:
+    """Decode a JSON body. Module-level so process pools can pickle it."""
+    if codec is None:
+        return json.loads(content)
+    return codec.loads(content)
 
 
 class _CoreJupiterClient:
@@ -14,7 +81,15 @@ class _CoreJupiterClient:
     Handles private key loading and transaction signing.
     """
 
-    def __init__(self, api_key: Optional[str], private_key_env_var: str):
+    def __init__(
+        self,
+        api_key: Optional[str],
+        private_key_env_var: str,
+        signer: Optional[Signer] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_codec: Union[JsonCodec, str, None] = None,
+    ):
         """
         Initialize the core Jupiter client.
 
@@ -23,10 +98,26 @@ class _CoreJupiterClient:
                 If provided, uses https://api.jup.ag endpoint.
             private_key_env_var: Name of environment variable containing the
                 private key. Defaults to 'PRIVATE_KEY'.
+            signer: Optional signer providing the wallet keypair. If omitted,
+                the key is read from `private_key_env_var` on first use and
+                cached.
+            retry_policy: Optional retry policy for failed requests. If
+                omitted, requests are not retried.
+            rate_limiter: Optional client-side rate limiter. If omitted,
+                requests are sent as soon as they are made.
+            json_codec: Optional JsonCodec, or a codec name for get_codec(),
+                used to encode request bodies and decode responses. If
+                omitted, curl_cffi's standard library JSON handling is used.
         """
         self.api_key = api_key
         self.base_url = "https://api.jup.ag" if api_key else "https://lite-api.jup.ag"
         self.private_key_env_var = private_key_env_var
+        self.signer = signer or EnvVarSigner(private_key_env_var)
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.json_codec = (
+            get_codec(json_codec) if isinstance(json_codec, str) else json_codec
+        )
 
     def _get_headers(self) -> dict[str, str]:
         """
@@ -57,36 +148,42 @@ class _CoreJupiterClient:
             headers["x-api-key"] = self.api_key
         return headers
 
-    def _load_private_key_bytes(self) -> bytes:
-        """Loads the private key from the environment
-        variable as base58 or uint8 array."""
-        pk_raw = os.getenv(self.private_key_env_var, "")
-        pk_raw = pk_raw.strip()
-        if pk_raw.startswith("[") and pk_raw.endswith("]"):
-            try:
-                arr = json.loads(pk_raw)
-                if isinstance(arr, list) and all(
-                    isinstance(x, int) and 0 <= x <= 255 for x in arr
-                ):
-                    return bytes(arr)
-                else:
-                    raise ValueError
-            except Exception as e:
-                raise ValueError(f"Invalid uint8-array private key format: {e}") from e
-        try:
-            return base58.b58decode(pk_raw)
-        except Exception as e:
-            raise ValueError(f"Invalid base58 private key format: {e}") from e
+    def _json_body(self, payload: Any) -> dict[str, Any]:
+        """
+        Build the request kwargs for a JSON body.
+
+        Args:
+            payload: The value to send as JSON.
+
+        Returns:
+            Dict with the encoded body and headers for `_request`.
+        """
+        if self.json_codec is None:
+            return {"json": payload, "headers": self._get_headers()}
+        return {"data": self.json_codec.dumps(payload), "headers": self._post_headers()}
+
+    def _decode_response(self, response: requests.Response) -> Any:
+        """
+        Decode a JSON response body with the configured codec.
+
+        Args:
+            response: The HTTP response.
+
+        Returns:
+            The decoded JSON value.
+        """
+        if self.json_codec is None:
+            return response.json()  # type: ignore[no-untyped-call]
+        return self.json_codec.loads(response.content)
 
     def get_public_key(self) -> str:
         """
-        Get the public key from the loaded private key.
+        Get the public key of the configured signer.
 
         Returns:
             Public key as a base58-encoded string.
         """
-        wallet = Keypair.from_bytes(self._load_private_key_bytes())
-        return str(wallet.pubkey())
+        return self.signer.pubkey_str
 
     async def get_public_key_async(self) -> str:
         """
@@ -115,7 +212,7 @@ class _CoreJupiterClient:
         self, versioned_transaction: VersionedTransaction
     ) -> VersionedTransaction:
         """
-        Sign a VersionedTransaction with the loaded private key.
+        Sign a VersionedTransaction with the signer's keypairs.
 
         Args:
             versioned_transaction: VersionedTransaction to sign.
@@ -123,16 +220,48 @@ class _CoreJupiterClient:
         Returns:
             Signed VersionedTransaction with signature applied.
         """
-        wallet = Keypair.from_bytes(self._load_private_key_bytes())
-        account_keys = versioned_transaction.message.account_keys
-        wallet_index = account_keys.index(wallet.pubkey())
+        return sign_versioned_transaction(
+            versioned_transaction, self.signer.signing_keys
+        )
+
+    def sign_transaction(self, transaction_base64: str) -> str:
+        """
+        Sign a base64-encoded transaction and return it base64-encoded.
+
+        Writes the signature straight into the transaction bytes instead of
+        rebuilding the transaction, falling back to solders if the layout
+        is not recognised.
+
+        Args:
+            transaction_base64: Base64-encoded unsigned transaction, e.g. the
+                `transaction` field of an Ultra order response.
+
+        Returns:
+            Base64-encoded signed transaction.
+        """
+        return sign_base64_transaction(transaction_base64, self.signer.signing_keys)
+
+    def sign_transactions(
+        self,
+        transactions: Sequence[str],
+        executor: Optional[Executor] = None,
+        chunk_size: int = 64,
+    ) -> list[str]:
+        """
+        Sign a batch of base64-encoded transactions in one call.
 
-        signers = list(versioned_transaction.signatures)
-        signers[wallet_index] = wallet  # type: ignore
+        Args:
+            transactions: Base64-encoded unsigned transactions, e.g. the
+                `transaction` field of several Ultra order responses.
+            executor: Optional ThreadPoolExecutor or ProcessPoolExecutor to
+                fan large batches out over. Signing runs inline if omitted.
+            chunk_size: Number of transactions per executor task.
 
-        return VersionedTransaction(
-            versioned_transaction.message,
-            signers,  # type: ignore
+        Returns:
+            Base64-encoded signed transactions, in input order.
+        """
+        return sign_base64_transactions(
+            transactions, self.signer.signing_keys, executor, chunk_size
         )
 
     def _serialize_versioned_transaction(
@@ -161,6 +290,16 @@ class JupiterClient(_CoreJupiterClient):
         api_key: Optional[str] = None,
         private_key_env_var: str = "PRIVATE_KEY",
         client_kwargs: Optional[dict[str, Any]] = None,
+        signer: Optional[Signer] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        json_codec: Union[JsonCodec, str, None] = None,
+        pool_size: Optional[int] = None,
+        single_flight: bool = False,
+        timing_recorder: Optional[TimingRecorder] = None,
+        interceptors: Optional[Sequence[Interceptor]] = None,
+        metrics: Optional[MetricsRegistry] = None,
     ):
         """
         Initialize the synchronous Jupiter client.
@@ -171,13 +310,402 @@ class JupiterClient(_CoreJupiterClient):
                 private key.
             client_kwargs: Optional kwargs to pass to curl_cffi Session.
                 Common options include 'proxies', 'timeout', 'impersonate'.
+            signer: Optional signer providing the wallet keypair, e.g. a
+                KeypairSigner or FileSigner, or a Keyring to sign for many
+                wallets. Defaults to reading `private_key_env_var`.
+            retry_policy: Optional RetryPolicy applying backoff, Retry-After
+                and per-endpoint idempotency rules to failed requests.
+            rate_limiter: Optional RateLimiter, shareable between clients,
+                e.g. RateLimiter.for_api_key(api_key).
+            connection_options: Optional ConnectionOptions selecting the
+                HTTP version, connection limits and TCP keep-alive.
+            json_codec: Optional JsonCodec or codec name, e.g. "auto" to use
+                orjson or msgspec when installed.
+            pool_size: If set, requests check out one of up to `pool_size`
+                pooled sessions, so threads share warm connections instead
+                of each opening its own. Use this when calling the client
+                from many threads.
+            single_flight: If True, identical idempotent GET requests made
+                concurrently from several threads share one HTTP request
+                and its response.
+            timing_recorder: Optional TimingRecorder receiving a DNS,
+                connect, TLS, server and transfer time breakdown of every
+                request. Timing info is only collected when this is set.
+            interceptors: Optional Interceptors wrapped around every API
+                call, first one outermost, e.g. for caching, metrics or
+                request rewriting.
+            metrics: Optional MetricsRegistry recording the latency and
+                outcome of every HTTP attempt, retries included.
         """
-        super().__init__(api_key, private_key_env_var)
+        super().__init__(
+            api_key,
+            private_key_env_var,
+            signer,
+            retry_policy,
+            rate_limiter,
+            json_codec,
+        )
         kwargs = client_kwargs or {}
         # Use realworld random browser impersonation based on market share
         # if not specified
         kwargs.setdefault("impersonate", "realworld")
-        self.client = requests.Session(**kwargs)
+        if connection_options is not None:
+            kwargs = connection_options.apply(kwargs)
+        if timing_recorder is not None:
+            kwargs.setdefault("curl_infos", TIMING_INFOS)
+        self.timing_recorder = timing_recorder
+        self.metrics = metrics
+        self.interceptors: list[Interceptor] = []
+        self._chain: Optional[Handler] = None
+        for interceptor in interceptors or ():
+            self.add_interceptor(interceptor)
+        self.connection_options = connection_options
+        self._session_kwargs = kwargs
+        self._client: Optional[requests.Session[Any]] = None
+        self.session_pool: Optional[SessionPool] = None
+        if pool_size is None:
+            self._session_timeout = self.client.timeout
+        else:
+            self.session_pool = SessionPool(
+                pool_size,
+                lambda: requests.Session(use_thread_local_curl=False, **kwargs),
+            )
+            # The first pooled session is created now to learn its timeout
+            with self.session_pool.session() as session:
+                self._session_timeout = session.timeout
+        self.single_flight: Optional[SingleFlight[requests.Response]] = (
+            SingleFlight() if single_flight else None
+        )
+        self._last_used = 0.0
+        self._keepalive_thread: Optional[threading.Thread] = None
+        self._keepalive_stop = threading.Event()
+        # Serializes the keep-alive thread with the thread whose connection
+        # it keeps warm; the two share one curl handle.
+        self._keepalive_lock: Optional[threading.Lock] = None
+        self._keepalive_owner: Optional[int] = None
+
+    @property
+    def client(self) -> requests.Session[Any]:
+        """
+        The HTTP session used when there is no session pool.
+
+        Created on first use, so a pooled client does not hold an unused
+        session.
+        """
+        client = self._client
+        if client is None:
+            client = self._client = requests.Session(**self._session_kwargs)
+        return client
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a single HTTP request on the session."""
+        self._last_used = time.monotonic()
+        lock = self._keepalive_lock
+        if lock is not None and self._keepalive_owner == threading.get_ident():
+            with lock:
+                return self._dispatch(method, url, kwargs)
+        return self._dispatch(method, url, kwargs)
+
+    def _dispatch(
+        self, method: str, url: str, kwargs: dict[str, Any]
+    ) -> requests.Response:
+        pool = self.session_pool
+        if pool is None:
+            return self._dispatch_on(self.client, method, url, kwargs)
+        with pool.session() as session:
+            return self._dispatch_on(session, method, url, kwargs)
+
+    @staticmethod
+    def _dispatch_on(
+        session: requests.Session[Any],
+        method: str,
+        url: str,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        response: requests.Response
+        if method == "POST":
+            response = session.post(url, **kwargs)
+        elif method == "HEAD":
+            response = session.head(url, **kwargs)
+        else:
+            response = session.get(url, **kwargs)
+        return response
+
+    def _request(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send a request through the interceptor chain, retrying according
+        to the retry policy.
+
+        Args:
+            endpoint: Endpoint name used for retry rules, e.g. "order".
+            method: HTTP method, "GET" or "POST".
+            url: Request URL.
+            deadline: Optional deadline; each attempt's timeout is capped by
+                the time left, and no retry is scheduled past it.
+            **kwargs: Keyword arguments for the curl_cffi request.
+
+        Returns:
+            The successful response.
+
+        Raises:
+            HTTPError: If the final attempt returned an error status.
+            RequestException: If the final attempt failed in transport.
+            DeadlineExceeded: If `deadline` passed before an attempt.
+        """
+        chain = self._chain
+        if chain is None:
+            return self._send_with_retries(endpoint, method, url, deadline, kwargs)
+        return chain(RequestCall(endpoint, method, url, kwargs, deadline))
+
+    def _proceed(self, call: RequestCall) -> requests.Response:
+        """Innermost interceptor step: send the call with retries."""
+        return self._send_with_retries(
+            call.endpoint, call.method, call.url, call.deadline, call.kwargs
+        )
+
+    def _send_with_retries(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline],
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """Send a request, retrying according to the retry policy."""
+        policy = self.retry_policy
+        if policy is not None:
+            policy.budget.record_request()
+
+        attempt = 1
+        while True:
+            if deadline is not None:
+                # Never let the deadline lengthen the per-call or session timeout
+                kwargs["timeout"] = _attempt_timeout(
+                    deadline, kwargs.get("timeout", self._session_timeout)
+                )
+            try:
+                return self._attempt(endpoint, method, url, kwargs)
+            except RequestException as e:
+                if policy is None:
+                    raise
+                headers = getattr(e.response, "headers", None)
+                delay = policy.next_delay(endpoint, attempt, e, headers)
+                if delay is None:
+                    raise
+                if deadline is not None and delay >= deadline.remaining():
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def add_interceptor(self, interceptor: Interceptor) -> None:
+        """
+        Append an interceptor, innermost of those added so far.
+
+        Args:
+            interceptor: The interceptor to add.
+        """
+        self.interceptors.append(interceptor)
+        self._chain = build_chain(self.interceptors, self._proceed)
+
+    def _request_shared(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        share_key: Hashable = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send an idempotent request, sharing it with identical requests in
+        flight when single-flight is enabled.
+
+        Args:
+            endpoint: Endpoint name used for retry rules, e.g. "balances".
+            method: HTTP method, "GET".
+            url: Request URL.
+            share_key: Extra value that must also match for a request in
+                flight to be shared, e.g. a cache generation.
+            **kwargs: Keyword arguments for the curl_cffi request.
+
+        Returns:
+            The successful response, possibly shared with other callers.
+        """
+        group = self.single_flight
+        if group is None:
+            return self._request(endpoint, method, url, **kwargs)
+        return group.do(
+            (request_key(method, url, kwargs.get("params")), share_key),
+            lambda: self._request(endpoint, method, url, **kwargs),
+        )
+
+    def _attempt(
+        self, endpoint: str, method: str, url: str, kwargs: dict[str, Any]
+    ) -> requests.Response:
+        """Make a single rate-limited attempt and raise on HTTP errors."""
+        limiter = self.rate_limiter
+        if limiter is not None:
+            limiter.acquire_sync(endpoint)
+        if self.metrics is None:
+            response = self._send(method, url, **kwargs)
+        else:
+            response = self._send_measured(self.metrics, endpoint, method, url, kwargs)
+        if limiter is not None:
+            limiter.update_from_headers(response.headers, response.status_code)
+        if self.timing_recorder is not None:
+            self.timing_recorder.record_request(
+                RequestTiming.from_response(endpoint, response)
+            )
+        response.raise_for_status()  # type: ignore[no-untyped-call]
+        return response
+
+    def _send_measured(
+        self,
+        metrics: MetricsRegistry,
+        endpoint: str,
+        method: str,
+        url: str,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """Send a request and record its latency and outcome."""
+        start = time.perf_counter()
+        try:
+            response = self._send(method, url, **kwargs)
+        except Exception:
+            metrics.record(endpoint, url, time.perf_counter() - start, None)
+            raise
+        metrics.record(endpoint, url, time.perf_counter() - start, response.status_code)
+        return response
+
+    def warmup(self, connections: int = 1) -> None:
+        """
+        Open connections to the API host ahead of the first trade.
+
+        Sends HEAD requests so DNS resolution and the TCP/TLS handshakes
+        are done before `order` is called. Without a session pool the
+        connection belongs to the calling thread, so call this from the
+        thread that will trade.
+
+        Args:
+            connections: Number of pooled sessions to warm up. Ignored
+                without a session pool.
+
+        Raises:
+            RequestException: If the host cannot be reached.
+        """
+        headers = self._get_headers()
+        pool = self.session_pool
+        if pool is None:
+            self._send("HEAD", self.base_url, headers=headers)
+            return
+
+        # Hold the sessions together so each request uses a different one
+        sessions = [pool.acquire() for _ in range(min(connections, pool.size))]
+        try:
+            for session in sessions:
+                session.head(self.base_url, headers=headers)
+        finally:
+            for session in sessions:
+                pool.release(session)
+        self._last_used = time.monotonic()
+
+    def start_keepalive(self, interval: float = DEFAULT_KEEPALIVE_INTERVAL) -> None:
+        """
+        Keep connections warm with a background thread that pings the API
+        host whenever the client has been idle for `interval` seconds.
+
+        With a session pool, every idle pooled session is pinged. Without
+        one, the pings reuse the calling thread's connection, so a request
+        made from that thread while a ping is in flight waits for it to
+        finish; other threads are not affected.
+
+        Args:
+            interval: Idle time in seconds before a ping is sent. Keep it
+                below the server's idle timeout (usually 60 seconds).
+        """
+        if self._keepalive_thread is not None:
+            return
+        ping: Callable[[], None]
+        if self.session_pool is not None:
+            ping = self._ping_pool
+        else:
+            # A second session sharing this thread's curl handle, and so
+            # its connection cache
+            session = requests.Session(
+                curl=self.client.curl,
+                use_thread_local_curl=False,
+                **self._session_kwargs,
+            )
+            lock = threading.Lock()
+            self._keepalive_lock = lock
+            self._keepalive_owner = threading.get_ident()
+            ping = functools.partial(self._ping_shared, session, lock)
+        self._keepalive_stop.clear()
+        self._last_used = time.monotonic()
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive_loop,
+            args=(ping, interval),
+            name="jup-keepalive",
+            daemon=True,
+        )
+        self._keepalive_thread.start()
+
+    def _keepalive_loop(self, ping: Callable[[], None], interval: float) -> None:
+        while not self._keepalive_stop.wait(interval / 2):
+            if time.monotonic() - self._last_used < interval:
+                continue
+            ping()
+            self._last_used = time.monotonic()
+
+    def _ping(self, session: requests.Session[Any]) -> None:
+        try:
+            session.head(self.base_url, headers=self._get_headers())
+        except RequestException as e:
+            logger.debug("Keep-alive ping failed: %s", e)
+
+    def _ping_shared(
+        self, session: requests.Session[Any], lock: threading.Lock
+    ) -> None:
+        # Never hold up a real request; try again on the next tick
+        if lock.acquire(blocking=False):
+            try:
+                self._ping(session)
+            finally:
+                lock.release()
+
+    def _ping_pool(self) -> None:
+        pool = self.session_pool
+        if pool is None:
+            return
+        sessions = []
+        while True:
+            session = pool.try_acquire()
+            if session is None:
+                break
+            sessions.append(session)
+        try:
+            for session in sessions:
+                self._ping(session)
+        finally:
+            for session in sessions:
+                pool.release(session)
+
+    def stop_keepalive(self) -> None:
+        """Stop the background keep-alive started by start_keepalive()."""
+        thread = self._keepalive_thread
+        if thread is None:
+            return
+        self._keepalive_stop.set()
+        thread.join()
+        self._keepalive_thread = None
+        self._keepalive_lock = None
+        self._keepalive_owner = None
 
     def close(self) -> None:
         """
@@ -185,7 +713,11 @@ class JupiterClient(_CoreJupiterClient):
 
         Always call this method when done to properly cleanup resources.
         """
-        self.client.close()
+        self.stop_keepalive()
+        if self._client is not None:
+            self._client.close()
+        if self.session_pool is not None:
+            self.session_pool.close()
 
 
 class AsyncJupiterClient(_CoreJupiterClient):
@@ -199,6 +731,18 @@ class AsyncJupiterClient(_CoreJupiterClient):
         api_key: Optional[str] = None,
         private_key_env_var: str = "PRIVATE_KEY",
         client_kwargs: Optional[dict[str, Any]] = None,
+        signer: Optional[Signer] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        json_codec: Union[JsonCodec, str, None] = None,
+        cpu_executor: Optional[Executor] = None,
+        offload_threshold: int = 1024,
+        blocking_warn_ms: Optional[float] = None,
+        single_flight: bool = False,
+        timing_recorder: Optional[TimingRecorder] = None,
+        interceptors: Optional[Sequence[AsyncInterceptor]] = None,
+        metrics: Optional[MetricsRegistry] = None,
     ):
         """
         Initialize the asynchronous Jupiter client.
@@ -209,13 +753,317 @@ class AsyncJupiterClient(_CoreJupiterClient):
                 private key.
             client_kwargs: Optional kwargs to pass to curl_cffi AsyncSession.
                 Common options include 'proxies', 'timeout', 'impersonate'.
+            signer: Optional signer providing the wallet keypair, e.g. a
+                KeypairSigner or FileSigner, or a Keyring to sign for many
+                wallets. Defaults to reading `private_key_env_var`.
+            retry_policy: Optional RetryPolicy applying backoff, Retry-After
+                and per-endpoint idempotency rules to failed requests.
+            rate_limiter: Optional RateLimiter, shareable between clients,
+                e.g. RateLimiter.for_api_key(api_key).
+            connection_options: Optional ConnectionOptions selecting the
+                HTTP version, connection limits and TCP keep-alive.
+            json_codec: Optional JsonCodec or codec name, e.g. "auto" to use
+                orjson or msgspec when installed.
+            cpu_executor: Optional ThreadPoolExecutor or ProcessPoolExecutor
+                for CPU-bound steps (key loading, transaction signing, JSON
+                decoding of large responses). If omitted, these run inline
+                on the event loop. Key loading fills the signer's cache, so
+                with a process pool it runs on the loop's default thread
+                pool instead.
+            offload_threshold: Payload size in bytes below which CPU-bound
+                work stays inline even when `cpu_executor` is set, because
+                the executor hand-off would cost more than the work itself.
+            blocking_warn_ms: If set, log a warning whenever an inline SDK
+                step blocks the event loop for longer than this many
+                milliseconds.
+            single_flight: If True, identical idempotent GET requests made
+                concurrently from several tasks share one HTTP request and
+                its response.
+            timing_recorder: Optional TimingRecorder receiving a DNS,
+                connect, TLS, server and transfer time breakdown of every
+                request. Timing info is only collected when this is set.
+            interceptors: Optional AsyncInterceptors wrapped around every
+                API call, first one outermost, e.g. for caching, metrics or
+                request rewriting.
+            metrics: Optional MetricsRegistry recording the latency and
+                outcome of every HTTP attempt, retries included.
         """
-        super().__init__(api_key, private_key_env_var)
+        super().__init__(
+            api_key,
+            private_key_env_var,
+            signer,
+            retry_policy,
+            rate_limiter,
+            json_codec,
+        )
         kwargs = client_kwargs or {}
         # Use realworld random browser impersonation based on market share
         # if not specified
         kwargs.setdefault("impersonate", "realworld")
+        if connection_options is not None:
+            kwargs = connection_options.apply(kwargs, is_async=True)
+        if timing_recorder is not None:
+            kwargs.setdefault("curl_infos", TIMING_INFOS)
+        self.timing_recorder = timing_recorder
+        self.metrics = metrics
+        self.interceptors: list[AsyncInterceptor] = []
+        self._chain: Optional[AsyncHandler] = None
+        for interceptor in interceptors or ():
+            self.add_interceptor(interceptor)
+        self.connection_options = connection_options
         self.client = AsyncSession(**kwargs)
+        self._session_timeout = self.client.timeout
+        self._pool_configured = (
+            connection_options is None or not connection_options.multi_options()
+        )
+        self._last_used = 0.0
+        self._keepalive_task: Optional[asyncio.Task[None]] = None
+        self.cpu_executor = cpu_executor
+        self.offload_threshold = offload_threshold
+        self.blocking_warn_ms = blocking_warn_ms
+        self._signer_loaded = False
+        self.single_flight: Optional[AsyncSingleFlight[requests.Response]] = (
+            AsyncSingleFlight() if single_flight else None
+        )
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a single HTTP request on the session."""
+        if not self._pool_configured:
+            self._configure_pool()
+        self._last_used = time.monotonic()
+        response: requests.Response
+        if method == "POST":
+            response = await self.client.post(url, **kwargs)
+        elif method == "HEAD":
+            response = await self.client.head(url, **kwargs)
+        else:
+            response = await self.client.get(url, **kwargs)
+        return response
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send a request through the interceptor chain, retrying according
+        to the retry policy.
+
+        Args:
+            endpoint: Endpoint name used for retry rules, e.g. "order".
+            method: HTTP method, "GET" or "POST".
+            url: Request URL.
+            deadline: Optional deadline; each attempt's timeout is capped by
+                the time left, and no retry is scheduled past it.
+            **kwargs: Keyword arguments for the curl_cffi request.
+
+        Returns:
+            The successful response.
+
+        Raises:
+            HTTPError: If the final attempt returned an error status.
+            RequestException: If the final attempt failed in transport.
+            DeadlineExceeded: If `deadline` passed before an attempt.
+        """
+        chain = self._chain
+        if chain is None:
+            return await self._send_with_retries(
+                endpoint, method, url, deadline, kwargs
+            )
+        return await chain(RequestCall(endpoint, method, url, kwargs, deadline))
+
+    async def _proceed(self, call: RequestCall) -> requests.Response:
+        """Innermost interceptor step: send the call with retries."""
+        return await self._send_with_retries(
+            call.endpoint, call.method, call.url, call.deadline, call.kwargs
+        )
+
+    async def _send_with_retries(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline],
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """Send a request, retrying according to the retry policy."""
+        policy = self.retry_policy
+        if policy is not None:
+            policy.budget.record_request()
+
+        attempt = 1
+        while True:
+            if deadline is not None:
+                # Never let the deadline lengthen the per-call or session timeout
+                kwargs["timeout"] = _attempt_timeout(
+                    deadline, kwargs.get("timeout", self._session_timeout)
+                )
+            try:
+                return await self._attempt(endpoint, method, url, kwargs)
+            except RequestException as e:
+                if policy is None:
+                    raise
+                headers = getattr(e.response, "headers", None)
+                delay = policy.next_delay(endpoint, attempt, e, headers)
+                if delay is None:
+                    raise
+                if deadline is not None and delay >= deadline.remaining():
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def add_interceptor(self, interceptor: AsyncInterceptor) -> None:
+        """
+        Append an interceptor, innermost of those added so far.
+
+        Args:
+            interceptor: The interceptor to add.
+        """
+        self.interceptors.append(interceptor)
+        self._chain = build_async_chain(self.interceptors, self._proceed)
+
+    async def _request_shared(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        share_key: Hashable = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send an idempotent request, sharing it with identical requests in
+        flight when single-flight is enabled.
+
+        Args:
+            endpoint: Endpoint name used for retry rules, e.g. "balances".
+            method: HTTP method, "GET".
+            url: Request URL.
+            share_key: Extra value that must also match for a request in
+                flight to be shared, e.g. a cache generation.
+            **kwargs: Keyword arguments for the curl_cffi request.
+
+        Returns:
+            The successful response, possibly shared with other callers.
+        """
+        group = self.single_flight
+        if group is None:
+            return await self._request(endpoint, method, url, **kwargs)
+        return await group.do(
+            (request_key(method, url, kwargs.get("params")), share_key),
+            lambda: self._request(endpoint, method, url, **kwargs),
+        )
+
+    async def _attempt(
+        self, endpoint: str, method: str, url: str, kwargs: dict[str, Any]
+    ) -> requests.Response:
+        """Make a single rate-limited attempt and raise on HTTP errors."""
+        limiter = self.rate_limiter
+        if limiter is not None:
+            await limiter.acquire(endpoint)
+        if self.metrics is None:
+            response = await self._send(method, url, **kwargs)
+        else:
+            response = await self._send_measured(
+                self.metrics, endpoint, method, url, kwargs
+            )
+        if limiter is not None:
+            limiter.update_from_headers(response.headers, response.status_code)
+        if self.timing_recorder is not None:
+            self.timing_recorder.record_request(
+                RequestTiming.from_response(endpoint, response)
+            )
+        response.raise_for_status()  # type: ignore[no-untyped-call]
+        return response
+
+    async def _send_measured(
+        self,
+        metrics: MetricsRegistry,
+        endpoint: str,
+        method: str,
+        url: str,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        """Send a request and record its latency and outcome."""
+        start = time.perf_counter()
+        try:
+            response = await self._send(method, url, **kwargs)
+        except Exception:
+            metrics.record(endpoint, url, time.perf_counter() - start, None)
+            raise
+        metrics.record(endpoint, url, time.perf_counter() - start, response.status_code)
+        return response
+
+    def _configure_pool(self) -> None:
+        """Apply connection limits to the session's shared connection pool."""
+        if self.connection_options is not None:
+            acurl = self.client.acurl
+            for option, value in self.connection_options.multi_options().items():
+                acurl.setopt(option, value)  # type: ignore[no-untyped-call]
+        self._pool_configured = True
+
+    async def warmup(self, connections: int = 1) -> None:
+        """
+        Open connections to the API host ahead of the first trade.
+
+        Sends HEAD requests concurrently so DNS resolution and the TCP/TLS
+        handshakes are done before `order` is called. Over HTTP/2 a single
+        connection serves concurrent requests; more are useful over
+        HTTP/1.1.
+
+        Args:
+            connections: Number of concurrent requests to send.
+
+        Raises:
+            RequestException: If the host cannot be reached.
+        """
+        headers = self._get_headers()
+        await asyncio.gather(
+            *(
+                self._send("HEAD", self.base_url, headers=headers)
+                for _ in range(connections)
+            )
+        )
+
+    def start_keepalive(self, interval: float = DEFAULT_KEEPALIVE_INTERVAL) -> None:
+        """
+        Keep the connection pool warm with a background task that pings the
+        API host whenever the client has been idle for `interval` seconds.
+        Must be called from a running event loop.
+
+        Args:
+            interval: Idle time in seconds before a ping is sent. Keep it
+                below the server's idle timeout (usually 60 seconds).
+        """
+        if self._keepalive_task is None:
+            self._last_used = time.monotonic()
+            self._keepalive_task = asyncio.get_running_loop().create_task(
+                self._keepalive_loop(interval)
+            )
+
+    async def _keepalive_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval / 2)
+            if time.monotonic() - self._last_used < interval:
+                continue
+            try:
+                await self.warmup()
+            except RequestException as e:
+                logger.debug("Keep-alive ping failed: %s", e)
+
+    async def stop_keepalive(self) -> None:
+        """Stop the background keep-alive started by start_keepalive()."""
+        task = self._keepalive_task
+        if task is None:
+            return
+        self._keepalive_task = None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
 
     async def close(self) -> None:
         """
@@ -223,14 +1071,107 @@ class AsyncJupiterClient(_CoreJupiterClient):
 
         Always call this method when done to properly cleanup resources.
         """
+        await self.stop_keepalive()
         await self.client.close()
 
+    async def _run_cpu(
+        self, name: str, size: int, fn: Callable[..., T], *args: Any
+    ) -> T:
+        """
+        Run a CPU-bound step, in `cpu_executor` if the payload is at least
+        `offload_threshold` bytes and inline otherwise.
+
+        Args:
+            name: Step name used in blocking warnings.
+            size: Payload size in bytes.
+            fn: Function to call.
+            *args: Arguments for `fn`.
+
+        Returns:
+            The return value of `fn`.
+        """
+        if self.cpu_executor is not None and size >= self.offload_threshold:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.cpu_executor, fn, *args)
+
+        if self.blocking_warn_ms is None:
+            return fn(*args)
+
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if elapsed_ms > self.blocking_warn_ms:
+                logger.warning(
+                    "%s blocked the event loop for %.2f ms (threshold %.2f ms)",
+                    name,
+                    elapsed_ms,
+                    self.blocking_warn_ms,
+                )
+
+    async def _load_signer(self) -> None:
+        """Resolve the signer's keys once, off the loop if possible."""
+        if self._signer_loaded:
+            return
+        # Key loading may read files or the environment and decode the key,
+        # so it is always eligible for offloading. It must run in this
+        # process to fill the signer's cache.
+        if isinstance(self.cpu_executor, ProcessPoolExecutor):
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _load_signing_keys, self.signer)
+        else:
+            await self._run_cpu(
+                "key loading", self.offload_threshold, _load_signing_keys, self.signer
+            )
+        self._signer_loaded = True
+
+    async def _decode_json(self, response: requests.Response) -> Any:
+        """
+        Decode a JSON response body, off the loop for large bodies.
+
+        Args:
+            response: The HTTP response.
+
+        Returns:
+            The decoded JSON value.
+        """
+        if self.cpu_executor is None:
+            return await self._run_cpu(
+                "JSON decoding", 0, self._decode_response, response
+            )
+        content = response.content
+        return await self._run_cpu(
+            "JSON decoding", len(content), _decode_body, content, self.json_codec
+        )
+
+    async def sign_transaction_async(self, transaction_base64: str) -> str:
+        """
+        Async variant of sign_transaction() that keeps signing off the event
+        loop when `cpu_executor` is configured.
+
+        Args:
+            transaction_base64: Base64-encoded unsigned transaction.
+
+        Returns:
+            Base64-encoded signed transaction.
+        """
+        await self._load_signer()
+        return await self._run_cpu(
+            "transaction signing",
+            len(transaction_base64),
+            sign_base64_transaction,
+            transaction_base64,
+            dict(self.signer.signing_keys),
+        )
+
     # Override get_public_key for async context consistency
     async def get_public_key(self) -> str:  # type: ignore[override]
         """
-        Get the public key from the loaded private key.
+        Get the public key of the configured signer.
 
         Returns:
             Public key as a base58-encoded string.
         """
+        await self._load_signer()
         return super().get_public_key()
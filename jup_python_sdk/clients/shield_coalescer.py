@@ -0,0 +1,168 @@
+import asyncio
+from collections.abc import Awaitable, Sequence
+from typing import Any, Callable, Optional
+
+from jup_python_sdk.clients.batch import chunked
+
+ShieldFetch = Callable[[list[str]], Awaitable[dict[str, Any]]]
+
+
+class ShieldCoalescer:
+    """
+    Micro-batching loader that merges concurrent shield lookups into as
+    few requests as possible.
+
+    Mints requested within `window` seconds of each other are collected,
+    de-duplicated and sent in chunks of at most `chunk_size` mints, one
+    request per chunk. Each caller then receives the warnings for its own
+    mints. A mint that is already being fetched is not requested again;
+    later callers share the in-flight lookup.
+    """
+
+    def __init__(
+        self,
+        fetch: ShieldFetch,
+        window: float = 0.002,
+        chunk_size: int = 50,
+    ):
+        """
+        Initialize the shield coalescer.
+
+        Args:
+            fetch: Coroutine function taking a list of mints and returning
+                the decoded shield response for them.
+            window: Seconds to wait for more lookups before sending a
+                batch. A batch that reaches `chunk_size` mints is sent
+                immediately.
+            chunk_size: Maximum number of mints per request, keeping the
+                query string within the server's URL limits.
+
+        Raises:
+            ValueError: If `window` is negative or `chunk_size` is less
+                than 1.
+        """
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.fetch = fetch
+        self.window = window
+        self.chunk_size = chunk_size
+        self._pending: dict[str, asyncio.Future[Optional[list[Any]]]] = {}
+        self._in_flight: dict[str, asyncio.Future[Optional[list[Any]]]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.requests_sent = 0
+
+    async def load(self, mints: Sequence[str]) -> dict[str, Any]:
+        """
+        Get the warnings for `mints`, batched with concurrent lookups.
+
+        Args:
+            mints: Token mint addresses.
+
+        Returns:
+            dict: A shield response for `mints`, i.e. {"warnings": {...}}
+            with an entry for each mint the server reported.
+
+        Raises:
+            HTTPError: If the request for a chunk containing one of
+                `mints` failed.
+        """
+        unique = list(dict.fromkeys(mints))
+        futures = [self._future_for(mint) for mint in unique]
+        # Shielded, so a cancelled caller does not cancel the lookup for
+        # others waiting on the same mints
+        results = await asyncio.gather(
+            *(asyncio.shield(future) for future in futures), return_exceptions=True
+        )
+
+        warnings: dict[str, list[Any]] = {}
+        for mint, result in zip(unique, results):
+            if isinstance(result, BaseException):
+                raise result
+            if result is not None:
+                warnings[mint] = result
+        return {"warnings": warnings}
+
+    def _future_for(self, mint: str) -> "asyncio.Future[Optional[list[Any]]]":
+        """Get the future resolving to a mint's warnings, queueing it."""
+        future = self._in_flight.get(mint) or self._pending.get(mint)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[mint] = future
+        if len(self._pending) >= self.chunk_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Send every pending mint, one request per chunk."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        self._in_flight.update(batch)
+
+        for chunk in chunked(list(batch), self.chunk_size):
+            task = asyncio.ensure_future(self._fetch_chunk(chunk, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch_chunk(
+        self,
+        chunk: list[str],
+        batch: dict[str, "asyncio.Future[Optional[list[Any]]]"],
+    ) -> None:
+        """Fetch one chunk and resolve the futures of its mints."""
+        self.requests_sent += 1
+        try:
+            response = await self.fetch(chunk)
+        except asyncio.CancelledError:
+            for mint in chunk:
+                self._resolve(mint, batch[mint], cancel=True)
+            raise
+        except Exception as e:
+            for mint in chunk:
+                self._resolve(mint, batch[mint], error=e)
+            return
+
+        warnings = response.get("warnings") or {}
+        for mint in chunk:
+            self._resolve(mint, batch[mint], value=warnings.get(mint))
+
+    def _resolve(
+        self,
+        mint: str,
+        future: "asyncio.Future[Optional[list[Any]]]",
+        value: Optional[list[Any]] = None,
+        error: Optional[BaseException] = None,
+        cancel: bool = False,
+    ) -> None:
+        """Settle a mint's future and stop sharing it."""
+        if self._in_flight.get(mint) is future:
+            del self._in_flight[mint]
+        if future.done():
+            return
+        if cancel:
+            future.cancel()
+        elif error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    async def close(self) -> None:
+        """Cancel lookups that have not completed."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for future in self._pending.values():
+            future.cancel()
+        self._pending = {}
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -1,12 +1,125 @@
-from typing import Any
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from concurrent.futures import Executor
+from typing import Any, Literal, Optional, Union, overload
+
+from curl_cffi.requests import Response
 
+from jup_python_sdk.clients.batch import (
+    BatchResult,
+    chunked,
+    run_bounded,
+    run_bounded_threads,
+    run_pipeline,
+)
 from jup_python_sdk.clients.jupiter_client import AsyncJupiterClient, JupiterClient
+from jup_python_sdk.clients.shield_coalescer import ShieldCoalescer
 from jup_python_sdk.models.ultra_api.ultra_execute_request_model import (
     UltraExecuteRequest,
 )
 from jup_python_sdk.models.ultra_api.ultra_order_request_model import (
     UltraOrderRequest,
 )
+from jup_python_sdk.models.ultra_api.ultra_order_response_model import (
+    UltraOrderResponse,
+)
+from jup_python_sdk.models.ultra_api.ultra_order_template import OrderTemplate
+from jup_python_sdk.signing.transaction_signing import transaction_signers
+from jup_python_sdk.transport.deadline import (
+    DEFAULT_EXECUTE_SHARE,
+    Deadline,
+    DeadlineExceeded,
+    StaleQuoteError,
+    as_deadline,
+)
+from jup_python_sdk.transport.request_timing import SwapTiming
+from jup_python_sdk.transport.response_cache import BalancesCache, ShieldCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_CONCURRENCY = 8
+DEFAULT_SHIELD_CHUNK_SIZE = 50
+
+
+def _order_transaction(order: UltraOrderResponse) -> str:
+    """Get the transaction to sign, failing if the order has none."""
+    if order.transaction is None:
+        raise ValueError(
+            f"Order {order.request_id} has no transaction: "
+            f"{order.error_message or 'no taker or insufficient funds'}"
+        )
+    return order.transaction
+
+
+def _finish_swap_timing(
+    timing: SwapTiming, executing_since: float, requotes: int
+) -> SwapTiming:
+    """Complete a swap's phase split once its execute call returned."""
+    timing.execute = time.perf_counter() - executing_since
+    timing.total = timing.order + timing.sign + timing.execute
+    timing.requotes = requotes
+    return timing
+
+
+def _check_requote(order: UltraOrderResponse, requotes: int, max_requotes: int) -> None:
+    """Fail if a stale order may not be requoted again."""
+    if requotes >= max_requotes:
+        raise StaleQuoteError(
+            f"Order {order.request_id} is {order.age():.3f} seconds old after "
+            f"{requotes} requotes"
+        )
+
+
+def _split_budget(
+    deadline: Union[float, Deadline, None], min_execute_time: Optional[float]
+) -> tuple[Optional[Deadline], Optional[Deadline], float]:
+    """Split a swap's deadline into the whole budget and the order phase."""
+    budget = as_deadline(deadline)
+    if budget is None:
+        return None, None, 0.0
+    reserve = (
+        budget.budget * DEFAULT_EXECUTE_SHARE
+        if min_execute_time is None
+        else min_execute_time
+    )
+    return budget, budget.reserve(reserve), reserve
+
+
+def _check_execute_time(budget: Optional[Deadline], reserve: float) -> None:
+    """Fail before sending a swap that could not be waited for."""
+    if budget is not None and budget.remaining() < reserve:
+        raise DeadlineExceeded(
+            f"Only {budget.remaining():.3f} of the {reserve} seconds kept for "
+            "execute are left; the swap was not sent"
+        )
+
+
+def _invalidate_after_execute(
+    cache: BalancesCache,
+    request: UltraExecuteRequest,
+    result: Union[dict[str, Any], bytes],
+) -> None:
+    """Drop the cached balances of a successful swap's signers."""
+    if isinstance(result, bytes):
+        # The execute call has completed; an unexpected body must not make
+        # this hook raise
+        try:
+            result = json.loads(result)
+        except ValueError:
+            return
+    if isinstance(result, dict) and result.get("status") == "Success":
+        for signer in transaction_signers(request.signed_transaction):
+            cache.invalidate(signer)
 
 
 class UltraApiClient(JupiterClient):
@@ -14,102 +127,437 @@ class UltraApiClient(JupiterClient):
     A synchronous client for interacting with the Jupiter Ultra API.
     """
 
-    def order(self, request: UltraOrderRequest) -> dict[str, Any]:
+    def __init__(
+        self,
+        *args: Any,
+        shield_cache: Optional[ShieldCache] = None,
+        balances_cache: Optional[BalancesCache] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the synchronous Ultra API client.
+
+        Args:
+            *args: Positional arguments for JupiterClient.
+            shield_cache: Optional ShieldCache serving shield() warnings per
+                mint; only uncached mints are requested.
+            balances_cache: Optional BalancesCache serving balances() for
+                recently fetched addresses. Successful executions drop the
+                cached balances of the transaction's signers.
+            **kwargs: Keyword arguments for JupiterClient.
+        """
+        super().__init__(*args, **kwargs)
+        self.shield_cache = shield_cache
+        self.balances_cache = balances_cache
+
+    @overload
+    def order(
+        self,
+        request: UltraOrderRequest,
+        raw: Literal[False] = ...,
+        deadline: Union[float, Deadline, None] = None,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    def order(
+        self,
+        request: UltraOrderRequest,
+        raw: Literal[True],
+        deadline: Union[float, Deadline, None] = None,
+    ) -> bytes: ...
+
+    def order(
+        self,
+        request: UltraOrderRequest,
+        raw: bool = False,
+        deadline: Union[float, Deadline, None] = None,
+    ) -> Union[dict[str, Any], bytes]:
         """
         Get an order from the Jupiter Ultra API (synchronous).
 
         Args:
             request (UltraOrderRequest): The request parameters for the order.
+            raw (bool): Return the undecoded response body as bytes.
+            deadline (Deadline | float): Optional deadline, or time budget
+                in seconds, bounding the request and its retries.
 
         Returns:
-            dict: The dict api response.
+            dict: The dict api response, or bytes if `raw` is set.
+        """
+        url = f"{self.base_url}/ultra/v1/order?{request.to_query_string()}"
+        # Orders with a taker carry a fresh transaction and are never shared
+        send = self._request if request.taker else self._request_shared
+        response = send(
+            "order",
+            "GET",
+            url,
+            deadline=as_deadline(deadline),
+            headers=self._get_headers(),
+        )
+
+        if raw:
+            return response.content
+        return self._decode_response(response)  # type: ignore[no-any-return]
+
+    @overload
+    def order_from_template(
+        self, template: OrderTemplate, amount: int, raw: Literal[False] = ...
+    ) -> dict[str, Any]: ...
+
+    @overload
+    def order_from_template(
+        self, template: OrderTemplate, amount: int, raw: Literal[True]
+    ) -> bytes: ...
+
+    def order_from_template(
+        self, template: OrderTemplate, amount: int, raw: bool = False
+    ) -> Union[dict[str, Any], bytes]:
         """
-        params = request.to_dict()
+        Get an order for a pre-encoded template and an amount (synchronous).
 
-        url = f"{self.base_url}/ultra/v1/order"
-        response = self.client.get(url, params=params, headers=self._get_headers())
-        response.raise_for_status()
+        Skips request model construction, validation and URL encoding.
 
-        return response.json()  # type: ignore[no-any-return]  # type: ignore
+        Args:
+            template (OrderTemplate): The fixed order parameters.
+            amount (int): Amount to swap in the smallest unit.
+            raw (bool): Return the undecoded response body as bytes.
 
-    def execute(self, request: UltraExecuteRequest) -> dict[str, Any]:
+        Returns:
+            dict: The dict api response, or bytes if `raw` is set.
+        """
+        url = template.url_prefix(self.base_url) + str(amount)
+        send = self._request if template.request.taker else self._request_shared
+        response = send("order", "GET", url, headers=self._get_headers())
+
+        if raw:
+            return response.content
+        return self._decode_response(response)  # type: ignore[no-any-return]
+
+    @overload
+    def execute(
+        self,
+        request: UltraExecuteRequest,
+        raw: Literal[False] = ...,
+        deadline: Union[float, Deadline, None] = None,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    def execute(
+        self,
+        request: UltraExecuteRequest,
+        raw: Literal[True],
+        deadline: Union[float, Deadline, None] = None,
+    ) -> bytes: ...
+
+    def execute(
+        self,
+        request: UltraExecuteRequest,
+        raw: bool = False,
+        deadline: Union[float, Deadline, None] = None,
+    ) -> Union[dict[str, Any], bytes]:
         """
         Execute the order with the Jupiter Ultra API (synchronous).
 
         Args:
             request (UltraExecuteRequest): The execute request parameters.
+            raw (bool): Return the undecoded response body as bytes.
+            deadline (Deadline | float): Optional deadline, or time budget
+                in seconds, bounding the request and its retries.
 
         Returns:
-            dict: The dict api response.
+            dict: The dict api response, or bytes if `raw` is set.
         """
         payload = request.to_dict()
 
         url = f"{self.base_url}/ultra/v1/execute"
-        response = self.client.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
+        response = self._request(
+            "execute",
+            "POST",
+            url,
+            deadline=as_deadline(deadline),
+            **self._json_body(payload),
+        )
 
-        return response.json()  # type: ignore[no-any-return]  # type: ignore
+        result = response.content if raw else self._decode_response(response)
+        if self.balances_cache is not None:
+            _invalidate_after_execute(self.balances_cache, request, result)
+        return result
 
-    def order_and_execute(self, request: UltraOrderRequest) -> dict[str, Any]:
+    def order_and_execute(
+        self,
+        request: UltraOrderRequest,
+        deadline: Union[float, Deadline, None] = None,
+        max_quote_age: Optional[float] = None,
+        max_requotes: int = 1,
+        min_execute_time: Optional[float] = None,
+    ) -> dict[str, Any]:
         """
         Get and execute an order in a single call (synchronous).
 
         Args:
             request (UltraOrderRequest): The request parameters for the order.
+            deadline (Deadline | float): Optional deadline, or time budget
+                in seconds, for the whole call. Each request's timeout is
+                capped by the time left.
+            max_quote_age (float): If set, an order older than this many
+                seconds once signed, or whose RFQ quote has expired, is
+                requoted instead of executed.
+            max_requotes (int): Maximum number of requotes.
+            min_execute_time (float): Seconds of the deadline kept back for
+                execute; ordering and requotes must finish before then.
+                Defaults to half the budget.
 
         Returns:
             dict: The dict api response.
+
+        Raises:
+            ValueError: If the order came back without a transaction.
+            DeadlineExceeded: If the budget ran out, or less than
+                `min_execute_time` was left, before execution. The signed
+                transaction has not been sent then.
+            StaleQuoteError: If the order was still too old after
+                `max_requotes` requotes.
         """
-        order_response = self.order(request)
+        budget, order_budget, reserve = _split_budget(deadline, min_execute_time)
+        timing = SwapTiming()
+        started = time.perf_counter()
+        requotes = 0
+        while True:
+            # Only requestId and transaction are parsed; the route plan is
+            # skipped
+            order = UltraOrderResponse.from_json(
+                self.order(request, raw=True, deadline=order_budget)
+            )
+            ordered = time.perf_counter()
+            execute_request = UltraExecuteRequest(
+                request_id=order.request_id,
+                signed_transaction=self.sign_transaction(_order_transaction(order)),
+            )
+            timing.order += ordered - started
+            started = time.perf_counter()
+            timing.sign += started - ordered
+            if max_quote_age is None or not order.is_stale(max_quote_age):
+                break
+            _check_requote(order, requotes, max_requotes)
+            requotes += 1
 
-        request_id = order_response["requestId"]
-        signed_transaction = self._sign_base64_transaction(
-            order_response["transaction"]
-        )
+        _check_execute_time(budget, reserve)
+        result = self.execute(execute_request, deadline=budget)
+        if self.timing_recorder is not None:
+            self.timing_recorder.record_swap(
+                _finish_swap_timing(timing, started, requotes)
+            )
+        return result
 
-        execute_request = UltraExecuteRequest(
-            request_id=request_id,
-            signed_transaction=self._serialize_versioned_transaction(
-                signed_transaction
-            ),
-        )
+    @overload
+    def balances(self, address: str, raw: Literal[False] = ...) -> dict[str, Any]: ...
 
-        return self.execute(execute_request)
+    @overload
+    def balances(self, address: str, raw: Literal[True]) -> bytes: ...
 
-    def balances(self, address: str) -> dict[str, Any]:
+    def balances(self, address: str, raw: bool = False) -> Union[dict[str, Any], bytes]:
         """
         Get token balances of an account (synchronous).
 
         Args:
             address (str): The public key of the account to get balances for.
+            raw (bool): Return the undecoded response body as bytes.
 
         Returns:
-            dict: The dict api response.
+            dict: The dict api response, or bytes if `raw` is set.
+        """
+        cache = self.balances_cache
+        if raw or cache is None:
+            generation = cache.generation() if cache is not None else None
+            response = self._balances_request(address, generation)
+            if raw:
+                return response.content
+            return self._decode_response(response)  # type: ignore[no-any-return]
+
+        cached = cache.get(address)
+        if cached is not None:
+            return cached
+        generation = cache.generation()
+        balances: dict[str, Any] = self._decode_response(
+            self._balances_request(address, generation)
+        )
+        cache.set_if_current(generation, address, balances)
+        return balances
+
+    def _balances_request(self, address: str, generation: Optional[int]) -> Response:
+        """
+        Send a balances request for `address`.
+
+        Only requests started at the same cache generation are shared, so
+        a call made after our own trade never receives pre-trade balances.
         """
         url = f"{self.base_url}/ultra/v1/balances/{address}"
-        response = self.client.get(url, headers=self._get_headers())
-        response.raise_for_status()
+        return self._request_shared(
+            "balances",
+            "GET",
+            url,
+            share_key=generation,
+            headers=self._get_headers(),
+        )
 
-        return response.json()  # type: ignore[no-any-return]  # type: ignore
+    def invalidate_balances(self, address: Optional[str] = None) -> None:
+        """
+        Drop cached balances, e.g. after a transfer made outside this client.
 
-    def shield(self, mints: list[str]) -> dict[str, Any]:
+        Args:
+            address (str): The account whose balances to drop, or None to
+                drop every cached account.
+        """
+        if self.balances_cache is None:
+            return
+        if address is None:
+            self.balances_cache.clear()
+        else:
+            self.balances_cache.invalidate(address)
+
+    @overload
+    def shield(self, mints: list[str], raw: Literal[False] = ...) -> dict[str, Any]: ...
+
+    @overload
+    def shield(self, mints: list[str], raw: Literal[True]) -> bytes: ...
+
+    def shield(
+        self, mints: list[str], raw: bool = False
+    ) -> Union[dict[str, Any], bytes]:
         """
         Get token info and warnings for specific mints (synchronous).
 
         Args:
             mints (list[str]): List of token mint addresses
             to get information for.
+            raw (bool): Return the undecoded response body as bytes.
 
         Returns:
-            dict: The dict api response with warnings information.
+            dict: The dict api response with warnings information, or
+            bytes if `raw` is set. With a shield cache, the warnings only
+            cover `mints`.
         """
-        params = {"mints": ",".join(mints)}
+        if raw:
+            return self._shield_request(mints).content
+        cache = self.shield_cache
+        if cache is None:
+            return self._fetch_shield(mints)
 
+        cached, stale, missing = cache.partition(mints)
+        if missing:
+            cached.update(cache.store(missing, self._fetch_shield(missing)))
+        refresh = cache.begin_refresh(stale)
+        if refresh:
+            threading.Thread(
+                target=self._refresh_shield,
+                args=(cache, refresh),
+                name="jup-shield-refresh",
+                daemon=True,
+            ).start()
+        return cache.to_response(mints, cached)
+
+    def _shield_request(self, mints: list[str]) -> Response:
+        """Send a shield request for `mints`."""
+        params = {"mints": ",".join(mints)}
         url = f"{self.base_url}/ultra/v1/shield"
-        response = self.client.get(url, params=params, headers=self._get_headers())
-        response.raise_for_status()
+        return self._request_shared(
+            "shield", "GET", url, params=params, headers=self._get_headers()
+        )
+
+    def _fetch_shield(self, mints: list[str]) -> dict[str, Any]:
+        """Send a shield request for `mints` and decode the response."""
+        response = self._shield_request(mints)
+        return self._decode_response(response)  # type: ignore[no-any-return]
+
+    def _refresh_shield(self, cache: ShieldCache, mints: list[str]) -> None:
+        """Re-fetch stale cached mints, keeping the old entries on failure."""
+        try:
+            cache.store(mints, self._fetch_shield(mints))
+        except Exception as e:
+            logger.debug("Shield cache refresh failed: %s", e)
+        finally:
+            cache.end_refresh(mints)
+
+    def order_many(
+        self,
+        requests: Iterable[UltraOrderRequest],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[BatchResult[UltraOrderRequest, dict[str, Any]]]:
+        """
+        Get orders for many requests on a thread pool (synchronous).
+
+        Pair with `pool_size` >= `concurrency` so each worker thread reuses
+        a pooled connection instead of opening its own.
+
+        Args:
+            requests (Iterable[UltraOrderRequest]): The order requests; may
+                be a lazy iterable.
+            concurrency (int): Maximum number of requests in flight.
+            executor (Executor): Optional thread pool to reuse across
+                batches. A pool is created per batch if omitted.
+
+        Returns:
+            Iterator of BatchResults in completion order. Failed requests
+            yield a result with `error` set instead of raising.
+        """
+        return run_bounded_threads(
+            requests, lambda request: self.order(request), concurrency, executor
+        )
+
+    def balances_many(
+        self,
+        addresses: Iterable[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[BatchResult[str, dict[str, Any]]]:
+        """
+        Get token balances of many accounts on a thread pool (synchronous).
+
+        Args:
+            addresses (Iterable[str]): Account public keys; may be a lazy
+                iterable.
+            concurrency (int): Maximum number of requests in flight.
+            executor (Executor): Optional thread pool to reuse across
+                batches. A pool is created per batch if omitted.
+
+        Returns:
+            Iterator of BatchResults in completion order. Failed requests
+            yield a result with `error` set instead of raising.
+        """
+        return run_bounded_threads(
+            addresses, lambda address: self.balances(address), concurrency, executor
+        )
+
+    def shield_many(
+        self,
+        mints: Sequence[str],
+        chunk_size: int = DEFAULT_SHIELD_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[BatchResult[list[str], dict[str, Any]]]:
+        """
+        Get token warnings for many mints, `chunk_size` mints per request,
+        on a thread pool (synchronous).
 
-        return response.json()  # type: ignore[no-any-return]  # type: ignore
+        Args:
+            mints (Sequence[str]): Token mint addresses.
+            chunk_size (int): Maximum number of mints per request.
+            concurrency (int): Maximum number of requests in flight.
+            executor (Executor): Optional thread pool to reuse across
+                batches. A pool is created per batch if omitted.
+
+        Returns:
+            Iterator of BatchResults, one per chunk of mints, in completion
+            order. Failed requests yield a result with `error` set instead
+            of raising.
+        """
+        return run_bounded_threads(
+            chunked(mints, chunk_size),
+            lambda chunk: self.shield(chunk),
+            concurrency,
+            executor,
+        )
 
 
 class AsyncUltraApiClient(AsyncJupiterClient):
@@ -117,97 +565,505 @@ class AsyncUltraApiClient(AsyncJupiterClient):
     An asynchronous client for interacting with the Jupiter Ultra API.
     """
 
-    async def order(self, request: UltraOrderRequest) -> dict[str, Any]:
+    def __init__(
+        self,
+        *args: Any,
+        shield_batch_window: Optional[float] = None,
+        shield_chunk_size: int = DEFAULT_SHIELD_CHUNK_SIZE,
+        shield_cache: Optional[ShieldCache] = None,
+        balances_cache: Optional[BalancesCache] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the asynchronous Ultra API client.
+
+        Args:
+            *args: Positional arguments for AsyncJupiterClient.
+            shield_batch_window: If set, concurrent shield() calls made
+                within this many seconds of each other are merged into one
+                request per `shield_chunk_size` de-duplicated mints.
+            shield_chunk_size: Maximum number of mints per coalesced shield
+                request.
+            shield_cache: Optional ShieldCache serving shield() warnings per
+                mint; only uncached mints are requested.
+            balances_cache: Optional BalancesCache serving balances() for
+                recently fetched addresses. Successful executions drop the
+                cached balances of the transaction's signers.
+            **kwargs: Keyword arguments for AsyncJupiterClient.
+        """
+        super().__init__(*args, **kwargs)
+        self.shield_cache = shield_cache
+        self.balances_cache = balances_cache
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
+        self.shield_coalescer: Optional[ShieldCoalescer] = None
+        if shield_batch_window is not None:
+            self.shield_coalescer = ShieldCoalescer(
+                self._fetch_shield, shield_batch_window, shield_chunk_size
+            )
+
+    @overload
+    async def order(
+        self,
+        request: UltraOrderRequest,
+        raw: Literal[False] = ...,
+        deadline: Union[float, Deadline, None] = None,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def order(
+        self,
+        request: UltraOrderRequest,
+        raw: Literal[True],
+        deadline: Union[float, Deadline, None] = None,
+    ) -> bytes: ...
+
+    async def order(
+        self,
+        request: UltraOrderRequest,
+        raw: bool = False,
+        deadline: Union[float, Deadline, None] = None,
+    ) -> Union[dict[str, Any], bytes]:
         """
         Get an order from the Jupiter Ultra API (asynchronous).
 
         Args:
             request (UltraOrderRequest): The request parameters for the order.
+            raw (bool): Return the undecoded response body as bytes.
+            deadline (Deadline | float): Optional deadline, or time budget
+                in seconds, bounding the request and its retries.
 
         Returns:
-            dict: The dict api response.
+            dict: The dict api response, or bytes if `raw` is set.
         """
-        params = request.to_dict()
-
-        url = f"{self.base_url}/ultra/v1/order"
-        response = await self.client.get(
-            url, params=params, headers=self._get_headers()
+        url = f"{self.base_url}/ultra/v1/order?{request.to_query_string()}"
+        # Orders with a taker carry a fresh transaction and are never shared
+        send = self._request if request.taker else self._request_shared
+        response = await send(
+            "order",
+            "GET",
+            url,
+            deadline=as_deadline(deadline),
+            headers=self._get_headers(),
         )
-        response.raise_for_status()
 
-        return response.json()  # type: ignore[no-any-return]
+        if raw:
+            return response.content
+        return await self._decode_json(response)  # type: ignore[no-any-return]
+
+    @overload
+    async def order_from_template(
+        self, template: OrderTemplate, amount: int, raw: Literal[False] = ...
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def order_from_template(
+        self, template: OrderTemplate, amount: int, raw: Literal[True]
+    ) -> bytes: ...
+
+    async def order_from_template(
+        self, template: OrderTemplate, amount: int, raw: bool = False
+    ) -> Union[dict[str, Any], bytes]:
+        """
+        Get an order for a pre-encoded template and an amount (asynchronous).
+
+        Skips request model construction, validation and URL encoding.
+
+        Args:
+            template (OrderTemplate): The fixed order parameters.
+            amount (int): Amount to swap in the smallest unit.
+            raw (bool): Return the undecoded response body as bytes.
+
+        Returns:
+            dict: The dict api response, or bytes if `raw` is set.
+        """
+        url = template.url_prefix(self.base_url) + str(amount)
+        send = self._request if template.request.taker else self._request_shared
+        response = await send("order", "GET", url, headers=self._get_headers())
+
+        if raw:
+            return response.content
+        return await self._decode_json(response)  # type: ignore[no-any-return]
 
-    async def execute(self, request: UltraExecuteRequest) -> dict[str, Any]:
+    @overload
+    async def execute(
+        self,
+        request: UltraExecuteRequest,
+        raw: Literal[False] = ...,
+        deadline: Union[float, Deadline, None] = None,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def execute(
+        self,
+        request: UltraExecuteRequest,
+        raw: Literal[True],
+        deadline: Union[float, Deadline, None] = None,
+    ) -> bytes: ...
+
+    async def execute(
+        self,
+        request: UltraExecuteRequest,
+        raw: bool = False,
+        deadline: Union[float, Deadline, None] = None,
+    ) -> Union[dict[str, Any], bytes]:
         """
         Execute the order with the Jupiter Ultra API (asynchronous).
 
         Args:
             request (UltraExecuteRequest): The execute request parameters.
+            raw (bool): Return the undecoded response body as bytes.
+            deadline (Deadline | float): Optional deadline, or time budget
+                in seconds, bounding the request and its retries.
 
         Returns:
-            dict: The dict api response.
+            dict: The dict api response, or bytes if `raw` is set.
         """
         payload = request.to_dict()
 
         url = f"{self.base_url}/ultra/v1/execute"
-        response = await self.client.post(
-            url, json=payload, headers=self._get_headers()
+        response = await self._request(
+            "execute",
+            "POST",
+            url,
+            deadline=as_deadline(deadline),
+            **self._json_body(payload),
         )
-        response.raise_for_status()
 
-        return response.json()  # type: ignore[no-any-return]
+        result = response.content if raw else await self._decode_json(response)
+        if self.balances_cache is not None:
+            _invalidate_after_execute(self.balances_cache, request, result)
+        return result
 
-    async def order_and_execute(self, request: UltraOrderRequest) -> dict[str, Any]:
+    async def order_and_execute(
+        self,
+        request: UltraOrderRequest,
+        deadline: Union[float, Deadline, None] = None,
+        max_quote_age: Optional[float] = None,
+        max_requotes: int = 1,
+        min_execute_time: Optional[float] = None,
+    ) -> dict[str, Any]:
         """
         Get and execute an order in a single call (asynchronous).
 
         Args:
             request (UltraOrderRequest): The request parameters for the order.
+            deadline (Deadline | float): Optional deadline, or time budget
+                in seconds, for the whole call. Each request's timeout is
+                capped by the time left.
+            max_quote_age (float): If set, an order older than this many
+                seconds once signed, or whose RFQ quote has expired, is
+                requoted instead of executed.
+            max_requotes (int): Maximum number of requotes.
+            min_execute_time (float): Seconds of the deadline kept back for
+                execute; ordering and requotes must finish before then.
+                Defaults to half the budget.
 
         Returns:
             dict: The dict api response.
+
+        Raises:
+            ValueError: If the order came back without a transaction.
+            DeadlineExceeded: If the budget ran out, or less than
+                `min_execute_time` was left, before execution. The signed
+                transaction has not been sent then.
+            StaleQuoteError: If the order was still too old after
+                `max_requotes` requotes.
         """
-        order_response = await self.order(request)
+        budget, order_budget, reserve = _split_budget(deadline, min_execute_time)
+        timing = SwapTiming()
+        started = time.perf_counter()
+        requotes = 0
+        while True:
+            order = await self._order_stage(request, order_budget)
+            ordered = time.perf_counter()
+            execute_request = await self._sign_stage(order)
+            timing.order += ordered - started
+            started = time.perf_counter()
+            timing.sign += started - ordered
+            if max_quote_age is None or not order.is_stale(max_quote_age):
+                break
+            _check_requote(order, requotes, max_requotes)
+            requotes += 1
+
+        _check_execute_time(budget, reserve)
+        result = await self.execute(execute_request, deadline=budget)
+        if self.timing_recorder is not None:
+            self.timing_recorder.record_swap(
+                _finish_swap_timing(timing, started, requotes)
+            )
+        return result
 
-        request_id = order_response["requestId"]
-        signed_transaction = self._sign_base64_transaction(
-            order_response["transaction"]
+    async def _order_stage(
+        self, request: UltraOrderRequest, deadline: Optional[Deadline] = None
+    ) -> UltraOrderResponse:
+        """Get an order, parsing only the fields needed to execute it."""
+        # Only requestId and transaction are parsed; the route plan is skipped
+        body = await self.order(request, raw=True, deadline=deadline)
+        return await self._run_cpu(
+            "JSON decoding", len(body), UltraOrderResponse.from_json, body
         )
 
-        execute_request = UltraExecuteRequest(
-            request_id=request_id,
-            signed_transaction=self._serialize_versioned_transaction(
-                signed_transaction
+    async def _sign_stage(self, order: UltraOrderResponse) -> UltraExecuteRequest:
+        """Sign an order's transaction into an execute request."""
+        return UltraExecuteRequest(
+            request_id=order.request_id,
+            signed_transaction=await self.sign_transaction_async(
+                _order_transaction(order)
             ),
         )
 
-        return await self.execute(execute_request)
+    def order_and_execute_many(
+        self,
+        requests: Union[Iterable[UltraOrderRequest], AsyncIterable[UltraOrderRequest]],
+        order_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        sign_concurrency: int = 1,
+        execute_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        queue_depth: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> AsyncIterator[BatchResult[UltraOrderRequest, dict[str, Any]]]:
+        """
+        Get, sign and execute a stream of orders as a pipeline.
+
+        Ordering, signing and executing run as separate stages with their
+        own concurrency, so later orders are fetched while earlier ones are
+        signed and executed. Each stage holds at most `queue_depth` waiting
+        orders, so a slow stage or consumer slows the stages before it.
+
+        Args:
+            requests: The order requests; may be a lazy or async iterable.
+            order_concurrency (int): Maximum number of order requests in
+                flight.
+            sign_concurrency (int): Maximum number of transactions signed
+                at once. Raise it together with `cpu_executor`.
+            execute_concurrency (int): Maximum number of execute requests
+                in flight.
+            queue_depth (int): Maximum number of orders waiting between
+                stages.
+
+        Returns:
+            Async iterator of BatchResults holding execute responses, in
+            completion order. A swap that fails at any stage yields a
+            result with `error` set instead of raising.
+        """
+        return run_pipeline(
+            requests,
+            [
+                (self._order_stage, order_concurrency),
+                (self._sign_stage, sign_concurrency),
+                (self.execute, execute_concurrency),
+            ],
+            queue_depth,
+        )
+
+    @overload
+    async def balances(
+        self, address: str, raw: Literal[False] = ...
+    ) -> dict[str, Any]: ...
 
-    async def balances(self, address: str) -> dict[str, Any]:
+    @overload
+    async def balances(self, address: str, raw: Literal[True]) -> bytes: ...
+
+    async def balances(
+        self, address: str, raw: bool = False
+    ) -> Union[dict[str, Any], bytes]:
         """
         Get token balances of an account (asynchronous).
 
         Args:
             address (str): The public key of the account to get balances for.
+            raw (bool): Return the undecoded response body as bytes.
 
         Returns:
-            dict: The dict api response.
+            dict: The dict api response, or bytes if `raw` is set.
+        """
+        cache = self.balances_cache
+        if raw or cache is None:
+            generation = cache.generation() if cache is not None else None
+            response = await self._balances_request(address, generation)
+            if raw:
+                return response.content
+            return await self._decode_json(response)  # type: ignore[no-any-return]
+
+        cached = cache.get(address)
+        if cached is not None:
+            return cached
+        generation = cache.generation()
+        balances: dict[str, Any] = await self._decode_json(
+            await self._balances_request(address, generation)
+        )
+        cache.set_if_current(generation, address, balances)
+        return balances
+
+    async def _balances_request(
+        self, address: str, generation: Optional[int]
+    ) -> Response:
+        """
+        Send a balances request for `address`.
+
+        Only requests started at the same cache generation are shared, so
+        a call made after our own trade never receives pre-trade balances.
         """
         url = f"{self.base_url}/ultra/v1/balances/{address}"
-        response = await self.client.get(url, headers=self._get_headers())
-        response.raise_for_status()
+        return await self._request_shared(
+            "balances",
+            "GET",
+            url,
+            share_key=generation,
+            headers=self._get_headers(),
+        )
 
-        return response.json()  # type: ignore[no-any-return]
+    def invalidate_balances(self, address: Optional[str] = None) -> None:
+        """
+        Drop cached balances, e.g. after a transfer made outside this client.
 
-    async def shield(self, mints: list[str]) -> dict[str, Any]:
+        Args:
+            address (str): The account whose balances to drop, or None to
+                drop every cached account.
+        """
+        if self.balances_cache is None:
+            return
+        if address is None:
+            self.balances_cache.clear()
+        else:
+            self.balances_cache.invalidate(address)
+
+    @overload
+    async def shield(
+        self, mints: list[str], raw: Literal[False] = ...
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def shield(self, mints: list[str], raw: Literal[True]) -> bytes: ...
+
+    async def shield(
+        self, mints: list[str], raw: bool = False
+    ) -> Union[dict[str, Any], bytes]:
         """
         Get token info and warnings for specific mints (asynchronous).
+
+        Args:
+            mints (list[str]): List of token mint addresses
+            to get information for.
+            raw (bool): Return the undecoded response body as bytes.
+
+        Returns:
+            dict: The dict api response with warnings information, or
+            bytes if `raw` is set. When shield calls are coalesced or
+            cached, the warnings only cover `mints`.
         """
+        if raw:
+            response = await self._shield_request(mints)
+            return response.content
+        cache = self.shield_cache
+        if cache is None:
+            return await self._load_shield(mints)
+
+        cached, stale, missing = cache.partition(mints)
+        if missing:
+            cached.update(cache.store(missing, await self._load_shield(missing)))
+        refresh = cache.begin_refresh(stale)
+        if refresh:
+            task = asyncio.ensure_future(self._refresh_shield(cache, refresh))
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+        return cache.to_response(mints, cached)
+
+    async def _load_shield(self, mints: list[str]) -> dict[str, Any]:
+        """Fetch shield warnings, through the coalescer if enabled."""
+        if self.shield_coalescer is not None:
+            return await self.shield_coalescer.load(mints)
+        return await self._fetch_shield(mints)
+
+    async def _refresh_shield(self, cache: ShieldCache, mints: list[str]) -> None:
+        """Re-fetch stale cached mints, keeping the old entries on failure."""
+        try:
+            cache.store(mints, await self._load_shield(mints))
+        except Exception as e:
+            logger.debug("Shield cache refresh failed: %s", e)
+        finally:
+            cache.end_refresh(mints)
+
+    async def _shield_request(self, mints: list[str]) -> Response:
+        """Send a shield request for `mints`."""
         params = {"mints": ",".join(mints)}
         url = f"{self.base_url}/ultra/v1/shield"
-        response = await self.client.get(
-            url, params=params, headers=self._get_headers()
+        return await self._request_shared(
+            "shield", "GET", url, params=params, headers=self._get_headers()
+        )
+
+    async def _fetch_shield(self, mints: list[str]) -> dict[str, Any]:
+        """Send a shield request for `mints` and decode the response."""
+        response = await self._shield_request(mints)
+        return await self._decode_json(response)  # type: ignore[no-any-return]
+
+    def order_many(
+        self,
+        requests: Iterable[UltraOrderRequest],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> AsyncIterator[BatchResult[UltraOrderRequest, dict[str, Any]]]:
+        """
+        Get orders for many requests with bounded concurrency.
+
+        Args:
+            requests (Iterable[UltraOrderRequest]): The order requests; may
+                be a lazy iterable.
+            concurrency (int): Maximum number of requests in flight.
+
+        Returns:
+            Async iterator of BatchResults in completion order. Failed
+            requests yield a result with `error` set instead of raising.
+        """
+        return run_bounded(requests, lambda request: self.order(request), concurrency)
+
+    def balances_many(
+        self,
+        addresses: Iterable[str],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> AsyncIterator[BatchResult[str, dict[str, Any]]]:
+        """
+        Get token balances of many accounts with bounded concurrency.
+
+        Args:
+            addresses (Iterable[str]): Account public keys; may be a lazy
+                iterable.
+            concurrency (int): Maximum number of requests in flight.
+
+        Returns:
+            Async iterator of BatchResults in completion order. Failed
+            requests yield a result with `error` set instead of raising.
+        """
+        return run_bounded(
+            addresses, lambda address: self.balances(address), concurrency
+        )
+
+    def shield_many(
+        self,
+        mints: Sequence[str],
+        chunk_size: int = DEFAULT_SHIELD_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> AsyncIterator[BatchResult[list[str], dict[str, Any]]]:
+        """
+        Get token warnings for many mints, `chunk_size` mints per request,
+        with bounded concurrency.
+
+        Args:
+            mints (Sequence[str]): Token mint addresses.
+            chunk_size (int): Maximum number of mints per request.
+            concurrency (int): Maximum number of requests in flight.
+
+        Returns:
+            Async iterator of BatchResults, one per chunk of mints, in
+            completion order. Failed requests yield a result with `error`
+            set instead of raising.
+        """
+        return run_bounded(
+            chunked(mints, chunk_size), lambda chunk: self.shield(chunk), concurrency
         )
-        response.raise_for_status()
 
-        return response.json()  # type: ignore[no-any-return]
+    async def close(self) -> None:
+        """Cancel pending shield lookups and close the client."""
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
+        if self.shield_coalescer is not None:
+            await self.shield_coalescer.close()
+        await super().close()
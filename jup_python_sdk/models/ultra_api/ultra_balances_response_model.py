@@ -0,0 +1,69 @@
+from collections.abc import Iterator
+from typing import Optional, Union
+
+from pydantic import BaseModel, ConfigDict, RootModel
+from pydantic.alias_generators import to_camel
+
+
+class TokenBalance(BaseModel):
+    """
+    Pydantic model for one token balance.
+
+    Attributes:
+        amount: Balance in the smallest unit.
+        ui_amount: Balance in whole tokens.
+        slot: Slot the balance was read at.
+        is_frozen: Whether the token account is frozen.
+    """
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    amount: str
+    ui_amount: float
+    slot: Optional[int] = None
+    is_frozen: bool = False
+
+
+class UltraBalancesResponse(RootModel[dict[str, TokenBalance]]):
+    """
+    Pydantic model for the balances of an account, keyed by mint address
+    ("SOL" for native SOL).
+    """
+
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "UltraBalancesResponse":
+        """
+        Parse balances from the JSON response body.
+
+        Args:
+            data: The raw response body, e.g. from
+                `client.balances(address, raw=True)`.
+
+        Returns:
+            The parsed balances.
+        """
+        return cls.model_validate_json(data)
+
+    def __getitem__(self, mint: str) -> TokenBalance:
+        return self.root[mint]
+
+    def __contains__(self, mint: object) -> bool:
+        return mint in self.root
+
+    def __iter__(self) -> Iterator[str]:  # type: ignore[override]
+        return iter(self.root)
+
+    def __len__(self) -> int:
+        return len(self.root)
+
+    def get(self, mint: str) -> Optional[TokenBalance]:
+        """
+        Get the balance of one token.
+
+        Args:
+            mint: Mint address, or "SOL" for native SOL.
+
+        Returns:
+            The balance, or None if the account holds none of the token.
+        """
+        return self.root.get(mint)
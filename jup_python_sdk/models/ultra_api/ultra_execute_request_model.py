@@ -1,6 +1,6 @@
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
 
@@ -13,6 +13,8 @@ class UltraExecuteRequest(BaseModel):
         request_id: The request ID returned from the order endpoint.
     """
 
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
     signed_transaction: str
     request_id: str
 
@@ -23,8 +25,7 @@ class UltraExecuteRequest(BaseModel):
         Returns:
             Dict with camelCase keys suitable for API requests.
         """
-        params = self.model_dump(exclude_none=True)
-
-        camel_case_params = {to_camel(key): value for key, value in params.items()}
-
-        return camel_case_params
+        return {
+            "signedTransaction": self.signed_transaction,
+            "requestId": self.request_id,
+        }
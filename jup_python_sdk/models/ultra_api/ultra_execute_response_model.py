@@ -0,0 +1,31 @@
+from typing import Optional
+
+from jup_python_sdk.models.ultra_api.ultra_response_model import UltraResponse
+
+
+class UltraExecuteResponse(UltraResponse):
+    """
+    Pydantic model for the result of executing an order.
+
+    Attributes:
+        status: "Success" or "Failed".
+        signature: Transaction signature, if the transaction was sent.
+        slot: Slot the transaction landed in.
+        code: Result code; 0 on success.
+        error: Error description when the execution failed.
+        input_amount_result: Input amount actually swapped.
+        output_amount_result: Output amount actually received.
+    """
+
+    status: str
+    signature: Optional[str] = None
+    slot: Optional[str] = None
+    code: Optional[int] = None
+    error: Optional[str] = None
+    input_amount_result: Optional[str] = None
+    output_amount_result: Optional[str] = None
+
+    @property
+    def is_success(self) -> bool:
+        """Whether the swap landed successfully."""
+        return self.status == "Success"
@@ -1,6 +1,8 @@
+from collections.abc import Collection
 from typing import Any, Optional
+from urllib.parse import quote_plus
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
 
@@ -17,6 +19,8 @@ class UltraOrderRequest(BaseModel):
         referral_fee: Optional referral fee in basis points (1 bp = 0.01%).
     """
 
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
     input_mint: str
     output_mint: str
     amount: int
@@ -31,8 +35,40 @@ class UltraOrderRequest(BaseModel):
         Returns:
             Dict with camelCase keys suitable for API requests.
         """
-        params = self.model_dump(exclude_none=True)
+        values = self.__dict__
+        return {
+            alias: values[name]
+            for name, alias in _FIELD_ALIASES
+            if values[name] is not None
+        }
+
+    def to_query_string(self, exclude: Collection[str] = ()) -> str:
+        """
+        Encode the model directly as a URL query string.
+
+        Args:
+            exclude: Field names to leave out.
+
+        Returns:
+            Query string with camelCase keys, without the leading "?".
+        """
+        values = self.__dict__
+        parts = []
+        for name, alias in _FIELD_ALIASES:
+            value = values[name]
+            if value is None or name in exclude:
+                continue
+            text = str(value)
+            # Mint addresses and amounts are ASCII alphanumeric and need no
+            # escaping; str.isalnum() alone also accepts non-ASCII letters
+            if not (text.isascii() and text.isalnum()):
+                text = quote_plus(text, safe="")
+            parts.append(f"{alias}={text}")
+        return "&".join(parts)
 
-        camel_case_params = {to_camel(key): value for key, value in params.items()}
 
-        return camel_case_params
+# Field name to camelCase alias, computed once instead of on every call
+_FIELD_ALIASES = tuple(
+    (name, field.alias or name)
+    for name, field in UltraOrderRequest.model_fields.items()
+)
@@ -0,0 +1,97 @@
+import time
+from typing import Any, Optional
+
+from pydantic import PrivateAttr
+
+from jup_python_sdk.models.ultra_api.ultra_response_model import UltraResponse
+
+
+class UltraOrderResponse(UltraResponse):
+    """
+    Pydantic model for an order returned by the Jupiter Ultra API.
+
+    The route plan is not parsed up front: reading `request_id` and
+    `transaction` costs the same for a one-hop and a ten-hop route.
+
+    Attributes:
+        request_id: ID to pass to the execute endpoint.
+        transaction: Base64-encoded unsigned transaction, or None if the
+            order cannot be filled (e.g. no taker or insufficient funds).
+        input_mint: Mint address of the input token.
+        output_mint: Mint address of the output token.
+        in_amount: Input amount in the smallest unit.
+        out_amount: Quoted output amount in the smallest unit.
+        other_amount_threshold: Minimum output after slippage.
+        slippage_bps: Slippage tolerance in basis points.
+        price_impact_pct: Price impact as a decimal string.
+        swap_type: Execution venue, e.g. "aggregator" or "rfq".
+        gasless: Whether Jupiter pays the transaction fee.
+        taker: Public key of the taker.
+        expire_at: Expiry of RFQ quotes, as a unix timestamp string.
+        error_code: Error code when no transaction could be built.
+        error_message: Human-readable reason when no transaction could be
+            built.
+    """
+
+    request_id: str
+    transaction: Optional[str] = None
+    input_mint: Optional[str] = None
+    output_mint: Optional[str] = None
+    in_amount: Optional[str] = None
+    out_amount: Optional[str] = None
+    other_amount_threshold: Optional[str] = None
+    slippage_bps: Optional[int] = None
+    price_impact_pct: Optional[str] = None
+    swap_type: Optional[str] = None
+    gasless: Optional[bool] = None
+    taker: Optional[str] = None
+    expire_at: Optional[str] = None
+    error_code: Optional[int] = None
+    error_message: Optional[str] = None
+
+    _received_at: float = PrivateAttr(default_factory=time.monotonic)
+
+    @property
+    def received_at(self) -> float:
+        """When the order was parsed, on the `time.monotonic()` clock."""
+        return self._received_at
+
+    def age(self) -> float:
+        """
+        Get the time since the order was received.
+
+        Returns:
+            Age of the quote in seconds.
+        """
+        return time.monotonic() - self._received_at
+
+    def is_stale(self, max_age: float) -> bool:
+        """
+        Check whether the order is too old to execute.
+
+        Args:
+            max_age: Maximum quote age in seconds.
+
+        Returns:
+            True if the quote is older than `max_age` or its RFQ expiry has
+            passed.
+        """
+        if self.age() > max_age:
+            return True
+        if self.expire_at is None:
+            return False
+        try:
+            return float(self.expire_at) <= time.time()
+        except ValueError:
+            return False
+
+    @property
+    def route_plan(self) -> list[dict[str, Any]]:
+        """
+        The route plan, decoded from the response body on first access.
+
+        Returns:
+            List of route steps as dicts with camelCase keys.
+        """
+        route_plan: list[dict[str, Any]] = self.to_dict().get("routePlan") or []
+        return route_plan
@@ -0,0 +1,98 @@
+from typing import Optional
+
+from jup_python_sdk.models.ultra_api.ultra_order_request_model import (
+    UltraOrderRequest,
+)
+
+
+class OrderTemplate:
+    """
+    Pre-encoded order parameters for quoting the same pair, taker and
+    referral settings repeatedly with different amounts.
+
+    The fixed query parameters are URL-encoded once and the full URL prefix
+    is cached per API base URL, so quoting an amount only appends it to a
+    string.
+    """
+
+    def __init__(self, request: UltraOrderRequest):
+        """
+        Initialize the template.
+
+        Args:
+            request: An order request carrying the fixed parameters. Its
+                `amount` is ignored.
+        """
+        self.request = request
+        self.query_prefix = request.to_query_string(exclude=("amount",))
+        self._url_prefixes: dict[str, str] = {}
+
+    @classmethod
+    def for_pair(
+        cls,
+        input_mint: str,
+        output_mint: str,
+        taker: Optional[str] = None,
+        referral_account: Optional[str] = None,
+        referral_fee: Optional[int] = None,
+    ) -> "OrderTemplate":
+        """
+        Build a template without a sample amount.
+
+        Args:
+            input_mint: Mint address of the input token.
+            output_mint: Mint address of the output token.
+            taker: Optional public key of the taker.
+            referral_account: Optional referral account address.
+            referral_fee: Optional referral fee in basis points.
+
+        Returns:
+            The template.
+        """
+        return cls(
+            UltraOrderRequest(
+                input_mint=input_mint,
+                output_mint=output_mint,
+                amount=0,
+                taker=taker,
+                referral_account=referral_account,
+                referral_fee=referral_fee,
+            )
+        )
+
+    def url_prefix(self, base_url: str) -> str:
+        """
+        Get the order URL up to, but excluding, the amount value.
+
+        Args:
+            base_url: API base URL, e.g. "https://lite-api.jup.ag".
+
+        Returns:
+            URL ending in "amount=".
+        """
+        prefix = self._url_prefixes.get(base_url)
+        if prefix is None:
+            separator = "&" if self.query_prefix else ""
+            prefix = f"{base_url}/ultra/v1/order?{self.query_prefix}{separator}amount="
+            self._url_prefixes[base_url] = prefix
+        return prefix
+
+    def to_request(self, amount: int) -> UltraOrderRequest:
+        """
+        Build the equivalent UltraOrderRequest for an amount.
+
+        Args:
+            amount: Amount to swap in the smallest unit.
+
+        Returns:
+            The order request.
+        """
+        request = self.request
+        return UltraOrderRequest(
+            input_mint=request.input_mint,
+            output_mint=request.output_mint,
+            amount=amount,
+            taker=request.taker,
+            referral_account=request.referral_account,
+            referral_fee=request.referral_fee,
+        )
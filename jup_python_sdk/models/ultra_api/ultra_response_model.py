@@ -0,0 +1,70 @@
+import json
+from typing import Any, Optional, TypeVar, Union
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from pydantic.alias_generators import to_camel
+
+from jup_python_sdk.transport.json_codec import JsonCodec
+
+ResponseT = TypeVar("ResponseT", bound="UltraResponse")
+
+
+class UltraResponse(BaseModel):
+    """
+    Base model for Ultra API responses.
+
+    Only the declared fields are parsed from the JSON body; everything else
+    is skipped by the parser and only decoded if `to_dict()` is called.
+    """
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        extra="ignore",
+        coerce_numbers_to_str=True,
+    )
+
+    _raw: bytes = PrivateAttr(default=b"")
+    _decoded: Optional[dict[str, Any]] = PrivateAttr(default=None)
+    _codec: Optional[JsonCodec] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_json(
+        cls: type[ResponseT],
+        data: Union[bytes, str],
+        codec: Optional[JsonCodec] = None,
+    ) -> ResponseT:
+        """
+        Parse a response from its JSON body.
+
+        Args:
+            data: The raw response body, e.g. from `client.order(..., raw=True)`.
+            codec: Optional JsonCodec used by `to_dict()`, e.g. the client's
+                `json_codec`. Defaults to the standard library.
+
+        Returns:
+            The parsed response model.
+        """
+        model = cls.model_validate_json(data)
+        model._raw = data.encode() if isinstance(data, str) else data
+        model._codec = codec
+        return model
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Decode the complete response body, including fields the model does
+        not declare. The result is cached.
+
+        Returns:
+            Dict with the API's camelCase keys.
+        """
+        if self._decoded is None:
+            if self._raw:
+                codec = self._codec
+                if codec is None:
+                    self._decoded = json.loads(self._raw)
+                else:
+                    self._decoded = codec.loads(self._raw)
+            else:
+                self._decoded = self.model_dump(by_alias=True, exclude_none=True)
+        return self._decoded
@@ -0,0 +1,56 @@
+from typing import Optional, Union
+
+from pydantic import BaseModel
+
+
+class ShieldWarning(BaseModel):
+    """
+    Pydantic model for one token warning.
+
+    Attributes:
+        type: Warning type, e.g. "NOT_VERIFIED" or "HAS_FREEZE_AUTHORITY".
+        message: Human-readable description.
+        severity: "info", "warning" or "critical", if given.
+    """
+
+    type: str
+    message: str
+    severity: Optional[str] = None
+
+
+class UltraShieldResponse(BaseModel):
+    """
+    Pydantic model for token warnings returned by the shield endpoint.
+
+    Attributes:
+        warnings: Warnings keyed by mint address. Mints without warnings may
+            be absent.
+    """
+
+    warnings: dict[str, list[ShieldWarning]] = {}
+
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "UltraShieldResponse":
+        """
+        Parse shield results from the JSON response body.
+
+        Args:
+            data: The raw response body, e.g. from
+                `client.shield(mints, raw=True)`.
+
+        Returns:
+            The parsed shield results.
+        """
+        return cls.model_validate_json(data)
+
+    def warnings_for(self, mint: str) -> list[ShieldWarning]:
+        """
+        Get the warnings for one mint.
+
+        Args:
+            mint: Mint address.
+
+        Returns:
+            The mint's warnings, empty if there are none.
+        """
+        return self.warnings.get(mint, [])
@@ -0,0 +1,130 @@
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Optional, Union
+
+from solders.solders import Keypair, Pubkey
+
+from jup_python_sdk.signing.signer import Signer
+
+
+def _pubkey_bytes(pubkey: Union[Pubkey, str, bytes]) -> bytes:
+    if isinstance(pubkey, bytes):
+        return pubkey
+    if isinstance(pubkey, str):
+        pubkey = Pubkey.from_string(pubkey)
+    return bytes(pubkey)
+
+
+class Keyring(Signer):
+    """
+    Signer holding many wallets, indexed by pubkey.
+
+    When signing, every required signer of a transaction that is held in the
+    keyring signs it in a single pass, so one client (and one HTTP session)
+    can trade for many wallets. Lookups are dictionary lookups on raw pubkey
+    bytes; the index is replaced copy-on-write, so signing never takes a lock.
+    """
+
+    def __init__(self, signers: Iterable[Union[Signer, Keypair]] = ()):
+        """
+        Initialize the keyring.
+
+        Args:
+            signers: Initial wallets, as keypairs or single-key signers.
+        """
+        super().__init__()
+        self._keys: dict[bytes, Keypair] = {}
+        self._write_lock = threading.Lock()
+        for signer in signers:
+            self.add(signer)
+
+    def _load_keypair(self) -> Keypair:
+        keys = self._keys
+        if len(keys) != 1:
+            raise ValueError(
+                f"Keyring holds {len(keys)} wallets; a single keypair is "
+                "only available when it holds exactly one"
+            )
+        return next(iter(keys.values()))
+
+    def add(self, signer: Union[Signer, Keypair]) -> Pubkey:
+        """
+        Add a wallet to the keyring.
+
+        Args:
+            signer: Keypair or single-key signer to add.
+
+        Returns:
+            The pubkey of the added wallet.
+        """
+        keypair = signer.keypair if isinstance(signer, Signer) else signer
+        pubkey = keypair.pubkey()
+        with self._write_lock:
+            keys = dict(self._keys)
+            keys[bytes(pubkey)] = keypair
+            self._keys = keys
+        return pubkey
+
+    def remove(self, pubkey: Union[Pubkey, str, bytes]) -> None:
+        """
+        Remove a wallet from the keyring.
+
+        Args:
+            pubkey: Pubkey of the wallet, as a Pubkey, base58 string or bytes.
+
+        Raises:
+            KeyError: If the wallet is not in the keyring.
+        """
+        key = _pubkey_bytes(pubkey)
+        with self._write_lock:
+            keys = dict(self._keys)
+            del keys[key]
+            self._keys = keys
+
+    def get(self, pubkey: Union[Pubkey, str, bytes]) -> Optional[Keypair]:
+        """
+        Look up the keypair for a pubkey.
+
+        Args:
+            pubkey: Pubkey of the wallet, as a Pubkey, base58 string or bytes.
+
+        Returns:
+            The keypair, or None if the wallet is not in the keyring.
+        """
+        return self._keys.get(_pubkey_bytes(pubkey))
+
+    @property
+    def pubkeys(self) -> list[Pubkey]:
+        """Pubkeys of all wallets in the keyring."""
+        return [keypair.pubkey() for keypair in self._keys.values()]
+
+    @property
+    def keypair(self) -> Keypair:
+        """The only keypair in the keyring."""
+        return self._load_keypair()
+
+    @property
+    def pubkey(self) -> Pubkey:
+        """The pubkey of the only keypair in the keyring."""
+        return self._load_keypair().pubkey()
+
+    @property
+    def pubkey_str(self) -> str:
+        """The pubkey of the only keypair in the keyring, base58-encoded."""
+        return str(self.pubkey)
+
+    @property
+    def signing_keys(self) -> Mapping[bytes, Keypair]:
+        """Keypairs available for signing, indexed by raw pubkey bytes."""
+        return self._keys
+
+    def __contains__(self, pubkey: object) -> bool:
+        if not isinstance(pubkey, (Pubkey, str, bytes)):
+            return False
+        return _pubkey_bytes(pubkey) in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[Pubkey]:
+        return iter(self.pubkeys)
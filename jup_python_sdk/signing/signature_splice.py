@@ -0,0 +1,170 @@
+from collections.abc import Mapping
+from typing import Optional
+
+from solders.solders import Keypair
+
+SIGNATURE_LENGTH = 64
+PUBKEY_LENGTH = 32
+MESSAGE_HEADER_LENGTH = 3
+VERSION_PREFIX_MASK = 0x80
+
+
+def read_compact_u16(buffer: bytes, offset: int) -> tuple[int, int]:
+    """
+    Decode a Solana compact-u16 ("shortvec") length.
+
+    Args:
+        buffer: Serialized data.
+        offset: Offset of the first encoded byte.
+
+    Returns:
+        Tuple of the decoded value and the offset just past it.
+
+    Raises:
+        ValueError: If the encoding is truncated or longer than three bytes.
+    """
+    value = 0
+    for i in range(3):
+        if offset + i >= len(buffer):
+            raise ValueError("Truncated compact-u16")
+        byte = buffer[offset + i]
+        value |= (byte & 0x7F) << (7 * i)
+        if not byte & 0x80:
+            return value, offset + i + 1
+    raise ValueError("Invalid compact-u16")
+
+
+class TransactionLayout:
+    """
+    Byte offsets of the parts of a serialized transaction needed to sign it
+    without deserializing it.
+
+    Attributes:
+        signatures_offset: Offset of the first signature slot.
+        num_signatures: Number of signature slots.
+        message_offset: Offset of the serialized message.
+        account_keys_offset: Offset of the first static account key.
+    """
+
+    __slots__ = (
+        "signatures_offset",
+        "num_signatures",
+        "message_offset",
+        "account_keys_offset",
+    )
+
+    def __init__(
+        self,
+        signatures_offset: int,
+        num_signatures: int,
+        message_offset: int,
+        account_keys_offset: int,
+    ):
+        self.signatures_offset = signatures_offset
+        self.num_signatures = num_signatures
+        self.message_offset = message_offset
+        self.account_keys_offset = account_keys_offset
+
+    def signer_key(self, buffer: bytes, index: int) -> bytes:
+        """Return the pubkey bytes of the `index`-th required signer."""
+        start = self.account_keys_offset + index * PUBKEY_LENGTH
+        return buffer[start : start + PUBKEY_LENGTH]
+
+    def signature_offset(self, index: int) -> int:
+        """Return the offset of the `index`-th signature slot."""
+        return self.signatures_offset + index * SIGNATURE_LENGTH
+
+
+def parse_transaction_layout(transaction: bytes) -> Optional[TransactionLayout]:
+    """
+    Locate the signature slots, message and signer keys of a legacy or v0
+    transaction.
+
+    Args:
+        transaction: Serialized transaction.
+
+    Returns:
+        The layout, or None if the bytes do not look like a transaction whose
+        signature slots match its message header.
+    """
+    try:
+        num_signatures, signatures_offset = read_compact_u16(transaction, 0)
+        message_offset = signatures_offset + num_signatures * SIGNATURE_LENGTH
+        offset = message_offset
+        if offset >= len(transaction):
+            return None
+
+        prefix = transaction[offset]
+        if prefix & VERSION_PREFIX_MASK:
+            if prefix != VERSION_PREFIX_MASK:
+                # Only v0 messages are understood
+                return None
+            offset += 1
+
+        num_required_signatures = transaction[offset]
+        if num_required_signatures != num_signatures:
+            return None
+        offset += MESSAGE_HEADER_LENGTH
+
+        num_account_keys, offset = read_compact_u16(transaction, offset)
+        if num_account_keys < num_required_signatures:
+            return None
+        if offset + num_account_keys * PUBKEY_LENGTH > len(transaction):
+            return None
+    except (IndexError, ValueError):
+        return None
+
+    return TransactionLayout(signatures_offset, num_signatures, message_offset, offset)
+
+
+def splice_signatures(
+    transaction: bytes, signing_keys: Mapping[bytes, Keypair]
+) -> Optional[bytearray]:
+    """
+    Sign a serialized transaction by writing signatures straight into its
+    signature slots, without rebuilding a VersionedTransaction.
+
+    Every required signer found in `signing_keys` signs the message in a
+    single pass over the signer keys; other slots are left untouched.
+
+    Args:
+        transaction: Serialized unsigned (or partially signed) transaction.
+        signing_keys: Keypairs indexed by raw pubkey bytes.
+
+    Returns:
+        The signed transaction bytes, or None if the layout is unexpected or
+        none of the keypairs is a required signer, in which case callers
+        should fall back to the solders path.
+    """
+    layout = parse_transaction_layout(transaction)
+    if layout is None:
+        return None
+
+    signed: Optional[bytearray] = None
+    message: bytes = b""
+    for index in range(layout.num_signatures):
+        keypair = signing_keys.get(layout.signer_key(transaction, index))
+        if keypair is None:
+            continue
+        if signed is None:
+            message = transaction[layout.message_offset :]
+            signed = bytearray(transaction)
+        offset = layout.signature_offset(index)
+        signed[offset : offset + SIGNATURE_LENGTH] = bytes(
+            keypair.sign_message(message)
+        )
+    return signed
+
+
+def splice_signature(transaction: bytes, keypair: Keypair) -> Optional[bytearray]:
+    """
+    Sign a serialized transaction with a single keypair in place.
+
+    Args:
+        transaction: Serialized unsigned (or partially signed) transaction.
+        keypair: Keypair whose pubkey is one of the required signers.
+
+    Returns:
+        The signed transaction bytes, or None if the splice is not possible.
+    """
+    return splice_signatures(transaction, {bytes(keypair.pubkey()): keypair})
@@ -0,0 +1,186 @@
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Optional, Union
+
+import base58
+from solders.solders import Keypair, Pubkey
+
+
+def parse_private_key(pk_raw: str) -> bytes:
+    """
+    Parse a private key given as base58 or as a uint8 array.
+
+    Args:
+        pk_raw: Private key as a base58 string or a JSON uint8 array
+            such as the contents of a Solana CLI keypair file.
+
+    Returns:
+        Raw private key bytes.
+
+    Raises:
+        ValueError: If the key is in neither supported format.
+    """
+    pk_raw = pk_raw.strip()
+    if pk_raw.startswith("[") and pk_raw.endswith("]"):
+        try:
+            arr = json.loads(pk_raw)
+            if isinstance(arr, list) and all(
+                isinstance(x, int) and 0 <= x <= 255 for x in arr
+            ):
+                return bytes(arr)
+            else:
+                raise ValueError
+        except Exception as e:
+            raise ValueError(f"Invalid uint8-array private key format: {e}") from e
+    try:
+        return base58.b58decode(pk_raw)
+    except Exception as e:
+        raise ValueError(f"Invalid base58 private key format: {e}") from e
+
+
+class Signer(ABC):
+    """
+    Source of the keypair used to sign Jupiter transactions.
+
+    The keypair is resolved on first use and cached for the lifetime of the
+    signer, so key material is decoded once rather than once per signature.
+    """
+
+    def __init__(self) -> None:
+        self._keypair: Optional[Keypair] = None
+        self._pubkey: Optional[Pubkey] = None
+        self._pubkey_str: Optional[str] = None
+        self._signing_keys: Optional[dict[bytes, Keypair]] = None
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _load_keypair(self) -> Keypair:
+        """Load the keypair from the underlying source."""
+
+    def _resolve(self) -> Keypair:
+        """Load and cache the keypair and its public key."""
+        with self._lock:
+            if self._keypair is None:
+                keypair = self._load_keypair()
+                self._pubkey = keypair.pubkey()
+                self._pubkey_str = str(self._pubkey)
+                self._signing_keys = {bytes(self._pubkey): keypair}
+                self._keypair = keypair
+            return self._keypair
+
+    @property
+    def keypair(self) -> Keypair:
+        """The cached keypair, loaded on first access."""
+        keypair = self._keypair
+        if keypair is None:
+            keypair = self._resolve()
+        return keypair
+
+    @property
+    def pubkey(self) -> Pubkey:
+        """The cached public key of the keypair."""
+        if self._pubkey is None:
+            self._resolve()
+        return self._pubkey  # type: ignore[return-value]
+
+    @property
+    def pubkey_str(self) -> str:
+        """The cached public key as a base58-encoded string."""
+        if self._pubkey_str is None:
+            self._resolve()
+        return self._pubkey_str  # type: ignore[return-value]
+
+    @property
+    def signing_keys(self) -> Mapping[bytes, Keypair]:
+        """Keypairs available for signing, indexed by raw pubkey bytes."""
+        if self._signing_keys is None:
+            self._resolve()
+        return self._signing_keys  # type: ignore[return-value]
+
+
+class KeypairSigner(Signer):
+    """
+    Signer backed by an in-memory solders Keypair.
+    """
+
+    def __init__(self, keypair: Keypair):
+        """
+        Initialize the signer.
+
+        Args:
+            keypair: Keypair to sign with.
+        """
+        super().__init__()
+        self._source = keypair
+
+    def _load_keypair(self) -> Keypair:
+        return self._source
+
+
+class BytesSigner(Signer):
+    """
+    Signer backed by raw private key bytes.
+    """
+
+    def __init__(self, private_key: bytes):
+        """
+        Initialize the signer.
+
+        Args:
+            private_key: 64-byte Solana secret key.
+        """
+        super().__init__()
+        self._private_key = bytes(private_key)
+
+    def _load_keypair(self) -> Keypair:
+        return Keypair.from_bytes(self._private_key)
+
+
+class EnvVarSigner(Signer):
+    """
+    Signer that reads a base58 or uint8-array private key from an
+    environment variable.
+    """
+
+    def __init__(self, env_var: str = "PRIVATE_KEY"):
+        """
+        Initialize the signer.
+
+        Args:
+            env_var: Name of the environment variable holding the private key.
+                It is read on first use, not at construction time.
+        """
+        super().__init__()
+        self.env_var = env_var
+
+    def _load_private_key_bytes(self) -> bytes:
+        return parse_private_key(os.getenv(self.env_var, ""))
+
+    def _load_keypair(self) -> Keypair:
+        return Keypair.from_bytes(self._load_private_key_bytes())
+
+
+class FileSigner(Signer):
+    """
+    Signer that reads a private key from a file, such as a Solana CLI
+    ``id.json`` keypair file or a file containing a base58 key.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the signer.
+
+        Args:
+            path: Path to the key file. It is read on first use.
+        """
+        super().__init__()
+        self.path = Path(path).expanduser()
+
+    def _load_keypair(self) -> Keypair:
+        return Keypair.from_bytes(
+            parse_private_key(self.path.read_text(encoding="utf-8"))
+        )
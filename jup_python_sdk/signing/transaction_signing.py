@@ -0,0 +1,147 @@
+import base64
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Executor
+from typing import Optional
+
+from solders.message import to_bytes_versioned
+from solders.solders import Keypair, Pubkey, VersionedTransaction
+
+from jup_python_sdk.signing.signature_splice import (
+    parse_transaction_layout,
+    splice_signatures,
+)
+
+
+def sign_versioned_transaction(
+    versioned_transaction: VersionedTransaction,
+    signing_keys: Mapping[bytes, Keypair],
+) -> VersionedTransaction:
+    """
+    Sign a VersionedTransaction with every matching keypair.
+
+    Args:
+        versioned_transaction: VersionedTransaction to sign.
+        signing_keys: Keypairs indexed by raw pubkey bytes. Each one that is
+            among the transaction's required signers fills its slot; other
+            existing signatures are kept.
+
+    Returns:
+        Signed VersionedTransaction with signatures applied.
+
+    Raises:
+        ValueError: If none of the keypairs is a required signer.
+    """
+    message = versioned_transaction.message
+    num_required = message.header.num_required_signatures
+    message_bytes = to_bytes_versioned(message)
+
+    signatures = list(versioned_transaction.signatures)
+    signed_any = False
+    for index, account_key in enumerate(message.account_keys[:num_required]):
+        keypair = signing_keys.get(bytes(account_key))
+        if keypair is not None:
+            signatures[index] = keypair.sign_message(message_bytes)
+            signed_any = True
+
+    if not signed_any:
+        raise ValueError("No signing key matches the transaction's signers")
+
+    return VersionedTransaction.populate(message, signatures)
+
+
+def transaction_signers(transaction_base64: str) -> list[str]:
+    """
+    Get the required signers of a base64-encoded transaction.
+
+    Args:
+        transaction_base64: Base64-encoded transaction.
+
+    Returns:
+        Base58 public keys of the required signers, fee payer first.
+    """
+    transaction = base64.b64decode(transaction_base64)
+    layout = parse_transaction_layout(transaction)
+    if layout is None:
+        message = VersionedTransaction.from_bytes(transaction).message
+        keys = message.account_keys[: message.header.num_required_signatures]
+        return [str(key) for key in keys]
+    return [
+        str(Pubkey.from_bytes(layout.signer_key(transaction, index)))
+        for index in range(layout.num_signatures)
+    ]
+
+
+def sign_base64_transaction(
+    transaction_base64: str, signing_keys: Mapping[bytes, Keypair]
+) -> str:
+    """
+    Sign a base64-encoded transaction and re-encode it.
+
+    The signatures are spliced directly into the decoded bytes when the
+    layout is recognised; otherwise the transaction is rebuilt through
+    solders.
+
+    Args:
+        transaction_base64: Base64-encoded unsigned transaction.
+        signing_keys: Keypairs indexed by raw pubkey bytes.
+
+    Returns:
+        Base64-encoded signed transaction.
+    """
+    transaction_bytes = base64.b64decode(transaction_base64)
+
+    spliced = splice_signatures(transaction_bytes, signing_keys)
+    if spliced is not None:
+        return base64.b64encode(spliced).decode("utf-8")
+
+    versioned_transaction = VersionedTransaction.from_bytes(transaction_bytes)
+    signed = sign_versioned_transaction(versioned_transaction, signing_keys)
+    return base64.b64encode(bytes(signed)).decode("utf-8")
+
+
+def _sign_chunk(
+    transactions: list[str], signing_keys: Mapping[bytes, Keypair]
+) -> list[str]:
+    """Sign a chunk of transactions. Module-level so process pools can
+    pickle it."""
+    return [sign_base64_transaction(tx, signing_keys) for tx in transactions]
+
+
+def sign_base64_transactions(
+    transactions: Sequence[str],
+    signing_keys: Mapping[bytes, Keypair],
+    executor: Optional[Executor] = None,
+    chunk_size: int = 64,
+) -> list[str]:
+    """
+    Sign a batch of base64-encoded transactions.
+
+    Args:
+        transactions: Base64-encoded unsigned transactions.
+        signing_keys: Keypairs indexed by raw pubkey bytes.
+        executor: Optional thread or process pool. When given, the batch is
+            split into chunks of `chunk_size` that are signed in parallel.
+            Process pools give true parallelism; thread pools only help
+            where the underlying work releases the GIL.
+        chunk_size: Number of transactions submitted to the executor per task.
+
+    Returns:
+        Base64-encoded signed transactions, in input order.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    if executor is None or len(transactions) <= chunk_size:
+        return _sign_chunk(list(transactions), signing_keys)
+
+    # Hand workers a plain dict so any Mapping type pickles cleanly
+    keys = dict(signing_keys)
+    futures = [
+        executor.submit(_sign_chunk, list(transactions[i : i + chunk_size]), keys)
+        for i in range(0, len(transactions), chunk_size)
+    ]
+
+    signed: list[str] = []
+    for future in futures:
+        signed.extend(future.result())
+    return signed
@@ -0,0 +1,124 @@
+from typing import Any, Optional
+
+from curl_cffi import CurlHttpVersion, CurlMOpt, CurlOpt
+
+HTTP_VERSIONS: dict[str, CurlHttpVersion] = {
+    "1.1": CurlHttpVersion.V1_1,
+    "2": CurlHttpVersion.V2TLS,
+    "3": CurlHttpVersion.V3,
+    "3-only": CurlHttpVersion.V3ONLY,
+}
+
+
+class ConnectionOptions:
+    """
+    Connection pool, keep-alive and HTTP version settings for the curl_cffi
+    session behind a client.
+
+    HTTP/2 multiplexes concurrent requests over one TLS connection per host.
+    HTTP/3 (QUIC) is only used if the bundled libcurl was built with it;
+    "3" falls back to HTTP/2 or 1.1 when QUIC is unavailable, "3-only" does
+    not.
+    """
+
+    def __init__(
+        self,
+        http_version: Optional[str] = None,
+        max_connections_per_host: Optional[int] = None,
+        max_cached_connections: Optional[int] = None,
+        tcp_keepalive: bool = True,
+        tcp_keepalive_idle: int = 30,
+        tcp_keepalive_interval: int = 15,
+        max_idle_seconds: Optional[int] = None,
+        max_clients: Optional[int] = None,
+    ):
+        """
+        Initialize the connection options.
+
+        Args:
+            http_version: "1.1", "2", "3" or "3-only". Defaults to what the
+                impersonated browser negotiates (HTTP/2 for most).
+            max_connections_per_host: Async clients only: maximum number of
+                parallel connections to the API host. Further requests wait
+                for a free connection or share one over HTTP/2.
+            max_cached_connections: Maximum number of idle connections kept
+                open for reuse.
+            tcp_keepalive: Send TCP keep-alive probes on idle connections so
+                NATs and load balancers do not drop them silently.
+            tcp_keepalive_idle: Seconds of idleness before the first probe.
+            tcp_keepalive_interval: Seconds between probes.
+            max_idle_seconds: Do not reuse connections idle for longer than
+                this; libcurl defaults to 118 seconds.
+            max_clients: Async clients only: maximum number of requests in
+                flight at once. curl_cffi defaults to 10.
+        """
+        if http_version is not None and http_version not in HTTP_VERSIONS:
+            raise ValueError(
+                f"Unsupported http_version {http_version!r}, "
+                f"expected one of {sorted(HTTP_VERSIONS)}"
+            )
+        self.http_version = http_version
+        self.max_connections_per_host = max_connections_per_host
+        self.max_cached_connections = max_cached_connections
+        self.tcp_keepalive = tcp_keepalive
+        self.tcp_keepalive_idle = tcp_keepalive_idle
+        self.tcp_keepalive_interval = tcp_keepalive_interval
+        self.max_idle_seconds = max_idle_seconds
+        self.max_clients = max_clients
+
+    def curl_options(self) -> dict[CurlOpt, Any]:
+        """
+        Get the per-request curl options.
+
+        Returns:
+            Dict of CurlOpt values for the session's `curl_options`.
+        """
+        options: dict[CurlOpt, Any] = {}
+        if self.tcp_keepalive:
+            options[CurlOpt.TCP_KEEPALIVE] = 1
+            options[CurlOpt.TCP_KEEPIDLE] = self.tcp_keepalive_idle
+            options[CurlOpt.TCP_KEEPINTVL] = self.tcp_keepalive_interval
+        if self.max_cached_connections is not None:
+            options[CurlOpt.MAXCONNECTS] = self.max_cached_connections
+        if self.max_idle_seconds is not None:
+            options[CurlOpt.MAXAGE_CONN] = self.max_idle_seconds
+        return options
+
+    def multi_options(self) -> dict[CurlMOpt, int]:
+        """
+        Get the options for an async session's shared connection pool.
+
+        Returns:
+            Dict of CurlMOpt values to set on the session's AsyncCurl.
+        """
+        options: dict[CurlMOpt, int] = {}
+        if self.max_connections_per_host is not None:
+            options[CurlMOpt.MAX_HOST_CONNECTIONS] = self.max_connections_per_host
+        if self.max_cached_connections is not None:
+            options[CurlMOpt.MAXCONNECTS] = self.max_cached_connections
+        return options
+
+    def apply(
+        self, session_kwargs: dict[str, Any], is_async: bool = False
+    ) -> dict[str, Any]:
+        """
+        Merge these options into curl_cffi session kwargs. Values already
+        present in `session_kwargs` take precedence.
+
+        Args:
+            session_kwargs: Session kwargs supplied by the caller.
+            is_async: Whether the kwargs are for an AsyncSession.
+
+        Returns:
+            A new kwargs dict.
+        """
+        kwargs = dict(session_kwargs)
+        if self.http_version is not None:
+            kwargs.setdefault("http_version", HTTP_VERSIONS[self.http_version])
+        kwargs["curl_options"] = {
+            **self.curl_options(),
+            **(kwargs.get("curl_options") or {}),
+        }
+        if is_async and self.max_clients is not None:
+            kwargs.setdefault("max_clients", self.max_clients)
+        return kwargs
@@ -0,0 +1,107 @@
+import time
+from typing import Callable, Optional, Union
+
+# Share of an order_and_execute budget kept back for execute by default.
+DEFAULT_EXECUTE_SHARE = 0.5
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when an operation's time budget runs out."""
+
+
+class StaleQuoteError(TimeoutError):
+    """Raised when an order is too old to execute and cannot be requoted."""
+
+
+class Deadline:
+    """
+    Absolute point in time by which a multi-request operation must finish.
+
+    Each request made under the deadline gets the remaining budget as its
+    timeout, and retries are only scheduled if they can start before the
+    deadline, so the operation as a whole never overruns its budget.
+    """
+
+    def __init__(self, budget: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the deadline.
+
+        Args:
+            budget: Seconds from now until the deadline.
+            clock: Monotonic clock returning seconds.
+
+        Raises:
+            ValueError: If `budget` is not positive.
+        """
+        if budget <= 0:
+            raise ValueError("budget must be positive")
+        self.budget = budget
+        self._clock = clock
+        self.expires_at = clock() + budget
+
+    def remaining(self) -> float:
+        """
+        Get the time left.
+
+        Returns:
+            Seconds until the deadline, 0 if it has passed.
+        """
+        return max(0.0, self.expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self._clock() >= self.expires_at
+
+    def timeout(self, cap: Optional[float] = None) -> float:
+        """
+        Get the timeout for the next call.
+
+        Args:
+            cap: Optional upper bound, e.g. a per-call timeout.
+
+        Returns:
+            Seconds the next call may take.
+
+        Raises:
+            DeadlineExceeded: If the deadline has passed.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Deadline of {self.budget} seconds exceeded")
+        return remaining if cap is None else min(remaining, cap)
+
+    def reserve(self, seconds: float) -> "Deadline":
+        """
+        Get an earlier deadline that keeps time back for a later step.
+
+        Args:
+            seconds: Time to keep back from the end of this deadline.
+
+        Returns:
+            A deadline `seconds` before this one, on the same clock.
+
+        Raises:
+            DeadlineExceeded: If less than `seconds` is left.
+        """
+        remaining = self.remaining() - seconds
+        if remaining <= 0:
+            raise DeadlineExceeded(
+                f"Less than {seconds} seconds left of a {self.budget} second deadline"
+            )
+        return Deadline(remaining, self._clock)
+
+
+def as_deadline(deadline: Union[float, Deadline, None]) -> Optional[Deadline]:
+    """
+    Accept a deadline or a budget in seconds.
+
+    Args:
+        deadline: A Deadline, seconds from now, or None.
+
+    Returns:
+        The deadline, a new one for a number of seconds, or None.
+    """
+    if deadline is None or isinstance(deadline, Deadline):
+        return deadline
+    return Deadline(deadline)
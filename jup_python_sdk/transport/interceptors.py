@@ -0,0 +1,139 @@
+from collections.abc import Awaitable, Sequence
+from typing import Any, Callable, Optional
+
+from curl_cffi import requests
+
+from jup_python_sdk.transport.deadline import Deadline
+
+Handler = Callable[["RequestCall"], requests.Response]
+AsyncHandler = Callable[["RequestCall"], Awaitable[requests.Response]]
+
+
+class RequestCall:
+    """
+    One API call as seen by interceptors.
+
+    Interceptors may rewrite any attribute before passing the call on,
+    e.g. add headers to `kwargs["headers"]` or point `url` elsewhere.
+
+    Attributes:
+        endpoint: Endpoint name, e.g. "order".
+        method: HTTP method, "GET" or "POST".
+        url: Request URL.
+        kwargs: Keyword arguments for the curl_cffi request.
+        deadline: Deadline bounding the call, if any.
+    """
+
+    __slots__ = ("endpoint", "method", "url", "kwargs", "deadline")
+
+    def __init__(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        kwargs: dict[str, Any],
+        deadline: Optional[Deadline] = None,
+    ):
+        self.endpoint = endpoint
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+        self.deadline = deadline
+
+    def __repr__(self) -> str:
+        return f"RequestCall({self.endpoint!r}, {self.method} {self.url})"
+
+
+class Interceptor:
+    """
+    Middleware wrapped around every call a synchronous client makes.
+
+    Subclasses override intercept() and call `proceed(call)` to continue
+    down the chain; the innermost step sends the request with the client's
+    retry policy and rate limiter. An interceptor can also return a
+    response without proceeding, e.g. from a cache, or proceed more than
+    once.
+    """
+
+    def intercept(self, call: RequestCall, proceed: Handler) -> requests.Response:
+        """
+        Handle a call.
+
+        Args:
+            call: The call to make.
+            proceed: The rest of the chain.
+
+        Returns:
+            The response for the call.
+        """
+        return proceed(call)
+
+
+class AsyncInterceptor:
+    """
+    Middleware wrapped around every call an asynchronous client makes.
+
+    The asynchronous counterpart of Interceptor: intercept() is a
+    coroutine and `proceed(call)` must be awaited.
+    """
+
+    async def intercept(
+        self, call: RequestCall, proceed: AsyncHandler
+    ) -> requests.Response:
+        """
+        Handle a call.
+
+        Args:
+            call: The call to make.
+            proceed: The rest of the chain.
+
+        Returns:
+            The response for the call.
+        """
+        return await proceed(call)
+
+
+def build_chain(interceptors: Sequence[Interceptor], last: Handler) -> Handler:
+    """
+    Compose interceptors around a final handler, first one outermost.
+
+    Args:
+        interceptors: The interceptors in the order they see a call.
+        last: Handler sending the request.
+
+    Returns:
+        A handler running the whole chain.
+    """
+    handler = last
+    for interceptor in reversed(interceptors):
+        handler = _bind(interceptor, handler)
+    return handler
+
+
+def build_async_chain(
+    interceptors: Sequence[AsyncInterceptor], last: AsyncHandler
+) -> AsyncHandler:
+    """
+    Compose async interceptors around a final handler, first one outermost.
+
+    Args:
+        interceptors: The interceptors in the order they see a call.
+        last: Coroutine function sending the request.
+
+    Returns:
+        A coroutine function running the whole chain.
+    """
+    handler = last
+    for interceptor in reversed(interceptors):
+        handler = _bind_async(interceptor, handler)
+    return handler
+
+
+def _bind(interceptor: Interceptor, proceed: Handler) -> Handler:
+    intercept = interceptor.intercept
+    return lambda call: intercept(call, proceed)
+
+
+def _bind_async(interceptor: AsyncInterceptor, proceed: AsyncHandler) -> AsyncHandler:
+    intercept = interceptor.intercept
+    return lambda call: intercept(call, proceed)
@@ -0,0 +1,116 @@
+import json
+from typing import Any, Union
+
+
+class JsonCodec:
+    """
+    JSON encoder/decoder used by the clients for request bodies and
+    responses. This base implementation uses the standard library.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode a value as compact UTF-8 JSON.
+
+        Args:
+            obj: The value to encode.
+
+        Returns:
+            The encoded JSON bytes.
+        """
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: JSON bytes or text.
+
+        Returns:
+            The decoded value.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        encoded: bytes = self._dumps(obj)
+        return encoded
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def __reduce__(self) -> tuple[type["MsgspecCodec"], tuple[()]]:
+        # Rebuilt on unpickling, e.g. in a ProcessPoolExecutor worker
+        return (type(self), ())
+
+    def dumps(self, obj: Any) -> bytes:
+        encoded: bytes = self._encoder.encode(obj)
+        return encoded
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+
+_CODECS: dict[str, type[JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JsonCodec,
+}
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """
+    Get a JSON codec by name.
+
+    Args:
+        name: "orjson", "msgspec", "json", or "auto" for the fastest
+            installed library (orjson, then msgspec, then the standard
+            library).
+
+    Returns:
+        A JsonCodec instance.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the requested library is not installed.
+    """
+    if name != "auto":
+        if name not in _CODECS:
+            raise ValueError(
+                f"Unknown JSON codec {name!r}, expected one of "
+                f"{sorted(_CODECS)} or 'auto'"
+            )
+        return _CODECS[name]()
+
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return JsonCodec()
@@ -0,0 +1,321 @@
+import threading
+from collections.abc import Sequence
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+# Sub-buckets per power of two; bounds the relative error of a recorded
+# latency to 1/128 (< 0.8%) at any magnitude.
+_SUB_BUCKET_BITS = 7
+_MICROSECONDS = 1_000_000
+
+# Default `le` bounds of the Prometheus histogram, in seconds.
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.15,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+OUTCOMES = ("success", "error", "rate_limited")
+
+
+def _bucket_index(value: int) -> int:
+    shift = max(0, value.bit_length() - _SUB_BUCKET_BITS - 1)
+    return (shift << _SUB_BUCKET_BITS) + (value >> shift)
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    shift = max(0, (index >> _SUB_BUCKET_BITS) - 1)
+    mantissa = index - (shift << _SUB_BUCKET_BITS)
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class LatencyHistogram:
+    """
+    Log-linear (HDR-style) latency histogram.
+
+    Latencies are recorded in microseconds into buckets that are linear
+    within each power of two, so percentiles are accurate to under 1% from
+    microseconds to hours with a small, fixed cost per record.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """
+        Record one latency.
+
+        Args:
+            seconds: The latency in seconds.
+        """
+        index = _bucket_index(max(0, int(seconds * _MICROSECONDS)))
+        counts = self._counts
+        counts[index] = counts.get(index, 0) + 1
+        if not self.count or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.count += 1
+        self.sum += seconds
+
+    def percentile(self, q: float) -> float:
+        """
+        Get a latency percentile.
+
+        Args:
+            q: Percentile between 0 and 100, e.g. 99.
+
+        Returns:
+            The latency in seconds below which `q` percent of records fall,
+            or 0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, round(q / 100 * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                low, high = _bucket_bounds(index)
+                value = (low + high) / 2 / _MICROSECONDS
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def cumulative_counts(self, bounds: Sequence[float]) -> list[int]:
+        """
+        Count the records at or below each bound.
+
+        Records within the histogram's resolution of a bound may be counted
+        on either side of it.
+
+        Args:
+            bounds: Ascending upper bounds in seconds.
+
+        Returns:
+            The cumulative count for each bound.
+        """
+        limits = [int(bound * _MICROSECONDS) for bound in bounds]
+        cumulative = [0] * len(limits)
+        for index, count in self._counts.items():
+            low, _ = _bucket_bounds(index)
+            for i, limit in enumerate(limits):
+                if low <= limit:
+                    cumulative[i] += count
+        return cumulative
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            dict: count, sum, min, max, mean and p50/p90/p99/p999, with
+                latencies in seconds.
+        """
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+        }
+
+
+class EndpointMetrics:
+    """
+    Latency and outcome counters of one endpoint on one base URL.
+
+    Attributes:
+        latency: Histogram of every attempt's latency.
+        success: Attempts answered with a 2xx/3xx status.
+        error: Attempts failing in transport or with an HTTP error other
+            than 429.
+        rate_limited: Attempts answered with 429 Too Many Requests.
+    """
+
+    __slots__ = ("latency", "success", "error", "rate_limited")
+
+    def __init__(self) -> None:
+        """Initialize zeroed metrics."""
+        self.latency = LatencyHistogram()
+        self.success = 0
+        self.error = 0
+        self.rate_limited = 0
+
+
+class MetricsRegistry:
+    """
+    In-process metrics of every HTTP attempt a client makes.
+
+    Attempts are recorded per endpoint and base URL, so retries show up as
+    separate attempts. A registry can be shared between clients and is
+    safe to use from several threads. Read it with snapshot() or expose
+    render_prometheus() on a /metrics handler of your own.
+    """
+
+    def __init__(
+        self,
+        namespace: str = "jupiter",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            namespace: Prefix of the Prometheus metric names.
+            buckets: Ascending `le` bounds, in seconds, of the Prometheus
+                latency histogram. Percentiles in snapshot() do not depend
+                on these.
+        """
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._metrics: dict[tuple[str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        endpoint: str,
+        url: str,
+        seconds: float,
+        status_code: Optional[int],
+    ) -> None:
+        """
+        Record one HTTP attempt.
+
+        Args:
+            endpoint: Endpoint name, e.g. "order".
+            url: Request URL; only its scheme and host are used.
+            seconds: Time the attempt took.
+            status_code: Response status, or None if the attempt failed in
+                transport.
+        """
+        key = (endpoint, base_url_of(url))
+        with self._lock:
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = self._metrics[key] = EndpointMetrics()
+            metrics.latency.record(seconds)
+            if status_code is None or status_code >= 400:
+                if status_code == 429:
+                    metrics.rate_limited += 1
+                else:
+                    metrics.error += 1
+            else:
+                metrics.success += 1
+
+    def get(self, endpoint: str, base_url: str) -> Optional[EndpointMetrics]:
+        """
+        Get the metrics of one endpoint.
+
+        Args:
+            endpoint: Endpoint name, e.g. "order".
+            base_url: Scheme and host, e.g. "https://api.jup.ag".
+
+        Returns:
+            The endpoint's metrics, or None if nothing was recorded.
+        """
+        return self._metrics.get((endpoint, base_url))
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self._lock:
+            self._metrics.clear()
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Get the metrics as plain data.
+
+        Returns:
+            dict: Keyed by base URL then endpoint, each with success,
+                error and rate_limited counts and a latency summary, e.g.
+                `{"https://api.jup.ag": {"order": {"success": 3, ...}}}`.
+        """
+        result: dict[str, dict[str, dict[str, Any]]] = {}
+        with self._lock:
+            for (endpoint, base_url), metrics in sorted(self._metrics.items()):
+                result.setdefault(base_url, {})[endpoint] = {
+                    "success": metrics.success,
+                    "error": metrics.error,
+                    "rate_limited": metrics.rate_limited,
+                    "latency": metrics.latency.snapshot(),
+                }
+        return result
+
+    def render_prometheus(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: A `<namespace>_request_duration_seconds` histogram and a
+                `<namespace>_requests_total` counter labelled by endpoint,
+                base_url and outcome.
+        """
+        duration = f"{self.namespace}_request_duration_seconds"
+        total = f"{self.namespace}_requests_total"
+        histogram_lines = [
+            f"# HELP {duration} Latency of HTTP attempts to the Jupiter API.",
+            f"# TYPE {duration} histogram",
+        ]
+        counter_lines = [
+            f"# HELP {total} HTTP attempts to the Jupiter API by outcome.",
+            f"# TYPE {total} counter",
+        ]
+        with self._lock:
+            for (endpoint, base_url), metrics in sorted(self._metrics.items()):
+                labels = (
+                    f'endpoint="{_escape(endpoint)}",base_url="{_escape(base_url)}"'
+                )
+                latency = metrics.latency
+                cumulative = latency.cumulative_counts(self.buckets)
+                for bound, count in zip(self.buckets, cumulative):
+                    histogram_lines.append(
+                        f'{duration}_bucket{{{labels},le="{bound:g}"}} {count}'
+                    )
+                histogram_lines.append(
+                    f'{duration}_bucket{{{labels},le="+Inf"}} {latency.count}'
+                )
+                histogram_lines.append(f"{duration}_sum{{{labels}}} {latency.sum!r}")
+                histogram_lines.append(f"{duration}_count{{{labels}}} {latency.count}")
+                for outcome in OUTCOMES:
+                    counter_lines.append(
+                        f'{total}{{{labels},outcome="{outcome}"}} '
+                        f"{getattr(metrics, outcome)}"
+                    )
+        return "\n".join(histogram_lines + counter_lines) + "\n"
+
+
+def base_url_of(url: str) -> str:
+    """
+    Get the scheme and host of a URL.
+
+    Args:
+        url: Absolute URL.
+
+    Returns:
+        str: e.g. "https://api.jup.ag" for any URL on that host.
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,195 @@
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Optional
+
+from jup_python_sdk.transport.retry_policy import parse_retry_after
+
+# Conservative defaults per tier. lite-api.jup.ag (no API key) allows about
+# 60 requests per minute; keyed api.jup.ag plans start at 100 requests per
+# 10 seconds. Pass explicit values for higher plans.
+LITE_API_RATE = 1.0
+LITE_API_BURST = 10.0
+PRO_API_RATE = 10.0
+PRO_API_BURST = 50.0
+
+DEFAULT_ENDPOINT_WEIGHTS: Mapping[str, float] = {
+    "order": 1.0,
+    "execute": 1.0,
+    "balances": 1.0,
+    "shield": 1.0,
+}
+
+# Header values above this are absolute epoch timestamps, not deltas.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class RateLimiter:
+    """
+    Client-side token bucket shared by every task and thread using it.
+
+    Callers reserve tokens up front: when the bucket is empty the balance
+    goes negative and each caller sleeps until its reservation matures, so
+    bursts are queued in arrival order rather than rejected. The bucket also
+    tightens itself from `x-ratelimit-*` and `Retry-After` response headers,
+    which keeps several processes sharing one API key inside the server's
+    limits.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        endpoint_weights: Optional[Mapping[str, float]] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Sustained requests per second.
+            burst: Bucket capacity, i.e. requests allowed back-to-back.
+            endpoint_weights: Tokens consumed per endpoint. Endpoints not
+                listed cost 1 token.
+        """
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate and burst must be positive")
+        self.rate = rate
+        self.burst = burst
+        self.endpoint_weights = dict(
+            endpoint_weights
+            if endpoint_weights is not None
+            else DEFAULT_ENDPOINT_WEIGHTS
+        )
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_api_key(cls, api_key: Optional[str]) -> "RateLimiter":
+        """
+        Create a limiter tuned to the tier a client with `api_key` uses:
+        lite-api.jup.ag without a key, api.jup.ag with one.
+
+        Args:
+            api_key: The client's API key, if any.
+
+        Returns:
+            A new RateLimiter.
+        """
+        if api_key:
+            return cls(rate=PRO_API_RATE, burst=PRO_API_BURST)
+        return cls(rate=LITE_API_RATE, burst=LITE_API_BURST)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Reserve tokens for one request.
+
+        Args:
+            endpoint: Endpoint name, used to look up the request weight.
+
+        Returns:
+            Seconds the caller must wait before sending.
+        """
+        weight = self.endpoint_weights.get(endpoint, 1.0)
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= weight
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire_sync(self, endpoint: str) -> None:
+        """
+        Block the calling thread until a request to `endpoint` may be sent.
+
+        Args:
+            endpoint: Endpoint name.
+        """
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire(self, endpoint: str) -> None:
+        """
+        Wait until a request to `endpoint` may be sent, without blocking the
+        event loop.
+
+        Args:
+            endpoint: Endpoint name.
+        """
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop granting tokens for `seconds`, e.g. after a 429.
+
+        Args:
+            seconds: How long the server asked clients to back off.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+    def update_from_headers(
+        self, headers: Any, status_code: Optional[int] = None
+    ) -> None:
+        """
+        Adjust the bucket from rate-limit response headers.
+
+        `x-ratelimit-remaining` caps the local balance, since other clients
+        may share the same quota; a zero balance with `x-ratelimit-reset`,
+        or a 429 with `Retry-After`, pauses the bucket until the server's
+        window reopens.
+
+        Args:
+            headers: Response headers (any mapping with `get`), or None if
+                no response was received.
+            status_code: Response status code.
+        """
+        if headers is None:
+            return
+
+        if status_code == 429:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            self.pause(retry_after if retry_after is not None else 1.0 / self.rate)
+            return
+
+        remaining = _header_float(headers, "x-ratelimit-remaining")
+        if remaining is None:
+            return
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, remaining)
+
+        reset = _header_float(headers, "x-ratelimit-reset")
+        if remaining <= 0 and reset is not None:
+            if reset > _EPOCH_THRESHOLD:
+                reset -= time.time()
+            self.pause(max(0.0, reset))
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available (negative while callers are queued)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+def _header_float(headers: Any, name: str) -> Optional[float]:
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
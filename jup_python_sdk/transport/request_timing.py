@@ -0,0 +1,210 @@
+from collections import deque
+from typing import Any, Optional
+
+from curl_cffi import CurlInfo
+
+# Cumulative curl timestamps in microseconds since the transfer started.
+TIMING_INFOS = [
+    CurlInfo.QUEUE_TIME_T,
+    CurlInfo.NAMELOOKUP_TIME_T,
+    CurlInfo.CONNECT_TIME_T,
+    CurlInfo.APPCONNECT_TIME_T,
+    CurlInfo.PRETRANSFER_TIME_T,
+    CurlInfo.STARTTRANSFER_TIME_T,
+    CurlInfo.TOTAL_TIME_T,
+]
+
+_MICROSECONDS = 1_000_000
+
+
+class RequestTiming:
+    """
+    Where the time of one HTTP attempt went, from curl's timing info.
+
+    All durations are in seconds. Connection set-up phases are 0 when a
+    pooled connection was reused.
+
+    Attributes:
+        endpoint: Endpoint name, e.g. "order".
+        status_code: HTTP status code of the response.
+        queue: Time waiting for a free connection slot.
+        dns: DNS resolution.
+        connect: TCP connect.
+        tls: TLS handshake.
+        server: Time from sending the request to the first response byte.
+        transfer: Time receiving the response.
+        total: Whole attempt.
+    """
+
+    __slots__ = (
+        "endpoint",
+        "status_code",
+        "queue",
+        "dns",
+        "connect",
+        "tls",
+        "server",
+        "transfer",
+        "total",
+    )
+
+    def __init__(
+        self,
+        endpoint: str,
+        status_code: int,
+        queue: float = 0.0,
+        dns: float = 0.0,
+        connect: float = 0.0,
+        tls: float = 0.0,
+        server: float = 0.0,
+        transfer: float = 0.0,
+        total: float = 0.0,
+    ):
+        self.endpoint = endpoint
+        self.status_code = status_code
+        self.queue = queue
+        self.dns = dns
+        self.connect = connect
+        self.tls = tls
+        self.server = server
+        self.transfer = transfer
+        self.total = total
+
+    @classmethod
+    def from_response(cls, endpoint: str, response: Any) -> "RequestTiming":
+        """
+        Build the breakdown from a response's curl infos.
+
+        Args:
+            endpoint: Endpoint name.
+            response: A curl_cffi response from a session created with
+                `curl_infos=TIMING_INFOS`.
+
+        Returns:
+            The timing breakdown; phases curl did not report are 0.
+        """
+        infos: dict[Any, Any] = getattr(response, "infos", None) or {}
+
+        def point(info: CurlInfo) -> float:
+            value = infos.get(info)
+            return value / _MICROSECONDS if isinstance(value, int) else 0.0
+
+        # curl reports cumulative points; phases are the gaps between them
+        queue = point(CurlInfo.QUEUE_TIME_T)
+        dns = point(CurlInfo.NAMELOOKUP_TIME_T)
+        connect = point(CurlInfo.CONNECT_TIME_T)
+        tls = point(CurlInfo.APPCONNECT_TIME_T)
+        pretransfer = point(CurlInfo.PRETRANSFER_TIME_T)
+        first_byte = point(CurlInfo.STARTTRANSFER_TIME_T)
+        total = point(CurlInfo.TOTAL_TIME_T)
+        return cls(
+            endpoint,
+            getattr(response, "status_code", 0),
+            queue=queue,
+            dns=dns,
+            connect=max(0.0, connect - dns) if connect else 0.0,
+            tls=max(0.0, tls - connect) if tls else 0.0,
+            server=max(0.0, first_byte - pretransfer),
+            transfer=max(0.0, total - first_byte),
+            total=total,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Get the breakdown as a dict.
+
+        Returns:
+            dict: Every attribute by name.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        phases = ", ".join(
+            f"{name}={getattr(self, name):.6f}" for name in self.__slots__[2:]
+        )
+        return f"RequestTiming(endpoint={self.endpoint!r}, {phases})"
+
+
+class SwapTiming:
+    """
+    How long each phase of an order_and_execute call took, in seconds.
+
+    Attributes:
+        order: Getting the order(s), including any requotes.
+        sign: Signing the transaction(s).
+        execute: Executing the signed transaction.
+        total: The whole call.
+        requotes: Number of times a stale order was requoted.
+    """
+
+    __slots__ = ("order", "sign", "execute", "total", "requotes")
+
+    def __init__(
+        self,
+        order: float = 0.0,
+        sign: float = 0.0,
+        execute: float = 0.0,
+        total: float = 0.0,
+        requotes: int = 0,
+    ):
+        self.order = order
+        self.sign = sign
+        self.execute = execute
+        self.total = total
+        self.requotes = requotes
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Get the phase split as a dict.
+
+        Returns:
+            dict: Every attribute by name.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return (
+            f"SwapTiming(order={self.order:.6f}, sign={self.sign:.6f}, "
+            f"execute={self.execute:.6f}, total={self.total:.6f}, "
+            f"requotes={self.requotes})"
+        )
+
+
+class TimingRecorder:
+    """
+    Receives the timing of every request and swap made by a client.
+
+    The default implementation keeps the most recent timings in memory.
+    Override record_request() and record_swap() to forward them elsewhere,
+    e.g. to a metrics system; both are called on the request's thread or
+    event loop, so keep them cheap.
+    """
+
+    def __init__(self, maxlen: Optional[int] = 1000):
+        """
+        Initialize the recorder.
+
+        Args:
+            maxlen: Number of recent timings to keep of each kind, or None
+                to keep all.
+        """
+        self.requests: deque[RequestTiming] = deque(maxlen=maxlen)
+        self.swaps: deque[SwapTiming] = deque(maxlen=maxlen)
+
+    def record_request(self, timing: RequestTiming) -> None:
+        """
+        Record the timing of one HTTP attempt.
+
+        Args:
+            timing: The attempt's breakdown.
+        """
+        self.requests.append(timing)
+
+    def record_swap(self, timing: SwapTiming) -> None:
+        """
+        Record the phase split of one order_and_execute call.
+
+        Args:
+            timing: The call's phase split.
+        """
+        self.swaps.append(timing)
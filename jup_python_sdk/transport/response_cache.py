@@ -0,0 +1,345 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class TtlCache(Generic[KeyT, ValueT]):
+    """
+    Bounded, thread-safe cache whose entries expire after a TTL.
+
+    Entries younger than `ttl` are fresh. Entries aged between `ttl` and
+    `ttl + stale_ttl` are stale: they are still served, and the caller is
+    expected to refresh them in the background (stale-while-revalidate).
+    Older entries are dropped. When the cache holds `maxsize` entries the
+    least recently used one is evicted.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries.
+            ttl: Seconds an entry stays fresh.
+            stale_ttl: Seconds after `ttl` during which an entry is served
+                stale while being refreshed. 0 disables stale serving.
+            clock: Monotonic clock returning seconds.
+
+        Raises:
+            ValueError: If `maxsize` is less than 1 or a TTL is negative.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl < 0 or stale_ttl < 0:
+            raise ValueError("ttl and stale_ttl must not be negative")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: OrderedDict[KeyT, tuple[ValueT, float]] = OrderedDict()
+        self._refreshing: set[KeyT] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, key: KeyT) -> tuple[Optional[ValueT], bool, bool]:
+        """
+        Look up an entry, counting the hit or miss.
+
+        Args:
+            key: The entry key.
+
+        Returns:
+            tuple: (value, found, fresh). `found` is False on a miss;
+            `fresh` is False for a miss or a stale entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                age = self._clock() - stored_at
+                if age <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value, True, True
+                if age <= self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self.stale_hits += 1
+                    return value, True, False
+                del self._entries[key]
+            self.misses += 1
+            return None, False, False
+
+    def get(self, key: KeyT) -> Optional[ValueT]:
+        """
+        Get a fresh entry.
+
+        Args:
+            key: The entry key.
+
+        Returns:
+            The cached value, or None if it is missing or stale.
+        """
+        value, _, fresh = self.lookup(key)
+        return value if fresh else None
+
+    def set(self, key: KeyT, value: ValueT) -> None:
+        """
+        Store an entry, evicting the least recently used one if full.
+
+        Args:
+            key: The entry key.
+            value: The value to cache.
+        """
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key: KeyT, value: ValueT) -> None:
+        """Store an entry; the caller holds the lock."""
+        self._entries[key] = (value, self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: KeyT) -> None:
+        """
+        Drop an entry if present.
+
+        Args:
+            key: The entry key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def begin_refresh(self, keys: Iterable[KeyT]) -> list[KeyT]:
+        """
+        Claim stale keys for a background refresh.
+
+        Args:
+            keys: Keys the caller wants to refresh.
+
+        Returns:
+            The keys no other caller is already refreshing; pass them to
+            end_refresh() once the refresh finishes or fails.
+        """
+        with self._lock:
+            claimed = [key for key in keys if key not in self._refreshing]
+            self._refreshing.update(claimed)
+            return claimed
+
+    def end_refresh(self, keys: Iterable[KeyT]) -> None:
+        """
+        Release keys claimed with begin_refresh().
+
+        Args:
+            keys: The claimed keys.
+        """
+        with self._lock:
+            self._refreshing.difference_update(keys)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get the cache counters.
+
+        Returns:
+            dict: hits, stale_hits, misses, evictions and the current size.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ShieldCache(TtlCache[str, Optional[list[Any]]]):
+    """
+    Per-mint cache of shield warnings.
+
+    Values are a mint's warning list, or None when the server reported no
+    warnings for it, so clean mints are cached too. A lookup for several
+    mints is served from the cache for cached mints and only the rest are
+    requested.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: float = 300.0,
+        stale_ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the shield cache.
+
+        Args:
+            maxsize: Maximum number of mints cached.
+            ttl: Seconds a mint's warnings stay fresh.
+            stale_ttl: Seconds after `ttl` during which warnings are served
+                while being refreshed in the background.
+            clock: Monotonic clock returning seconds.
+        """
+        super().__init__(maxsize, ttl, stale_ttl, clock)
+
+    def partition(
+        self, mints: Iterable[str]
+    ) -> tuple[dict[str, Optional[list[Any]]], list[str], list[str]]:
+        """
+        Split mints into cached and missing ones.
+
+        Args:
+            mints: Token mint addresses.
+
+        Returns:
+            tuple: (cached, stale, missing), where `cached` maps every
+            cached mint, fresh or stale, to its warnings, `stale` lists the
+            cached mints due for a refresh, and `missing` the mints to
+            fetch.
+        """
+        cached: dict[str, Optional[list[Any]]] = {}
+        stale: list[str] = []
+        missing: list[str] = []
+        for mint in dict.fromkeys(mints):
+            value, found, fresh = self.lookup(mint)
+            if not found:
+                missing.append(mint)
+                continue
+            cached[mint] = value
+            if not fresh:
+                stale.append(mint)
+        return cached, stale, missing
+
+    def store(
+        self, mints: Iterable[str], response: dict[str, Any]
+    ) -> dict[str, Optional[list[Any]]]:
+        """
+        Cache the warnings of a shield response for the requested mints.
+
+        Args:
+            mints: The mints the response was requested for.
+            response: The decoded shield response.
+
+        Returns:
+            dict: The cached warnings per mint.
+        """
+        warnings = response.get("warnings") or {}
+        stored = {mint: warnings.get(mint) for mint in mints}
+        for mint, mint_warnings in stored.items():
+            self.set(mint, mint_warnings)
+        return stored
+
+    @staticmethod
+    def to_response(
+        mints: Iterable[str], cached: dict[str, Optional[list[Any]]]
+    ) -> dict[str, Any]:
+        """
+        Build a shield response for `mints` from cached warnings.
+
+        Args:
+            mints: The mints to include.
+            cached: Warnings per mint.
+
+        Returns:
+            dict: {"warnings": {...}} with an entry for each mint that has
+            warnings.
+        """
+        return {
+            "warnings": {
+                mint: cached[mint]
+                for mint in dict.fromkeys(mints)
+                if cached.get(mint) is not None
+            }
+        }
+
+
+class BalancesCache(TtlCache[str, dict[str, Any]]):
+    """
+    Short-lived per-address cache of token balances.
+
+    Meant for decision loops that check balances before every trade: the
+    TTL is kept short, and the Ultra clients invalidate the signers of a
+    transaction as soon as its execution succeeds, so a trade's own balance
+    changes are never hidden by the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the balances cache.
+
+        Args:
+            maxsize: Maximum number of addresses cached.
+            ttl: Seconds balances stay cached.
+            clock: Monotonic clock returning seconds.
+        """
+        super().__init__(maxsize, ttl, 0.0, clock)
+        self._generation = 0
+
+    def generation(self) -> int:
+        """
+        Get a token to pass to set_if_current() after fetching balances.
+
+        Returns:
+            A counter increased by every invalidation.
+        """
+        return self._generation
+
+    def set_if_current(
+        self, generation: int, address: str, balances: dict[str, Any]
+    ) -> None:
+        """
+        Cache balances unless an invalidation happened while fetching them.
+
+        Args:
+            generation: The value of generation() before the fetch.
+            address: The account public key.
+            balances: The decoded balances response.
+        """
+        with self._lock:
+            if generation == self._generation:
+                self._store(address, balances)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop an address's balances.
+
+        Args:
+            key: The account public key.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every address's balances; counters are kept."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
@@ -0,0 +1,266 @@
+import random
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from curl_cffi.const import CurlECode
+from curl_cffi.requests.exceptions import HTTPError, RequestException
+
+# Endpoints whose requests have no side effects and can be repeated freely.
+IDEMPOTENT_ENDPOINTS = frozenset({"order", "balances", "shield"})
+
+# Status codes worth retrying for idempotent endpoints.
+DEFAULT_RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Status codes proving the server rejected a request without processing it.
+# A 429 is answered by the rate limiter in front of the API.
+NOT_ACCEPTED_STATUSES = frozenset({429})
+
+# curl errors raised before any request bytes reach the server.
+NOT_SENT_CURL_CODES = frozenset(
+    {
+        CurlECode.COULDNT_RESOLVE_PROXY,
+        CurlECode.COULDNT_RESOLVE_HOST,
+        CurlECode.COULDNT_CONNECT,
+        CurlECode.SSL_CONNECT_ERROR,
+        CurlECode.QUIC_CONNECT_ERROR,
+    }
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date.
+
+    Returns:
+        Delay in seconds, or None if the value is missing or malformed.
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def error_status_code(error: BaseException) -> Optional[int]:
+    """
+    Get the HTTP status code carried by an HTTPError, if any.
+
+    Args:
+        error: Exception raised by a request.
+
+    Returns:
+        The response status code, or None for transport errors.
+    """
+    if isinstance(error, HTTPError):
+        status_code = getattr(error.response, "status_code", None)
+        if isinstance(status_code, int):
+            return status_code
+    return None
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of overall traffic, so retries cannot
+    multiply load while the API is struggling.
+
+    Every first attempt deposits `ratio` tokens and every retry withdraws
+    one. A small reserve that refills over time keeps low-traffic clients
+    able to retry. Safe to share between threads and clients.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        max_balance: float = 100.0,
+        initial_balance: float = 10.0,
+    ):
+        """
+        Initialize the retry budget.
+
+        Args:
+            ratio: Retries allowed per request, e.g. 0.2 allows one retry for
+                every five requests.
+            min_retries_per_second: Reserve refill rate, independent of
+                traffic.
+            max_balance: Maximum number of retries that can be banked.
+            initial_balance: Retries available before any traffic is seen.
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_balance = max_balance
+        self._balance = min(max_balance, initial_balance)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._balance = min(
+            self.max_balance, self._balance + elapsed * self.min_retries_per_second
+        )
+
+    def record_request(self) -> None:
+        """Deposit the retry allowance earned by one request."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """
+        Withdraw one retry.
+
+        Returns:
+            True if a retry is allowed, False if the budget is exhausted.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._balance < 1.0:
+                return False
+            self._balance -= 1.0
+            return True
+
+    @property
+    def balance(self) -> float:
+        """Retries currently available."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._balance
+
+
+class RetryPolicy:
+    """
+    Endpoint-aware retry rules with exponential backoff, full jitter,
+    Retry-After support and a shared retry budget.
+
+    Idempotent endpoints (`order`, `balances`, `shield`) are retried on
+    transport errors and on `retry_statuses`. `execute` is only retried when
+    the transaction provably never reached the API: connection set-up
+    failures and 429 responses. Timeouts and 5xx responses on `execute` are
+    ambiguous and are surfaced to the caller instead.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.1,
+        backoff_max: float = 5.0,
+        backoff_multiplier: float = 2.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 30.0,
+        budget: Optional[RetryBudget] = None,
+        idempotent_endpoints: Iterable[str] = IDEMPOTENT_ENDPOINTS,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts: Total attempts per call, including the first.
+            backoff_base: Delay before the first retry, in seconds.
+            backoff_max: Upper bound for a computed backoff delay.
+            backoff_multiplier: Growth factor between consecutive delays.
+            jitter: Use full jitter (uniform in [0, delay]) to spread out
+                retries from many clients.
+            retry_statuses: Status codes to retry for idempotent endpoints.
+            respect_retry_after: Wait as long as a Retry-After header asks.
+            max_retry_after: Give up instead of waiting longer than this for
+                a Retry-After delay.
+            budget: Retry budget, shareable between clients. Defaults to a
+                new RetryBudget.
+            idempotent_endpoints: Endpoint names that can be retried freely.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.backoff_multiplier = backoff_multiplier
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+        self.idempotent_endpoints = frozenset(idempotent_endpoints)
+
+    def is_retryable(self, endpoint: str, error: BaseException) -> bool:
+        """
+        Decide whether a failed call may be retried, ignoring attempt counts
+        and the budget.
+
+        Args:
+            endpoint: Endpoint name, e.g. "order" or "execute".
+            error: The exception raised by the attempt.
+
+        Returns:
+            True if the error is retryable for this endpoint.
+        """
+        if not isinstance(error, RequestException):
+            return False
+
+        status_code = error_status_code(error)
+        if endpoint in self.idempotent_endpoints:
+            if status_code is not None:
+                return status_code in self.retry_statuses
+            # Transport failure: connection reset, timeout, stream error, ...
+            return True
+
+        # Non-idempotent: only retry when the request was never accepted
+        if status_code is not None:
+            return status_code in NOT_ACCEPTED_STATUSES
+        return error.code in NOT_SENT_CURL_CODES
+
+    def next_delay(
+        self,
+        endpoint: str,
+        attempt: int,
+        error: BaseException,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt and for how long to
+        wait.
+
+        Args:
+            endpoint: Endpoint name, e.g. "order" or "execute".
+            attempt: Number of the attempt that just failed, starting at 1.
+            error: The exception raised by the attempt.
+            headers: Response headers, if a response was received.
+
+        Returns:
+            Seconds to wait before retrying, or None to give up.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(endpoint, error):
+            return None
+
+        delay = min(
+            self.backoff_max,
+            self.backoff_base * self.backoff_multiplier ** (attempt - 1),
+        )
+        if self.jitter:
+            delay = random.uniform(0, delay)  # noqa: S311
+
+        if self.respect_retry_after and headers is not None:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                delay = max(delay, retry_after)
+
+        if not self.budget.try_spend():
+            return None
+        return delay
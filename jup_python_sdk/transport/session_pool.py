@@ -0,0 +1,131 @@
+import queue
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+from curl_cffi import requests
+
+
+class SessionPool:
+    """
+    Checkout-based pool of curl_cffi sessions for sharing one sync client
+    between threads.
+
+    Each session owns one curl handle and its connections, and is used by
+    one thread at a time. Sessions are created on demand up to `size` and
+    handed out most-recently-used first, so a lightly loaded pool keeps
+    reusing the same warm connections.
+    """
+
+    def __init__(self, size: int, factory: Callable[[], requests.Session[Any]]):
+        """
+        Initialize the session pool.
+
+        Args:
+            size: Maximum number of sessions, i.e. concurrent requests.
+            factory: Creates a new session. Sessions must not use
+                thread-local curl handles.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self._factory = factory
+        self._idle: queue.LifoQueue[requests.Session[Any]] = queue.LifoQueue()
+        self._sessions: list[requests.Session[Any]] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self, timeout: Optional[float] = None) -> requests.Session[Any]:
+        """
+        Check out a session, creating one if the pool is not full.
+
+        Args:
+            timeout: Seconds to wait for a session when all are in use, or
+                None to wait indefinitely.
+
+        Returns:
+            A session for the caller's exclusive use until release().
+
+        Raises:
+            TimeoutError: If no session became available in time.
+            RuntimeError: If the pool is closed.
+        """
+        if self._closed:
+            raise RuntimeError("Session pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            create = len(self._sessions) < self.size
+            if create:
+                session = self._factory()
+                self._sessions.append(session)
+        if create:
+            return session
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No pooled session became available within {timeout} seconds"
+            ) from None
+
+    def try_acquire(self) -> Optional[requests.Session[Any]]:
+        """
+        Check out an idle session without waiting or creating one.
+
+        Returns:
+            An idle session, or None if there is none.
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return None
+
+    def release(self, session: requests.Session[Any]) -> None:
+        """
+        Return a checked-out session to the pool.
+
+        Args:
+            session: A session obtained from acquire() or try_acquire().
+        """
+        if self._closed:
+            session.close()
+        else:
+            self._idle.put(session)
+
+    @contextmanager
+    def session(
+        self, timeout: Optional[float] = None
+    ) -> Iterator[requests.Session[Any]]:
+        """
+        Check out a session for the duration of a `with` block.
+
+        Args:
+            timeout: Seconds to wait for a session when all are in use.
+
+        Yields:
+            A session for the caller's exclusive use.
+        """
+        session = self.acquire(timeout)
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    @property
+    def created(self) -> int:
+        """Number of sessions created so far."""
+        return len(self._sessions)
+
+    def close(self) -> None:
+        """Close every session; checked-out ones are closed on release."""
+        self._closed = True
+        while True:
+            session = self.try_acquire()
+            if session is None:
+                break
+            session.close()
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Hashable, Mapping
+from concurrent.futures import Future
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def request_key(
+    method: str, url: str, params: Optional[Mapping[str, Any]] = None
+) -> tuple[Hashable, ...]:
+    """
+    Build a single-flight key identifying a request.
+
+    Args:
+        method: HTTP method.
+        url: Request URL, including any query string.
+        params: Optional query parameters sent separately from the URL.
+
+    Returns:
+        A hashable key; identical requests get equal keys.
+    """
+    if not params:
+        return (method, url)
+    return (method, url, tuple(sorted(params.items())))
+
+
+class SingleFlight(Generic[T]):
+    """
+    Collapses identical concurrent calls from several threads into one.
+
+    The first caller for a key runs the call; callers arriving while it is
+    in flight wait and receive the same result or exception. Once the call
+    finishes the key is forgotten, so later calls run again. Only use this
+    for idempotent requests.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self._calls: dict[Hashable, Future[T]] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key: Hashable, call: Callable[[], T]) -> T:
+        """
+        Run `call`, or wait for an identical call already in flight.
+
+        Args:
+            key: Identifies identical calls, e.g. from request_key().
+            call: Function to run if no call for `key` is in flight.
+
+        Returns:
+            The result of the call that ran.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight(Generic[T]):
+    """
+    Collapses identical concurrent calls from several tasks into one.
+
+    The first caller for a key starts the call as a task; callers arriving
+    while it is in flight await the same task. A caller that is cancelled
+    does not cancel the call for the others. Once the call finishes the
+    key is forgotten, so later calls run again. Only use this for
+    idempotent requests.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self._calls: dict[Hashable, asyncio.Future[T]] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `call`, or await an identical call already in flight.
+
+        Args:
+            key: Identifies identical calls, e.g. from request_key().
+            call: Coroutine function to run if no call for `key` is in
+                flight.
+
+        Returns:
+            The result of the call that ran.
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: "asyncio.Future[T]") -> None:
+        """Drop a finished call, retrieving its exception if unobserved."""
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            future.exception()
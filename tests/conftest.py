@@ -0,0 +1,58 @@
+import base64
+import json
+from collections.abc import Callable
+from typing import Any, Optional
+
+import pytest
+from curl_cffi.requests import Headers, Response
+from solders.solders import Hash, Keypair, MessageV0, Signature, VersionedTransaction
+from solders.system_program import TransferParams, transfer
+
+
+def build_unsigned_transaction(
+    payer: Keypair, lamports: int = 1, *co_signers: Keypair
+) -> str:
+    """Build an unsigned base64 v0 transaction paid for by `payer` that
+    also moves lamports out of each co-signer."""
+    instructions = [
+        transfer(
+            TransferParams(
+                from_pubkey=source.pubkey(),
+                to_pubkey=Keypair().pubkey(),
+                lamports=lamports,
+            )
+        )
+        for source in (payer, *co_signers)
+    ]
+    message = MessageV0.try_compile(payer.pubkey(), instructions, [], Hash.new_unique())
+    transaction = VersionedTransaction.populate(
+        message, [Signature.default()] * (1 + len(co_signers))
+    )
+    return base64.b64encode(bytes(transaction)).decode("utf-8")
+
+
+@pytest.fixture(name="build_unsigned_transaction")
+def build_unsigned_transaction_fixture() -> Callable[..., str]:
+    """Builder for unsigned base64 transactions, for offline signing tests."""
+    return build_unsigned_transaction
+
+
+def make_response(
+    status_code: int = 200,
+    body: Any = None,
+    headers: Optional[dict[str, str]] = None,
+) -> Response:
+    """Build a curl_cffi Response without touching the network."""
+    response = Response()
+    response.status_code = status_code
+    response.ok = 200 <= status_code < 400
+    response.reason = "OK" if response.ok else "Error"
+    response.content = json.dumps(body if body is not None else {}).encode()
+    response.headers = Headers(headers or {})
+    return response
+
+
+@pytest.fixture(name="make_response")
+def make_response_fixture() -> Callable[..., Response]:
+    """Builder for offline curl_cffi responses."""
+    return make_response
@@ -0,0 +1,134 @@
+import base64
+import json
+import logging
+import threading
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from curl_cffi.requests import Response
+from solders.solders import Keypair, VersionedTransaction
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient
+from jup_python_sdk.models.ultra_api.ultra_order_request_model import UltraOrderRequest
+from jup_python_sdk.signing.signer import KeypairSigner
+from jup_python_sdk.signing.transaction_signing import sign_base64_transaction
+
+
+@pytest.mark.asyncio
+async def test_signing_runs_in_cpu_executor(
+    build_unsigned_transaction: Callable[..., str],
+) -> None:
+    """Test order_and_execute signs in the configured executor"""
+    keypair = Keypair()
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jup-cpu")
+    client = AsyncUltraApiClient(
+        signer=KeypairSigner(keypair), cpu_executor=executor, offload_threshold=0
+    )
+
+    order_response = Mock()
+    order_response.content = json.dumps(
+        {
+            "requestId": "request-id",
+            "transaction": build_unsigned_transaction(keypair),
+        }
+    ).encode()
+    execute_response = Mock()
+    execute_response.content = b'{"status": "Success"}'
+
+    signing_threads = []
+
+    def record_thread(
+        transaction_base64: str, signing_keys: Mapping[bytes, Keypair]
+    ) -> str:
+        signing_threads.append(threading.current_thread().name)
+        return sign_base64_transaction(transaction_base64, signing_keys)
+
+    order_request = UltraOrderRequest(
+        input_mint="So11111111111111111111111111111111111111112",
+        output_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+        amount=10000000,
+        taker=str(keypair.pubkey()),
+    )
+
+    with patch(
+        "jup_python_sdk.clients.jupiter_client.sign_base64_transaction",
+        side_effect=record_thread,
+    ):
+        with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = order_response
+            with patch.object(
+                client.client, "post", new_callable=AsyncMock
+            ) as mock_post:
+                mock_post.return_value = execute_response
+                result = await client.order_and_execute(order_request)
+
+    assert result == {"status": "Success"}
+    assert signing_threads and signing_threads[0].startswith("jup-cpu")
+
+    await client.close()
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_small_payloads_stay_inline(
+    build_unsigned_transaction: Callable[..., str],
+) -> None:
+    """Test work below the offload threshold does not use the executor"""
+    keypair = Keypair()
+    executor = Mock(wraps=ThreadPoolExecutor(max_workers=1))
+    client = AsyncUltraApiClient(
+        signer=KeypairSigner(keypair),
+        cpu_executor=executor,
+        offload_threshold=1 << 20,
+    )
+
+    await client.sign_transaction_async(build_unsigned_transaction(keypair))
+
+    # Only the one-off key load is always offloaded
+    assert executor.submit.call_count == 1
+
+    await client.close()
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_blocking_warning(
+    build_unsigned_transaction: Callable[..., str], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the debug mode reports inline steps that block the loop"""
+    keypair = Keypair()
+    client = AsyncUltraApiClient(signer=KeypairSigner(keypair), blocking_warn_ms=0)
+
+    with caplog.at_level(logging.WARNING, logger="jup_python_sdk"):
+        await client.sign_transaction_async(build_unsigned_transaction(keypair))
+
+    assert any("blocked the event loop" in r.message for r in caplog.records)
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_process_pool_executor(
+    build_unsigned_transaction: Callable[..., str],
+    make_response: Callable[..., Response],
+) -> None:
+    """Test signing and large JSON bodies can be offloaded to processes"""
+    keypair = Keypair()
+    executor = ProcessPoolExecutor(max_workers=1)
+    client = AsyncUltraApiClient(
+        signer=KeypairSigner(keypair), cpu_executor=executor, offload_threshold=0
+    )
+
+    signed = await client.sign_transaction_async(build_unsigned_transaction(keypair))
+    transaction = VersionedTransaction.from_bytes(base64.b64decode(signed))
+    assert all(transaction.verify_with_results())
+
+    balances = {f"mint{i}": {"amount": str(i)} for i in range(2000)}
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = make_response(200, balances)
+        assert await client.balances("wallet") == balances
+
+    await client.close()
+    executor.shutdown()
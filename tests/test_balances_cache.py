@@ -0,0 +1,151 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from curl_cffi.requests import Response
+from solders.solders import Keypair
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.models.ultra_api.ultra_execute_request_model import (
+    UltraExecuteRequest,
+)
+from jup_python_sdk.signing.transaction_signing import transaction_signers
+from jup_python_sdk.transport.response_cache import BalancesCache
+
+
+def test_transaction_signers(build_unsigned_transaction: Callable[..., str]) -> None:
+    """Test the required signers are read from a serialized transaction"""
+    payer, co_signer = Keypair(), Keypair()
+    transaction = build_unsigned_transaction(payer, 1, co_signer)
+
+    assert transaction_signers(transaction) == [
+        str(payer.pubkey()),
+        str(co_signer.pubkey()),
+    ]
+
+
+def test_invalidation_during_fetch_is_not_overwritten() -> None:
+    """Test balances fetched before an invalidation are not cached"""
+    cache = BalancesCache()
+    generation = cache.generation()
+    cache.invalidate("wallet")
+    cache.set_if_current(generation, "wallet", {"SOL": {"amount": "1"}})
+
+    assert cache.get("wallet") is None
+
+
+def test_sync_balances_cached_until_successful_execute(
+    make_response: Callable[..., Response],
+    build_unsigned_transaction: Callable[..., str],
+) -> None:
+    """Test balances are served from cache until the taker's swap succeeds"""
+    taker = Keypair()
+    address = str(taker.pubkey())
+    client = UltraApiClient(balances_cache=BalancesCache(ttl=60))
+    execute_request = UltraExecuteRequest(
+        request_id="req", signed_transaction=build_unsigned_transaction(taker)
+    )
+
+    with patch("curl_cffi.requests.Session.get") as mock_get:
+        with patch("curl_cffi.requests.Session.post") as mock_post:
+            mock_get.return_value = make_response(200, {"SOL": {"amount": "1"}})
+            client.balances(address)
+            client.balances(address)
+            assert mock_get.call_count == 1
+
+            mock_post.return_value = make_response(200, {"status": "Failed"})
+            client.execute(execute_request)
+            client.balances(address)
+            assert mock_get.call_count == 1
+
+            # Bodies without a status never make the completed call raise
+            mock_post.return_value = make_response(200, {"error": "Bad request"})
+            assert client.execute(execute_request, raw=True)
+            mock_post.return_value = make_response(200)
+            mock_post.return_value.content = b"<html>"
+            assert client.execute(execute_request, raw=True) == b"<html>"
+            client.balances(address)
+            assert mock_get.call_count == 1
+
+            mock_post.return_value = make_response(200, {"status": "Success"})
+            client.execute(execute_request, raw=True)
+            client.balances(address)
+            assert mock_get.call_count == 2
+
+            client.invalidate_balances(address)
+            client.balances(address)
+            assert mock_get.call_count == 3
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_balances_cache_expires(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test cached balances expire after the TTL and can be cleared"""
+    now = [0.0]
+    cache = BalancesCache(ttl=0.05, clock=lambda: now[0])
+    client = AsyncUltraApiClient(balances_cache=cache)
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = make_response(200, {"SOL": {"amount": "1"}})
+        await client.balances("wallet")
+        await client.balances("wallet")
+        assert mock_get.call_count == 1
+
+        now[0] = 0.1
+        await client.balances("wallet")
+        assert mock_get.call_count == 2
+
+        client.invalidate_balances()
+        await client.balances("wallet")
+        assert mock_get.call_count == 3
+
+    assert cache.hits == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_does_not_share_pre_trade_balances(
+    make_response: Callable[..., Response],
+    build_unsigned_transaction: Callable[..., str],
+) -> None:
+    """Test balances asked for after our swap never join an older request"""
+    taker = Keypair()
+    address = str(taker.pubkey())
+    cache = BalancesCache(ttl=60)
+    client = AsyncUltraApiClient(balances_cache=cache, single_flight=True)
+    release = asyncio.Event()
+    before, after = {"SOL": {"amount": "2"}}, {"SOL": {"amount": "1"}}
+
+    async def get(url: str, **kwargs: Any) -> Response:
+        if mock_get.call_count == 1:
+            await release.wait()
+            return make_response(200, before)
+        return make_response(200, after)
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
+            mock_get.side_effect = get
+            mock_post.return_value = make_response(200, {"status": "Success"})
+            pre_trade = asyncio.create_task(client.balances(address))
+            await asyncio.sleep(0)
+            await client.execute(
+                UltraExecuteRequest(
+                    request_id="req",
+                    signed_transaction=build_unsigned_transaction(taker),
+                )
+            )
+
+            assert await asyncio.wait_for(client.balances(address), 1) == after
+            release.set()
+            assert await pre_trade == before
+
+    assert mock_get.call_count == 2
+    assert cache.get(address) == after
+
+    await client.close()
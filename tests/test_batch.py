@@ -0,0 +1,133 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from curl_cffi.requests import Response
+from curl_cffi.requests.exceptions import HTTPError
+
+from jup_python_sdk.clients.batch import (
+    BatchResult,
+    chunked,
+    run_bounded,
+    run_bounded_threads,
+)
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_limits_concurrency_and_captures_errors() -> None:
+    """Test at most `concurrency` calls run and failures become results"""
+    in_flight = 0
+    peak = 0
+
+    async def call(item: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001 * (item % 3))
+        in_flight -= 1
+        if item == 7:
+            raise ValueError("bad item")
+        return item * 2
+
+    results = [r async for r in run_bounded(range(20), call, concurrency=4)]
+
+    assert peak == 4
+    assert sorted(r.index for r in results) == list(range(20))
+    failed = [r for r in results if not r.ok]
+    assert len(failed) == 1 and failed[0].item == 7
+    with pytest.raises(ValueError):
+        failed[0].unwrap()
+    assert all(r.unwrap() == r.item * 2 for r in results if r.ok)
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_applies_backpressure_and_cancels() -> None:
+    """Test a slow consumer stops new calls and an early exit cancels them"""
+    pulled = 0
+
+    def items() -> Iterator[int]:
+        nonlocal pulled
+        for i in range(100):
+            pulled += 1
+            yield i
+
+    async def call(item: int) -> int:
+        return item
+
+    stream = run_bounded(items(), call, concurrency=2)
+    first = await stream.__anext__()
+    await asyncio.sleep(0.05)
+
+    assert isinstance(first, BatchResult)
+    assert pulled <= 5
+
+    assert isinstance(stream, AsyncGenerator)
+    await stream.aclose()
+    assert pulled <= 5
+
+
+@pytest.mark.asyncio
+async def test_failing_items_iterable_is_raised_after_results(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test an error from the items iterable reaches the consumer"""
+
+    def items() -> Iterator[str]:
+        yield "a"
+        raise RuntimeError("source failed")
+
+    async def call(item: str) -> str:
+        return item
+
+    async def collect(stream: AsyncIterator[BatchResult[str, Any]]) -> list[str]:
+        return [r.item async for r in stream]
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(collect(run_bounded(items(), call, 2)), timeout=1)
+    seen: list[str] = []
+    with pytest.raises(RuntimeError):
+        for result in run_bounded_threads(items(), str.upper, concurrency=2):
+            seen.append(result.unwrap())
+    assert seen == ["A"]
+
+    client = AsyncUltraApiClient()
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = make_response(200, {})
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(collect(client.balances_many(items())), timeout=1)
+    await client.close()
+
+
+def test_chunked() -> None:
+    """Test sequences are split into bounded chunks"""
+    assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    with pytest.raises(ValueError):
+        chunked([1], 0)
+
+
+@pytest.mark.asyncio
+async def test_client_batch_methods(make_response: Callable[..., Response]) -> None:
+    """Test shield_many chunks mints and balances_many reports errors"""
+    client = AsyncUltraApiClient()
+    mints = [f"Mint{i}" for i in range(120)]
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = make_response(200, {"warnings": {}})
+        chunks = [r async for r in client.shield_many(mints, chunk_size=50)]
+
+        assert mock_get.call_count == 3
+        assert sorted(len(r.item) for r in chunks) == [20, 50, 50]
+
+        mock_get.side_effect = [
+            make_response(200, {"SOL": {"amount": "1"}}),
+            make_response(404),
+        ]
+        results = [r async for r in client.balances_many(["a", "b"], concurrency=1)]
+
+    assert results[0].value == {"SOL": {"amount": "1"}}
+    assert isinstance(results[1].error, HTTPError)
+
+    await client.close()
@@ -0,0 +1,75 @@
+import asyncio
+import time
+from collections.abc import Callable
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from curl_cffi import CurlHttpVersion, CurlMOpt, CurlOpt
+from curl_cffi.requests import Response
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.transport.connection_options import ConnectionOptions
+
+
+def test_options_merge_into_session_kwargs() -> None:
+    """Test options map to curl settings without overriding explicit kwargs"""
+    options = ConnectionOptions(
+        http_version="2", max_cached_connections=8, max_clients=32
+    )
+    kwargs = options.apply(
+        {"impersonate": "chrome", "curl_options": {CurlOpt.TCP_KEEPIDLE: 5}},
+        is_async=True,
+    )
+
+    assert kwargs["http_version"] == CurlHttpVersion.V2TLS
+    assert kwargs["max_clients"] == 32
+    assert kwargs["curl_options"][CurlOpt.TCP_KEEPALIVE] == 1
+    assert kwargs["curl_options"][CurlOpt.TCP_KEEPIDLE] == 5
+    assert kwargs["curl_options"][CurlOpt.MAXCONNECTS] == 8
+    assert "max_clients" not in options.apply({})
+
+    with pytest.raises(ValueError):
+        ConnectionOptions(http_version="4")
+
+
+def test_sync_warmup_and_keepalive(make_response: Callable[..., Response]) -> None:
+    """Test warmup opens a connection and keep-alive pings when idle"""
+    client = UltraApiClient(connection_options=ConnectionOptions(http_version="2"))
+
+    with patch(
+        "curl_cffi.requests.Session.head", return_value=make_response(404)
+    ) as mock_head:
+        client.warmup()
+        assert mock_head.call_count == 1
+
+        client.start_keepalive(interval=0.02)
+        time.sleep(0.2)
+        client.close()
+
+    assert mock_head.call_count > 1
+    assert client._keepalive_thread is None
+
+
+@pytest.mark.asyncio
+async def test_async_warmup_and_pool_limits(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test concurrent warmup and per-host limits on the shared pool"""
+    client = AsyncUltraApiClient(
+        connection_options=ConnectionOptions(max_connections_per_host=4)
+    )
+
+    with patch.object(client.client.acurl, "setopt") as mock_setopt:
+        with patch.object(client.client, "head", new_callable=AsyncMock) as mock_head:
+            mock_head.return_value = make_response(404)
+            await client.warmup(connections=3)
+
+            assert mock_head.call_count == 3
+            mock_setopt.assert_called_once_with(CurlMOpt.MAX_HOST_CONNECTIONS, 4)
+
+            client.start_keepalive(interval=0.02)
+            await asyncio.sleep(0.2)
+            await client.close()
+
+    assert mock_head.call_count > 3
+    assert client._keepalive_task is None
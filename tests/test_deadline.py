@@ -0,0 +1,213 @@
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from curl_cffi.requests import Response
+from curl_cffi.requests.exceptions import HTTPError
+from solders.solders import Keypair
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.models.ultra_api.ultra_order_request_model import UltraOrderRequest
+from jup_python_sdk.models.ultra_api.ultra_order_response_model import (
+    UltraOrderResponse,
+)
+from jup_python_sdk.signing.signer import KeypairSigner
+from jup_python_sdk.transport.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    StaleQuoteError,
+)
+from jup_python_sdk.transport.retry_policy import RetryPolicy
+
+
+def _order_request(keypair: Keypair) -> UltraOrderRequest:
+    return UltraOrderRequest(
+        input_mint="So11111111111111111111111111111111111111112",
+        output_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+        amount=10000000,
+        taker=str(keypair.pubkey()),
+    )
+
+
+def test_deadline_caps_timeouts() -> None:
+    """Test the remaining budget caps timeouts and raises once spent"""
+    now = [0.0]
+    deadline = Deadline(2.0, clock=lambda: now[0])
+
+    assert deadline.timeout() == 2.0
+    assert deadline.timeout(cap=0.5) == 0.5
+    now[0] = 1.5
+    assert deadline.remaining() == 0.5
+    now[0] = 2.0
+    assert deadline.expired
+    with pytest.raises(DeadlineExceeded):
+        deadline.timeout()
+
+
+def test_order_staleness() -> None:
+    """Test quote age and RFQ expiry both make an order stale"""
+    order = UltraOrderResponse.from_json(b'{"requestId": "r"}')
+    assert not order.is_stale(10)
+    assert order.is_stale(-1)
+
+    expired = UltraOrderResponse.from_json(b'{"requestId": "r", "expireAt": "1"}')
+    assert expired.is_stale(10)
+
+
+def test_sync_deadline_sets_request_timeouts(
+    make_response: Callable[..., Response],
+    build_unsigned_transaction: Callable[..., str],
+) -> None:
+    """Test each request gets the time left in the budget as its timeout"""
+    keypair = Keypair()
+    client = UltraApiClient(signer=KeypairSigner(keypair))
+    order_body = {
+        "requestId": "r",
+        "transaction": build_unsigned_transaction(keypair),
+    }
+
+    with patch("curl_cffi.requests.Session.get") as mock_get:
+        with patch("curl_cffi.requests.Session.post") as mock_post:
+            mock_get.return_value = make_response(200, order_body)
+            mock_post.return_value = make_response(200, {"status": "Success"})
+            result = client.order_and_execute(_order_request(keypair), deadline=5)
+
+    assert result == {"status": "Success"}
+    # Half the budget is kept back for execute by default
+    assert 0 < mock_get.call_args.kwargs["timeout"] <= 2.5
+    assert 2.5 < mock_post.call_args.kwargs["timeout"] <= 5
+
+    client.close()
+
+
+def test_swap_is_not_sent_without_time_to_execute(
+    make_response: Callable[..., Response],
+    build_unsigned_transaction: Callable[..., str],
+) -> None:
+    """Test a slow order fails the swap before the transaction is sent"""
+    keypair = Keypair()
+    client = UltraApiClient(signer=KeypairSigner(keypair))
+    now = [0.0]
+    order_body = {
+        "requestId": "r",
+        "transaction": build_unsigned_transaction(keypair),
+    }
+
+    def slow_order(*args: Any, **kwargs: Any) -> Response:
+        now[0] += 0.8
+        return make_response(200, order_body)
+
+    with patch("curl_cffi.requests.Session.get") as mock_get:
+        with patch("curl_cffi.requests.Session.post") as mock_post:
+            mock_get.side_effect = slow_order
+            with pytest.raises(DeadlineExceeded):
+                client.order_and_execute(
+                    _order_request(keypair),
+                    deadline=Deadline(1.0, clock=lambda: now[0]),
+                    min_execute_time=0.3,
+                )
+
+            assert mock_get.call_args.kwargs["timeout"] == pytest.approx(0.7)
+            mock_post.assert_not_called()
+
+            with pytest.raises(DeadlineExceeded):
+                client.order_and_execute(
+                    _order_request(keypair), deadline=1.0, min_execute_time=1.0
+                )
+            mock_post.assert_not_called()
+
+    client.close()
+
+
+def test_order_accepts_budget_in_seconds(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test order() takes a float budget like order_and_execute()"""
+    client = UltraApiClient()
+
+    with patch("curl_cffi.requests.Session.get") as mock_get:
+        mock_get.return_value = make_response(200, {"requestId": "r"})
+        client.order(_order_request(Keypair()), deadline=3)
+
+    assert 0 < mock_get.call_args.kwargs["timeout"] <= 3
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_deadline_never_extends_session_timeout(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test a long deadline keeps the session and per-call timeouts"""
+    client = UltraApiClient(client_kwargs={"timeout": 10})
+    with patch("curl_cffi.requests.Session.get") as mock_get:
+        mock_get.return_value = make_response(200, {"requestId": "r"})
+        client.order(_order_request(Keypair()), deadline=60)
+        assert mock_get.call_args.kwargs["timeout"] == 10
+
+        client._request("order", "GET", client.base_url, Deadline(60), timeout=(2, 5))
+        assert mock_get.call_args.kwargs["timeout"] == (2, 5)
+    client.close()
+
+    async_client = AsyncUltraApiClient(client_kwargs={"timeout": 10})
+    with patch.object(async_client.client, "get", new_callable=AsyncMock) as get:
+        get.return_value = make_response(200, {"requestId": "r"})
+        await async_client.order(_order_request(Keypair()), deadline=60)
+        assert get.call_args.kwargs["timeout"] == 10
+    await async_client.close()
+
+
+def test_retry_is_not_scheduled_past_deadline(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test a retry is only made if it can start before the deadline"""
+    client = UltraApiClient(
+        retry_policy=RetryPolicy(max_attempts=2, backoff_base=0.5, jitter=False)
+    )
+    url = f"{client.base_url}/ultra/v1/balances/wallet"
+
+    with patch("curl_cffi.requests.Session.get") as mock_get:
+        mock_get.return_value = make_response(503)
+        with pytest.raises(HTTPError):
+            client._request("balances", "GET", url, deadline=Deadline(0.2))
+        assert mock_get.call_count == 1
+
+        with pytest.raises(HTTPError):
+            client._request("balances", "GET", url, deadline=Deadline(5))
+        assert mock_get.call_count == 3
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_order_is_requoted(
+    build_unsigned_transaction: Callable[..., str],
+    make_response: Callable[..., Response],
+) -> None:
+    """Test a stale order is requoted instead of executed"""
+    keypair = Keypair()
+    client = AsyncUltraApiClient(signer=KeypairSigner(keypair))
+    stale = {"requestId": "old", "expireAt": "1"}
+    stale["transaction"] = build_unsigned_transaction(keypair)
+    fresh = {"requestId": "new", "transaction": build_unsigned_transaction(keypair)}
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.side_effect = [make_response(200, stale), make_response(200, fresh)]
+        with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = make_response(200, {"status": "Success"})
+            await client.order_and_execute(
+                _order_request(keypair), deadline=5, max_quote_age=30
+            )
+
+            assert mock_get.call_count == 2
+            assert mock_post.call_count == 1
+            assert mock_post.call_args.kwargs["json"]["requestId"] == "new"
+
+            mock_get.side_effect = [make_response(200, stale)] * 2
+            with pytest.raises(StaleQuoteError):
+                await client.order_and_execute(
+                    _order_request(keypair), max_quote_age=30, max_requotes=1
+                )
+            assert mock_post.call_count == 1
+
+    await client.close()
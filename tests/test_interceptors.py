@@ -0,0 +1,103 @@
+from collections.abc import Callable
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from curl_cffi.requests import Response
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.transport.interceptors import (
+    AsyncHandler,
+    AsyncInterceptor,
+    Handler,
+    Interceptor,
+    RequestCall,
+)
+
+
+class _Recording(Interceptor):
+    def __init__(self, name: str, seen: list[str]):
+        self.name = name
+        self.seen = seen
+
+    def intercept(self, call: RequestCall, proceed: Handler) -> Response:
+        self.seen.append(f"{self.name}:before")
+        response = proceed(call)
+        self.seen.append(f"{self.name}:after")
+        return response
+
+
+class _Canned(Interceptor):
+    def __init__(self, response: Response):
+        self.response = response
+
+    def intercept(self, call: RequestCall, proceed: Handler) -> Response:
+        return self.response
+
+
+class _AddHeader(AsyncInterceptor):
+    async def intercept(self, call: RequestCall, proceed: AsyncHandler) -> Response:
+        call.kwargs["headers"] = {**call.kwargs.get("headers", {}), "X-Trace": "1"}
+        call.url = call.url.replace("wallet", "other")
+        return await proceed(call)
+
+
+def test_interceptors_run_in_order(make_response: Callable[..., Response]) -> None:
+    """Test the first interceptor is outermost"""
+    seen: list[str] = []
+    client = UltraApiClient(interceptors=[_Recording("a", seen), _Recording("b", seen)])
+
+    with patch("curl_cffi.requests.Session.get") as mock_get:
+        mock_get.return_value = make_response(200, {"SOL": {}})
+        assert client.balances("wallet") == {"SOL": {}}
+
+    assert seen == ["a:before", "b:before", "b:after", "a:after"]
+    client.close()
+
+
+def test_interceptor_can_short_circuit(make_response: Callable[..., Response]) -> None:
+    """Test an interceptor can answer without sending a request"""
+    client = UltraApiClient()
+    client.add_interceptor(_Canned(make_response(200, {"cached": True})))
+
+    with patch("curl_cffi.requests.Session.get") as mock_get:
+        assert client.balances("wallet") == {"cached": True}
+        mock_get.assert_not_called()
+
+    client.close()
+
+
+def test_interceptor_sees_call(make_response: Callable[..., Response]) -> None:
+    """Test the call passed down carries the endpoint and request details"""
+    calls: list[RequestCall] = []
+
+    class Capture(Interceptor):
+        def intercept(self, call: RequestCall, proceed: Handler) -> Response:
+            calls.append(call)
+            return proceed(call)
+
+    client = UltraApiClient(interceptors=[Capture()])
+    with patch("curl_cffi.requests.Session.get") as mock_get:
+        mock_get.return_value = make_response(200, {})
+        client.shield(["mint"])
+
+    [call] = calls
+    assert call.endpoint == "shield" and call.method == "GET"
+    assert call.url.endswith("/ultra/v1/shield")
+    assert call.kwargs["params"] == {"mints": "mint"}
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_interceptor_rewrites_request(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test an async interceptor can change the headers and URL"""
+    client = AsyncUltraApiClient(interceptors=[_AddHeader()])
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = make_response(200, {})
+        await client.balances("wallet")
+
+    assert mock_get.call_args.args[0].endswith("/balances/other")
+    assert mock_get.call_args.kwargs["headers"]["X-Trace"] == "1"
+    await client.close()
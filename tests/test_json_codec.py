@@ -0,0 +1,92 @@
+import json
+from collections.abc import Callable
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from curl_cffi.requests import Response
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.models.ultra_api.ultra_execute_request_model import (
+    UltraExecuteRequest,
+)
+from jup_python_sdk.transport.json_codec import JsonCodec, get_codec
+
+BALANCES = {"SOL": {"amount": "1.5", "uiAmount": 1.5, "isFrozen": False}}
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec", "auto"])
+def test_codecs_round_trip(name: str) -> None:
+    """Test every available codec encodes compactly and decodes bytes"""
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+    encoded = codec.dumps({"requestId": "id", "amounts": [1, 2]})
+
+    assert isinstance(encoded, bytes)
+    assert b" " not in encoded
+    assert codec.loads(encoded) == {"requestId": "id", "amounts": [1, 2]}
+
+
+def test_unknown_codec() -> None:
+    """Test unknown codec names are rejected"""
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+def test_client_uses_codec_for_bodies_and_responses(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test execute bodies are pre-encoded and responses decoded by the codec"""
+    client = UltraApiClient(json_codec=JsonCodec())
+    request = UltraExecuteRequest(signed_transaction="tx", request_id="id")
+
+    with patch(
+        "curl_cffi.requests.Session.post",
+        return_value=make_response(200, {"status": "Success"}),
+    ) as mock_post:
+        result = client.execute(request)
+
+    assert result == {"status": "Success"}
+    kwargs = mock_post.call_args.kwargs
+    assert "json" not in kwargs
+    assert json.loads(kwargs["data"]) == {"signedTransaction": "tx", "requestId": "id"}
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+
+    client.close()
+
+
+def test_raw_returns_undecoded_bytes(make_response: Callable[..., Response]) -> None:
+    """Test raw=True skips JSON decoding"""
+    client = UltraApiClient(json_codec="auto")
+
+    with patch(
+        "curl_cffi.requests.Session.get", return_value=make_response(200, BALANCES)
+    ):
+        body = client.balances("CzieXbdjF4suiEBe6rQEgiz8phk6v3fVHndMn1sYgmCv", raw=True)
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == BALANCES
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_codec_and_raw(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test the async client decodes with the codec and supports raw=True"""
+    client = AsyncUltraApiClient(json_codec="auto")
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = make_response(200, BALANCES)
+        decoded = await client.shield(["So11111111111111111111111111111111111111112"])
+        raw = await client.shield(
+            ["So11111111111111111111111111111111111111112"], raw=True
+        )
+
+    assert decoded == BALANCES
+    assert json.loads(raw) == BALANCES
+
+    await client.close()
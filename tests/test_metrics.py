@@ -0,0 +1,103 @@
+from collections.abc import Callable
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from curl_cffi.requests import Response
+from curl_cffi.requests.exceptions import ConnectionError, HTTPError
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.transport.metrics import LatencyHistogram, MetricsRegistry
+from jup_python_sdk.transport.retry_policy import RetryPolicy
+
+
+def test_histogram_percentiles_are_accurate() -> None:
+    """Test percentiles stay within the histogram's 1% resolution"""
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.min == 0.001 and histogram.max == 1.0
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.01)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.01)
+    assert histogram.percentile(100) == pytest.approx(1.0, rel=0.01)
+    below_100ms, below_500ms, below_2s = histogram.cumulative_counts([0.1, 0.5, 2])
+    assert below_100ms == 100 and below_2s == 1000
+    assert below_500ms == pytest.approx(500, rel=0.01)
+
+
+def test_registry_counts_outcomes_per_endpoint_and_host() -> None:
+    """Test attempts are split by endpoint, base URL and outcome"""
+    registry = MetricsRegistry()
+    registry.record("order", "https://api.jup.ag/ultra/v1/order", 0.05, 200)
+    registry.record("order", "https://api.jup.ag/ultra/v1/order", 0.01, 429)
+    registry.record("order", "https://api.jup.ag/ultra/v1/order", 0.2, None)
+    registry.record("order", "https://lite-api.jup.ag/ultra/v1/order", 0.1, 500)
+
+    snapshot = registry.snapshot()
+    order = snapshot["https://api.jup.ag"]["order"]
+    assert (order["success"], order["rate_limited"], order["error"]) == (1, 1, 1)
+    assert order["latency"]["count"] == 3
+    assert snapshot["https://lite-api.jup.ag"]["order"]["error"] == 1
+
+
+def test_prometheus_rendering() -> None:
+    """Test the text format has histogram buckets and outcome counters"""
+    registry = MetricsRegistry(buckets=[0.1, 1.0])
+    registry.record("shield", "https://api.jup.ag/ultra/v1/shield", 0.05, 200)
+    registry.record("shield", "https://api.jup.ag/ultra/v1/shield", 0.5, 429)
+
+    text = registry.render_prometheus()
+    labels = 'endpoint="shield",base_url="https://api.jup.ag"'
+    assert "# TYPE jupiter_request_duration_seconds histogram" in text
+    assert f'jupiter_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'jupiter_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"jupiter_request_duration_seconds_count{{{labels}}} 2" in text
+    assert f'jupiter_requests_total{{{labels},outcome="rate_limited"}} 1' in text
+    assert f'jupiter_requests_total{{{labels},outcome="success"}} 1' in text
+
+
+def test_sync_client_records_every_attempt(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test retried attempts are each recorded"""
+    registry = MetricsRegistry()
+    client = UltraApiClient(
+        metrics=registry,
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0, jitter=False),
+    )
+
+    with patch("curl_cffi.requests.Session.get") as mock_get:
+        mock_get.side_effect = [
+            make_response(429),
+            ConnectionError("reset"),
+            make_response(200, {}),
+        ]
+        client.balances("wallet")
+
+    balances = registry.snapshot()[client.base_url]["balances"]
+    assert (balances["success"], balances["error"], balances["rate_limited"]) == (
+        1,
+        1,
+        1,
+    )
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_records_errors(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test the async client records failed attempts"""
+    registry = MetricsRegistry()
+    client = AsyncUltraApiClient(metrics=registry)
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = make_response(500)
+        with pytest.raises(HTTPError):
+            await client.balances("wallet")
+
+    metrics = registry.get("balances", client.base_url)
+    assert metrics is not None and metrics.error == 1
+    assert metrics.latency.count == 1
+    await client.close()
@@ -0,0 +1,75 @@
+from collections.abc import Callable
+from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from curl_cffi.requests import Response
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.models.ultra_api.ultra_order_request_model import UltraOrderRequest
+from jup_python_sdk.models.ultra_api.ultra_order_template import OrderTemplate
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+TAKER = "CzieXbdjF4suiEBe6rQEgiz8phk6v3fVHndMn1sYgmCv"
+
+
+def test_template_matches_order_request(make_response: Callable[..., Response]) -> None:
+    """Test template URLs carry the same parameters order() sends"""
+    client = UltraApiClient()
+    request = UltraOrderRequest(
+        input_mint=SOL_MINT,
+        output_mint=USDC_MINT,
+        amount=12345,
+        taker=TAKER,
+        referral_fee=50,
+    )
+    template = OrderTemplate(request)
+
+    with patch(
+        "curl_cffi.requests.Session.get", return_value=make_response(200, {})
+    ) as mock_get:
+        client.order(request)
+        client.order_from_template(template, 12345)
+
+    order_call, template_call = mock_get.call_args_list
+    order_url, template_url = order_call.args[0], template_call.args[0]
+    assert urlsplit(template_url).path == urlsplit(order_url).path
+    assert parse_qs(urlsplit(template_url).query) == parse_qs(urlsplit(order_url).query)
+    assert template_call.kwargs == order_call.kwargs
+    assert template.to_request(12345) == request
+
+    client.close()
+
+
+def test_for_pair_builds_reusable_prefix() -> None:
+    """Test the prefix only needs the amount appended"""
+    template = OrderTemplate.for_pair(SOL_MINT, USDC_MINT)
+
+    prefix = template.url_prefix("https://lite-api.jup.ag")
+
+    assert prefix == (
+        "https://lite-api.jup.ag/ultra/v1/order?"
+        f"inputMint={SOL_MINT}&outputMint={USDC_MINT}&amount="
+    )
+    assert template.url_prefix("https://lite-api.jup.ag") is prefix
+
+
+@pytest.mark.asyncio
+async def test_async_order_from_template(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test the async client quotes from a template"""
+    client = AsyncUltraApiClient()
+    template = OrderTemplate.for_pair(SOL_MINT, USDC_MINT, taker=TAKER)
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = make_response(200, {"requestId": "id"})
+        order = await client.order_from_template(template, 1000)
+        raw = await client.order_from_template(template, 2000, raw=True)
+
+    assert order == {"requestId": "id"}
+    assert raw == b'{"requestId": "id"}'
+    assert mock_get.call_args.args[0].endswith("&amount=2000")
+
+    await client.close()
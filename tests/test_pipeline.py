@@ -0,0 +1,123 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from curl_cffi.requests import Response
+from solders.solders import Keypair
+
+from jup_python_sdk.clients.batch import run_pipeline
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient
+from jup_python_sdk.models.ultra_api.ultra_order_request_model import UltraOrderRequest
+from jup_python_sdk.signing.signer import KeypairSigner
+
+
+@pytest.mark.asyncio
+async def test_stages_overlap_and_errors_skip_later_stages() -> None:
+    """Test items flow through stages concurrently and failures short-cut"""
+    events: list[tuple[str, int]] = []
+
+    async def first(item: int) -> int:
+        events.append(("first", item))
+        await asyncio.sleep(0.01)
+        if item == 2:
+            raise ValueError("bad item")
+        return item * 10
+
+    async def second(value: int) -> int:
+        events.append(("second", value // 10))
+        await asyncio.sleep(0.01)
+        return value + 1
+
+    async def items() -> AsyncIterator[int]:
+        for i in range(5):
+            yield i
+
+    results = [
+        r async for r in run_pipeline(items(), [(first, 1), (second, 1)], queue_depth=2)
+    ]
+
+    assert sorted(r.index for r in results) == list(range(5))
+    assert {r.item: r.value for r in results if r.ok} == {
+        0: 1,
+        1: 11,
+        3: 31,
+        4: 41,
+    }
+    assert [r.item for r in results if not r.ok] == [2]
+    assert ("second", 2) not in events
+    # The second stage started before the first finished every item
+    assert events.index(("second", 0)) < events.index(("first", 4))
+
+
+@pytest.mark.asyncio
+async def test_pipeline_backpressure_and_source_errors() -> None:
+    """Test a slow consumer bounds the work in flight"""
+    pulled = 0
+
+    def items() -> Iterator[int]:
+        nonlocal pulled
+        for i in range(100):
+            pulled += 1
+            yield i
+
+    async def identity(item: int) -> int:
+        return item
+
+    stream = run_pipeline(items(), [(identity, 2), (identity, 2)], queue_depth=1)
+    await stream.__anext__()
+    await asyncio.sleep(0.05)
+    assert pulled < 15
+    assert isinstance(stream, AsyncGenerator)
+    await stream.aclose()
+
+    def broken() -> Iterator[int]:
+        yield 1
+        raise RuntimeError("source failed")
+
+    stream = run_pipeline(broken(), [(identity, 1)], queue_depth=1)
+    assert (await stream.__anext__()).value == 1
+    with pytest.raises(RuntimeError):
+        await stream.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_order_and_execute_many(
+    build_unsigned_transaction: Callable[..., str],
+    make_response: Callable[..., Response],
+) -> None:
+    """Test the client pipeline orders, signs and executes every request"""
+    keypair = Keypair()
+    client = AsyncUltraApiClient(signer=KeypairSigner(keypair))
+    requests = [
+        UltraOrderRequest(
+            input_mint="So11111111111111111111111111111111111111112",
+            output_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+            amount=amount,
+            taker=str(keypair.pubkey()),
+        )
+        for amount in (1, 2, 3)
+    ]
+
+    async def fake_get(url: str, **kwargs: Any) -> Response:
+        if parse_qs(urlparse(url).query)["amount"] == ["2"]:
+            return make_response(200, {"requestId": "r2", "transaction": None})
+        return make_response(
+            200,
+            {"requestId": "r", "transaction": build_unsigned_transaction(keypair)},
+        )
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.side_effect = fake_get
+        with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = make_response(200, {"status": "Success"})
+            results = [r async for r in client.order_and_execute_many(requests)]
+
+    assert mock_post.call_count == 2
+    assert sorted(r.item.amount for r in results if r.ok) == [1, 3]
+    assert all(r.value == {"status": "Success"} for r in results if r.ok)
+    assert [type(r.error) for r in results if not r.ok] == [ValueError]
+
+    await client.close()
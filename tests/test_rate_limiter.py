@@ -0,0 +1,76 @@
+import asyncio
+import time
+from collections.abc import Callable
+from unittest.mock import patch
+
+import pytest
+from curl_cffi.requests import Response
+
+from jup_python_sdk.clients.ultra_api_client import UltraApiClient
+from jup_python_sdk.transport.rate_limiter import (
+    LITE_API_RATE,
+    PRO_API_RATE,
+    RateLimiter,
+)
+
+
+def test_token_bucket_reservations() -> None:
+    """Test burst capacity, queueing delays and endpoint weights"""
+    limiter = RateLimiter(rate=10, burst=2, endpoint_weights={"execute": 2})
+
+    assert limiter.reserve("order") == 0.0
+    assert limiter.reserve("order") == 0.0
+    assert limiter.reserve("order") == pytest.approx(0.1, abs=0.01)
+    # A heavier request queues behind the previous reservation
+    assert limiter.reserve("execute") == pytest.approx(0.3, abs=0.01)
+
+
+def test_tier_defaults() -> None:
+    """Test limiter defaults follow the lite-api / api.jup.ag split"""
+    assert RateLimiter.for_api_key(None).rate == LITE_API_RATE
+    assert RateLimiter.for_api_key("key").rate == PRO_API_RATE
+
+
+def test_adjusts_from_response_headers() -> None:
+    """Test the bucket tightens from rate-limit headers"""
+    limiter = RateLimiter(rate=10, burst=10)
+
+    limiter.update_from_headers({"x-ratelimit-remaining": "3"}, 200)
+    assert limiter.available <= 3.01
+
+    limiter.update_from_headers(
+        {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "1"}, 200
+    )
+    assert limiter.reserve("order") == pytest.approx(1.1, abs=0.05)
+
+    paused = RateLimiter(rate=10, burst=10)
+    paused.update_from_headers({"Retry-After": "2"}, 429)
+    assert paused.reserve("order") == pytest.approx(2.1, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_async_acquire_queues_instead_of_failing() -> None:
+    """Test concurrent acquires are spread out at the configured rate"""
+    limiter = RateLimiter(rate=100, burst=1)
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire("shield") for _ in range(6)))
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.045
+
+
+def test_client_requests_go_through_limiter(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test client calls consume tokens and learn from response headers"""
+    limiter = RateLimiter(rate=1, burst=5)
+    client = UltraApiClient(rate_limiter=limiter)
+    response = make_response(200, {}, headers={"x-ratelimit-remaining": "2"})
+
+    with patch("curl_cffi.requests.Session.get", return_value=response):
+        client.balances("CzieXbdjF4suiEBe6rQEgiz8phk6v3fVHndMn1sYgmCv")
+
+    assert limiter.available <= 2.01
+
+    client.close()
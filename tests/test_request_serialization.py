@@ -0,0 +1,55 @@
+from typing import Any, Union
+from urllib.parse import parse_qsl, urlencode
+
+from pydantic.alias_generators import to_camel
+
+from jup_python_sdk.models.ultra_api.ultra_execute_request_model import (
+    UltraExecuteRequest,
+)
+from jup_python_sdk.models.ultra_api.ultra_order_request_model import UltraOrderRequest
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+TAKER = "CzieXbdjF4suiEBe6rQEgiz8phk6v3fVHndMn1sYgmCv"
+
+
+def reference_to_dict(
+    request: Union[UltraOrderRequest, UltraExecuteRequest],
+) -> dict[str, Any]:
+    """The model_dump + to_camel conversion the fast path replaces."""
+    params = request.model_dump(exclude_none=True)
+    return {to_camel(key): value for key, value in params.items()}
+
+
+def build_order() -> UltraOrderRequest:
+    return UltraOrderRequest(
+        input_mint=SOL_MINT,
+        output_mint=USDC_MINT,
+        amount=10000000,
+        taker=TAKER,
+        referral_fee=50,
+    )
+
+
+def test_fast_paths_match_reference_serialization() -> None:
+    """Test to_dict and to_query_string agree with pydantic"""
+    order = build_order()
+    execute = UltraExecuteRequest(signed_transaction="tx", request_id="id")
+
+    assert order.to_dict() == reference_to_dict(order)
+    assert order.to_dict() == order.model_dump(by_alias=True, exclude_none=True)
+    assert execute.to_dict() == reference_to_dict(execute)
+
+    query = order.to_query_string()
+    assert query == urlencode(order.to_dict())
+    assert dict(parse_qsl(query)) == {k: str(v) for k, v in order.to_dict().items()}
+
+    odd = UltraOrderRequest(input_mint="a b&c", output_mint=USDC_MINT, amount=1)
+    assert dict(parse_qsl(odd.to_query_string()))["inputMint"] == "a b&c"
+    assert odd.to_query_string() == urlencode(odd.to_dict())
+
+    unicode = UltraOrderRequest(
+        input_mint=SOL_MINT, output_mint="x", amount=1, taker="ü漢"
+    )
+    assert unicode.to_query_string() == urlencode(unicode.to_dict())
+    assert dict(parse_qsl(unicode.to_query_string()))["taker"] == "ü漢"
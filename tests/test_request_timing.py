@@ -0,0 +1,124 @@
+import threading
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from curl_cffi import CurlInfo
+from curl_cffi.requests import Response
+from solders.solders import Keypair
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.models.ultra_api.ultra_order_request_model import UltraOrderRequest
+from jup_python_sdk.signing.signer import KeypairSigner
+from jup_python_sdk.transport.request_timing import (
+    TIMING_INFOS,
+    RequestTiming,
+    TimingRecorder,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        body = b'{"SOL": {"amount": "1"}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def test_breakdown_from_curl_points(make_response: Callable[..., Response]) -> None:
+    """Test cumulative curl timestamps are turned into phase durations"""
+    response = make_response(200)
+    # Keyed by CurlInfo like the real infos, despite the str annotation
+    infos: dict[Any, Any] = {
+        CurlInfo.NAMELOOKUP_TIME_T: 1_000,
+        CurlInfo.CONNECT_TIME_T: 3_000,
+        CurlInfo.APPCONNECT_TIME_T: 10_000,
+        CurlInfo.PRETRANSFER_TIME_T: 10_500,
+        CurlInfo.STARTTRANSFER_TIME_T: 60_500,
+        CurlInfo.TOTAL_TIME_T: 61_000,
+    }
+    response.infos = infos
+
+    timing = RequestTiming.from_response("order", response)
+
+    assert timing.dns == pytest.approx(0.001)
+    assert timing.connect == pytest.approx(0.002)
+    assert timing.tls == pytest.approx(0.007)
+    assert timing.server == pytest.approx(0.05)
+    assert timing.transfer == pytest.approx(0.0005)
+    assert timing.total == pytest.approx(0.061)
+
+    reused = RequestTiming.from_response("order", make_response(200))
+    assert reused.as_dict()["connect"] == 0.0
+
+
+def test_sync_client_records_real_request_timing() -> None:
+    """Test timings are collected from curl for a real local request"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    recorder = TimingRecorder()
+    client = UltraApiClient(
+        client_kwargs={"impersonate": "chrome"}, timing_recorder=recorder
+    )
+    client.base_url = f"http://127.0.0.1:{server.server_port}"
+
+    try:
+        assert client.balances("wallet") == {"SOL": {"amount": "1"}}
+    finally:
+        client.close()
+        server.shutdown()
+
+    assert client.client.curl_infos == TIMING_INFOS
+    [timing] = recorder.requests
+    assert timing.endpoint == "balances" and timing.status_code == 200
+    assert timing.total > 0
+    assert timing.total >= timing.server
+
+
+def test_timing_is_off_by_default() -> None:
+    """Test no curl infos are requested without a recorder"""
+    client = UltraApiClient()
+    assert client.client.curl_infos == []
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_order_and_execute_phase_split(
+    build_unsigned_transaction: Callable[..., str],
+    make_response: Callable[..., Response],
+) -> None:
+    """Test order_and_execute records its order, sign and execute phases"""
+    keypair = Keypair()
+    recorder = TimingRecorder()
+    client = AsyncUltraApiClient(
+        signer=KeypairSigner(keypair), timing_recorder=recorder
+    )
+    order_body = {"requestId": "r", "transaction": build_unsigned_transaction(keypair)}
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = make_response(200, order_body)
+        with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = make_response(200, {"status": "Success"})
+            await client.order_and_execute(
+                UltraOrderRequest(
+                    input_mint="So11111111111111111111111111111111111111112",
+                    output_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+                    amount=1,
+                    taker=str(keypair.pubkey()),
+                )
+            )
+
+    assert [t.endpoint for t in recorder.requests] == ["order", "execute"]
+    [swap] = recorder.swaps
+    assert swap.sign > 0 and swap.requotes == 0
+    assert swap.total == pytest.approx(swap.order + swap.sign + swap.execute)
+
+    await client.close()
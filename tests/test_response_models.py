@@ -0,0 +1,117 @@
+import json
+from collections.abc import Callable
+from unittest.mock import Mock, patch
+
+import pytest
+from curl_cffi.requests import Response
+
+from jup_python_sdk.clients.ultra_api_client import UltraApiClient
+from jup_python_sdk.models.ultra_api.ultra_balances_response_model import (
+    UltraBalancesResponse,
+)
+from jup_python_sdk.models.ultra_api.ultra_execute_response_model import (
+    UltraExecuteResponse,
+)
+from jup_python_sdk.models.ultra_api.ultra_order_request_model import UltraOrderRequest
+from jup_python_sdk.models.ultra_api.ultra_order_response_model import (
+    UltraOrderResponse,
+)
+from jup_python_sdk.models.ultra_api.ultra_shield_response_model import (
+    UltraShieldResponse,
+)
+from jup_python_sdk.transport.json_codec import JsonCodec
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+ORDER_BODY = {
+    "requestId": "request-id",
+    "transaction": "AQID",
+    "inputMint": SOL_MINT,
+    "outputMint": USDC_MINT,
+    "inAmount": "10000000",
+    "outAmount": "1500000",
+    "slippageBps": 50,
+    "swapType": "aggregator",
+    "routePlan": [
+        {"swapInfo": {"label": "Meteora DLMM", "inAmount": "10000000"}, "percent": 100}
+    ]
+    * 10,
+}
+
+
+def test_order_response_parses_hot_fields_only() -> None:
+    """Test the route plan is decoded only when it is read"""
+    order = UltraOrderResponse.from_json(json.dumps(ORDER_BODY).encode())
+
+    assert order.request_id == "request-id"
+    assert order.transaction == "AQID"
+    assert order.slippage_bps == 50
+    assert order._decoded is None
+
+    assert len(order.route_plan) == 10
+    assert order.to_dict()["routePlan"][0]["swapInfo"]["label"] == "Meteora DLMM"
+
+
+def test_to_dict_uses_given_codec() -> None:
+    """Test to_dict decodes the body with the codec passed to from_json"""
+    codec = Mock(wraps=JsonCodec())
+    order = UltraOrderResponse.from_json(json.dumps(ORDER_BODY).encode(), codec)
+
+    assert order.to_dict()["requestId"] == "request-id"
+    codec.loads.assert_called_once()
+
+
+def test_execute_balances_and_shield_models() -> None:
+    """Test the remaining endpoint models parse documented payloads"""
+    execute = UltraExecuteResponse.from_json(
+        b'{"status": "Success", "signature": "sig", "slot": 323598314, "code": 0}'
+    )
+    assert execute.is_success
+    assert execute.slot == "323598314"
+
+    balances = UltraBalancesResponse.from_json(
+        b'{"SOL": {"amount": "100000000", "uiAmount": 0.1, "slot": 1, '
+        b'"isFrozen": false}}'
+    )
+    assert "SOL" in balances
+    assert balances["SOL"].ui_amount == 0.1
+    assert balances.get(USDC_MINT) is None
+    assert list(balances) == ["SOL"]
+
+    shield = UltraShieldResponse.from_json(
+        json.dumps(
+            {
+                "warnings": {
+                    USDC_MINT: [
+                        {
+                            "type": "HAS_FREEZE_AUTHORITY",
+                            "message": "The authority can freeze your funds",
+                            "severity": "warning",
+                        },
+                        {"type": "NOT_VERIFIED", "message": "Not verified"},
+                    ]
+                }
+            }
+        )
+    )
+    frozen, unverified = shield.warnings_for(USDC_MINT)
+    assert frozen.type == "HAS_FREEZE_AUTHORITY"
+    assert unverified.severity is None
+    assert shield.warnings_for(SOL_MINT) == []
+
+
+def test_order_and_execute_requires_transaction(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test a fill-less order fails clearly instead of signing None"""
+    client = UltraApiClient()
+    body = {"requestId": "id", "transaction": None, "errorMessage": "Insufficient"}
+
+    with patch("curl_cffi.requests.Session.get", return_value=make_response(200, body)):
+        with pytest.raises(ValueError, match="Insufficient"):
+            client.order_and_execute(
+                UltraOrderRequest(input_mint=SOL_MINT, output_mint=USDC_MINT, amount=1)
+            )
+
+    client.close()
@@ -0,0 +1,137 @@
+from collections.abc import Callable
+from typing import Optional
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from curl_cffi.const import CurlECode
+from curl_cffi.requests import Response
+from curl_cffi.requests.exceptions import ConnectionError, HTTPError, Timeout
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.models.ultra_api.ultra_execute_request_model import (
+    UltraExecuteRequest,
+)
+from jup_python_sdk.transport.retry_policy import (
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+def http_error(
+    make_response: Callable[..., Response],
+    status_code: int,
+    headers: Optional[dict[str, str]] = None,
+) -> HTTPError:
+    response = make_response(status_code, headers=headers)
+    return HTTPError(f"HTTP Error {status_code}", 0, response)
+
+
+def test_endpoint_idempotency_rules(make_response: Callable[..., Response]) -> None:
+    """Test execute is only retried when the request was never accepted"""
+    policy = RetryPolicy()
+    connect_error = ConnectionError("refused", CurlECode.COULDNT_CONNECT)
+    reset_error = ConnectionError("reset", CurlECode.RECV_ERROR)
+    timeout = Timeout("timed out", CurlECode.OPERATION_TIMEDOUT)
+
+    for endpoint in ("order", "balances", "shield"):
+        assert policy.is_retryable(endpoint, http_error(make_response, 503))
+        assert policy.is_retryable(endpoint, http_error(make_response, 429))
+        assert policy.is_retryable(endpoint, reset_error)
+        assert policy.is_retryable(endpoint, timeout)
+        assert not policy.is_retryable(endpoint, http_error(make_response, 400))
+
+    assert policy.is_retryable("execute", http_error(make_response, 429))
+    assert policy.is_retryable("execute", connect_error)
+    assert not policy.is_retryable("execute", http_error(make_response, 503))
+    assert not policy.is_retryable("execute", reset_error)
+    assert not policy.is_retryable("execute", timeout)
+    assert not policy.is_retryable("order", ValueError("not a request error"))
+
+
+def test_backoff_and_retry_after(make_response: Callable[..., Response]) -> None:
+    """Test exponential backoff, Retry-After and attempt limits"""
+    policy = RetryPolicy(max_attempts=4, backoff_base=0.1, jitter=False)
+    error = http_error(make_response, 503)
+
+    assert policy.next_delay("order", 1, error) == pytest.approx(0.1)
+    assert policy.next_delay("order", 2, error) == pytest.approx(0.2)
+    assert policy.next_delay("order", 4, error) is None
+    assert policy.next_delay("order", 1, error, {"Retry-After": "2"}) == 2.0
+    # Waiting longer than max_retry_after is not worth it
+    assert policy.next_delay("order", 1, error, {"Retry-After": "3600"}) is None
+
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_retry_budget_limits_retries() -> None:
+    """Test the budget stops retries once exhausted"""
+    budget = RetryBudget(
+        ratio=0.0, min_retries_per_second=0.0, max_balance=2, initial_balance=2
+    )
+
+    assert budget.try_spend()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+    for _ in range(10):
+        budget.record_request()
+    assert not budget.try_spend()
+
+
+def test_sync_client_retries_idempotent_calls(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test the sync client retries a 503 on balances and then succeeds"""
+    client = UltraApiClient(retry_policy=RetryPolicy(backoff_base=0))
+    responses = [make_response(503), make_response(200, {"SOL": {"amount": "1"}})]
+
+    with patch("curl_cffi.requests.Session.get", side_effect=responses) as mock_get:
+        balances = client.balances("CzieXbdjF4suiEBe6rQEgiz8phk6v3fVHndMn1sYgmCv")
+
+    assert balances == {"SOL": {"amount": "1"}}
+    assert mock_get.call_count == 2
+
+    client.close()
+
+
+def test_sync_client_does_not_retry_ambiguous_execute(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test a 503 on execute is surfaced rather than resubmitted"""
+    client = UltraApiClient(retry_policy=RetryPolicy(backoff_base=0))
+    request = UltraExecuteRequest(signed_transaction="tx", request_id="id")
+
+    with patch(
+        "curl_cffi.requests.Session.post", return_value=make_response(503)
+    ) as mock_post:
+        with pytest.raises(HTTPError):
+            client.execute(request)
+
+    assert mock_post.call_count == 1
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_retries_rate_limited_execute(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test the async client retries an execute rejected with 429"""
+    client = AsyncUltraApiClient(retry_policy=RetryPolicy(backoff_base=0))
+    request = UltraExecuteRequest(signed_transaction="tx", request_id="id")
+    responses = [
+        make_response(429, headers={"Retry-After": "0"}),
+        make_response(200, {"status": "Success"}),
+    ]
+
+    with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
+        mock_post.side_effect = responses
+        result = await client.execute(request)
+
+    assert result == {"status": "Success"}
+    assert mock_post.call_count == 2
+
+    await client.close()
@@ -0,0 +1,101 @@
+import threading
+import time
+from collections.abc import Callable, Generator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from curl_cffi import requests
+from curl_cffi.requests import Response
+
+from jup_python_sdk.clients.batch import run_bounded_threads
+from jup_python_sdk.clients.ultra_api_client import UltraApiClient
+from jup_python_sdk.transport.session_pool import SessionPool
+
+
+def test_pool_reuses_sessions_and_bounds_size() -> None:
+    """Test sessions are created on demand, reused and capped"""
+    pool = SessionPool(2, lambda: requests.Session(use_thread_local_curl=False))
+
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+
+    second = pool.acquire()
+    assert second is not first
+    assert pool.created == 2
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.01)
+
+    pool.release(first)
+    pool.release(second)
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+
+def test_threads_share_pooled_sessions(make_response: Callable[..., Response]) -> None:
+    """Test concurrent sync calls spread over at most pool_size sessions"""
+    client = UltraApiClient(pool_size=4)
+    used_sessions: set[int] = set()
+    lock = threading.Lock()
+
+    def fake_get(session: requests.Session[Any], url: str, **kwargs: Any) -> Response:
+        with lock:
+            used_sessions.add(id(session))
+        time.sleep(0.005)
+        if url.endswith("/bad"):
+            return make_response(500)
+        return make_response(200, {"SOL": {"amount": "1"}})
+
+    addresses = [f"wallet{i}" for i in range(19)] + ["bad"]
+    with patch("curl_cffi.requests.Session.get", autospec=True, side_effect=fake_get):
+        results = list(client.balances_many(addresses, concurrency=4))
+
+    assert sorted(r.index for r in results) == list(range(20))
+    assert [r.item for r in results if not r.ok] == ["bad"]
+    assert len(used_sessions) <= 4
+    assert client.session_pool is not None
+    assert client.session_pool.created <= 4
+    # Pooled clients never open the per-thread session
+    assert client._client is None
+
+    client.close()
+
+
+def test_pooled_warmup_opens_each_session(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test warmup(connections=n) warms n distinct pooled sessions"""
+    client = UltraApiClient(pool_size=3)
+    warmed: set[int] = set()
+
+    def fake_head(session: requests.Session[Any], url: str, **kwargs: Any) -> Response:
+        warmed.add(id(session))
+        return make_response(404)
+
+    with patch("curl_cffi.requests.Session.head", autospec=True, side_effect=fake_head):
+        client.warmup(connections=3)
+
+    assert len(warmed) == 3
+
+    client.close()
+
+
+def test_run_bounded_threads_backpressure() -> None:
+    """Test new calls wait for the consumer and early exit stops the batch"""
+    started: list[int] = []
+
+    def call(item: int) -> int:
+        started.append(item)
+        return item
+
+    stream = run_bounded_threads(range(100), call, concurrency=2)
+    next(stream)
+    time.sleep(0.05)
+
+    assert len(started) <= 3
+
+    assert isinstance(stream, Generator)
+    stream.close()
+    assert len(started) <= 3
@@ -0,0 +1,104 @@
+import asyncio
+from collections.abc import Callable
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from curl_cffi.requests import Response
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.transport.response_cache import ShieldCache, TtlCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expiry_stale_and_lru() -> None:
+    """Test fresh, stale and expired lookups and LRU eviction"""
+    clock = FakeClock()
+    cache: TtlCache[str, int] = TtlCache(maxsize=2, ttl=10, stale_ttl=5, clock=clock)
+
+    cache.set("a", 1)
+    assert cache.lookup("a") == (1, True, True)
+    clock.now = 12
+    assert cache.lookup("a") == (1, True, False)
+    assert cache.get("a") is None
+    clock.now = 16
+    assert cache.lookup("a") == (None, False, False)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.lookup("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    assert cache.stats() == {
+        "hits": 3,
+        "stale_hits": 2,
+        "misses": 2,
+        "evictions": 1,
+        "size": 2,
+    }
+
+
+def test_sync_client_fetches_only_missing_mints(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test cached mints are served locally and misses are fetched"""
+    cache = ShieldCache()
+    client = UltraApiClient(shield_cache=cache)
+
+    with patch("curl_cffi.requests.Session.get") as mock_get:
+        mock_get.return_value = make_response(
+            200, {"warnings": {"A": [{"type": "NOT_VERIFIED"}]}}
+        )
+        first = client.shield(["A", "B"])
+        mock_get.return_value = make_response(200, {"warnings": {}})
+        second = client.shield(["A", "B", "C"])
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["params"] == {"mints": "C"}
+
+        client.shield(["C", "A"])
+        assert mock_get.call_count == 2
+
+    assert first == second == {"warnings": {"A": [{"type": "NOT_VERIFIED"}]}}
+    assert cache.hits == 4 and cache.misses == 3
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_serves_stale_and_revalidates(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test a stale mint is returned at once and refreshed in the background"""
+    clock = FakeClock()
+    cache = ShieldCache(ttl=10, stale_ttl=100, clock=clock)
+    client = AsyncUltraApiClient(shield_cache=cache)
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = make_response(200, {"warnings": {}})
+        assert await client.shield(["A"]) == {"warnings": {}}
+
+        clock.now = 20
+        mock_get.return_value = make_response(
+            200, {"warnings": {"A": [{"type": "HAS_FREEZE_AUTHORITY"}]}}
+        )
+        assert await client.shield(["A"]) == {"warnings": {}}
+        await asyncio.sleep(0.01)
+
+        assert mock_get.call_count == 2
+        assert await client.shield(["A"]) == {
+            "warnings": {"A": [{"type": "HAS_FREEZE_AUTHORITY"}]}
+        }
+        assert mock_get.call_count == 2
+
+    assert cache.stale_hits == 1
+
+    await client.close()
@@ -0,0 +1,99 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from curl_cffi.requests import Response
+from curl_cffi.requests.exceptions import HTTPError
+
+from jup_python_sdk.clients.shield_coalescer import ShieldCoalescer, ShieldFetch
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient
+
+
+def _fake_shield(calls: list[list[str]]) -> ShieldFetch:
+    async def fetch(mints: list[str]) -> dict[str, Any]:
+        calls.append(mints)
+        await asyncio.sleep(0.001)
+        return {"warnings": {m: [{"type": "LOW_LIQUIDITY"}] for m in mints if "x" in m}}
+
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_are_merged_and_deduplicated() -> None:
+    """Test concurrent lookups share one request and get their own mints"""
+    calls: list[list[str]] = []
+    coalescer = ShieldCoalescer(_fake_shield(calls), window=0.01)
+
+    first, second, third = await asyncio.gather(
+        coalescer.load(["ax", "b"]),
+        coalescer.load(["b", "cx"]),
+        coalescer.load(["ax"]),
+    )
+
+    assert calls == [["ax", "b", "cx"]]
+    assert first == {"warnings": {"ax": [{"type": "LOW_LIQUIDITY"}]}}
+    assert second == {"warnings": {"cx": [{"type": "LOW_LIQUIDITY"}]}}
+    assert third == {"warnings": {"ax": [{"type": "LOW_LIQUIDITY"}]}}
+
+
+@pytest.mark.asyncio
+async def test_large_batches_are_chunked() -> None:
+    """Test a batch is split into requests of at most chunk_size mints"""
+    calls: list[list[str]] = []
+    coalescer = ShieldCoalescer(_fake_shield(calls), window=0.01, chunk_size=4)
+
+    mints = [f"mint{i}" for i in range(10)]
+    results = await asyncio.gather(*(coalescer.load([m]) for m in mints))
+
+    assert sorted(len(c) for c in calls) == [2, 4, 4]
+    assert sorted(m for c in calls for m in c) == sorted(mints)
+    assert all(r == {"warnings": {}} for r in results)
+
+
+@pytest.mark.asyncio
+async def test_chunk_failure_only_fails_its_callers() -> None:
+    """Test a failed chunk raises for callers waiting on its mints"""
+
+    async def fetch(mints: list[str]) -> dict[str, Any]:
+        if "bad" in mints:
+            raise ValueError("boom")
+        return {"warnings": {}}
+
+    coalescer = ShieldCoalescer(fetch, window=0.01, chunk_size=2)
+    results = await asyncio.gather(
+        coalescer.load(["a"]),
+        coalescer.load(["b"]),
+        coalescer.load(["bad"]),
+        return_exceptions=True,
+    )
+
+    assert list(results[:2]) == [{"warnings": {}}, {"warnings": {}}]
+    assert isinstance(results[2], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_client_coalesces_shield_calls(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test the client sends one shield request for concurrent callers"""
+    client = AsyncUltraApiClient(shield_batch_window=0.01)
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = make_response(
+            200, {"warnings": {"A": [{"type": "NOT_VERIFIED"}]}}
+        )
+        first, second = await asyncio.gather(
+            client.shield(["A"]), client.shield(["B", "A"])
+        )
+
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["params"] == {"mints": "A,B"}
+        assert first == second == {"warnings": {"A": [{"type": "NOT_VERIFIED"}]}}
+
+        mock_get.return_value = make_response(500)
+        with pytest.raises(HTTPError):
+            await client.shield(["C"])
+
+    await client.close()
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import base58
+import pytest
+from solders.solders import Keypair
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.signing.signer import (
+    BytesSigner,
+    EnvVarSigner,
+    FileSigner,
+    KeypairSigner,
+    parse_private_key,
+)
+
+
+def test_parse_private_key_formats() -> None:
+    """Test base58 and uint8-array private keys decode to the same bytes"""
+    keypair = Keypair()
+    raw = bytes(keypair)
+
+    assert parse_private_key(str(keypair)) == raw
+    assert parse_private_key(str(list(raw))) == raw
+
+    with pytest.raises(ValueError):
+        parse_private_key("[1, 2, 300]")
+
+
+def test_env_var_signer_decodes_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the env-var signer reads and decodes the key only once"""
+    keypair = Keypair()
+    monkeypatch.setenv("TEST_SIGNER_KEY", str(keypair))
+    signer = EnvVarSigner("TEST_SIGNER_KEY")
+
+    assert signer.pubkey == keypair.pubkey()
+
+    # Later environment changes must not affect the cached keypair
+    monkeypatch.setenv("TEST_SIGNER_KEY", str(Keypair()))
+    assert signer.keypair == keypair
+    assert signer.pubkey_str == str(keypair.pubkey())
+
+
+def test_bytes_and_file_signers(tmp_path: Path) -> None:
+    """Test signers built from raw bytes and from a keypair file"""
+    keypair = Keypair()
+    key_file = tmp_path / "id.json"
+    key_file.write_text(str(list(bytes(keypair))))
+    base58_file = tmp_path / "key.txt"
+    base58_file.write_text(base58.b58encode(bytes(keypair)).decode() + "\n")
+
+    assert BytesSigner(bytes(keypair)).pubkey == keypair.pubkey()
+    assert FileSigner(key_file).pubkey == keypair.pubkey()
+    assert FileSigner(str(base58_file)).pubkey == keypair.pubkey()
+
+
+def test_client_uses_injected_signer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test clients use an injected signer without touching the environment"""
+    monkeypatch.delenv("PRIVATE_KEY", raising=False)
+    keypair = Keypair()
+    client = UltraApiClient(signer=KeypairSigner(keypair))
+
+    assert client.get_public_key() == str(keypair.pubkey())
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_injected_signer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test async clients use an injected signer"""
+    monkeypatch.delenv("PRIVATE_KEY", raising=False)
+    keypair = Keypair()
+    client = AsyncUltraApiClient(signer=KeypairSigner(keypair))
+
+    assert await client.get_public_key() == str(keypair.pubkey())
+
+    await client.close()
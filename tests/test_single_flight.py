@@ -0,0 +1,142 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from curl_cffi.requests import Response
+
+from jup_python_sdk.clients.ultra_api_client import AsyncUltraApiClient, UltraApiClient
+from jup_python_sdk.models.ultra_api.ultra_order_request_model import (
+    UltraOrderRequest,
+)
+from jup_python_sdk.transport.single_flight import (
+    AsyncSingleFlight,
+    SingleFlight,
+    request_key,
+)
+
+WSOL = "So11111111111111111111111111111111111111112"
+USDC = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+
+def test_request_key_ignores_param_order() -> None:
+    """Test equal requests get equal keys regardless of param order"""
+    assert request_key("GET", "u", {"a": 1, "b": 2}) == request_key(
+        "GET", "u", {"b": 2, "a": 1}
+    )
+    assert request_key("GET", "u") != request_key("GET", "u", {"a": 1})
+
+
+def test_sync_single_flight_shares_result_and_error() -> None:
+    """Test threads waiting on the same key get the leader's outcome"""
+    group: SingleFlight[int] = SingleFlight()
+    calls = 0
+    release = threading.Event()
+
+    def call() -> int:
+        nonlocal calls
+        calls += 1
+        release.wait(1)
+        return 42
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(group.do("k", call)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [42] * 5
+    assert calls == 1 and group.shared == 4
+
+    def fail() -> int:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        group.do("k", fail)
+    assert group.do("k", lambda: 7) == 7
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_survives_cancelled_caller() -> None:
+    """Test cancelling one waiter does not cancel the shared call"""
+    group: AsyncSingleFlight[int] = AsyncSingleFlight()
+    calls = 0
+
+    async def call() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return 42
+
+    first = asyncio.ensure_future(group.do("k", call))
+    second = asyncio.ensure_future(group.do("k", call))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == 42
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_identical_gets(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test concurrent balances and taker-less orders share one request"""
+    client = AsyncUltraApiClient(single_flight=True)
+
+    async def slow_get(url: str, **kwargs: Any) -> Response:
+        await asyncio.sleep(0.01)
+        return make_response(200, {"SOL": {"amount": "1"}})
+
+    with patch.object(client.client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.side_effect = slow_get
+        results = await asyncio.gather(*(client.balances("w") for _ in range(10)))
+        assert mock_get.call_count == 1
+        assert all(r == {"SOL": {"amount": "1"}} for r in results)
+
+        quote = UltraOrderRequest(input_mint=WSOL, output_mint=USDC, amount=1)
+        await asyncio.gather(client.order(quote), client.order(quote))
+        assert mock_get.call_count == 2
+
+        swap = UltraOrderRequest(
+            input_mint=WSOL, output_mint=USDC, amount=1, taker="taker"
+        )
+        await asyncio.gather(client.order(swap), client.order(swap))
+        assert mock_get.call_count == 4
+
+    await client.close()
+
+
+def test_sync_client_shares_identical_gets(
+    make_response: Callable[..., Response],
+) -> None:
+    """Test threads asking for the same shield mints share one request"""
+    client = UltraApiClient(single_flight=True)
+
+    def slow_get(url: str, **kwargs: Any) -> Response:
+        time.sleep(0.05)
+        return make_response(200, {"warnings": {}})
+
+    with patch("curl_cffi.requests.Session.get", side_effect=slow_get) as mock_get:
+        threads = [
+            threading.Thread(target=client.shield, args=(["A", "B"],)) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert mock_get.call_count == 1
+    assert client.single_flight is not None
+    assert client.single_flight.shared == 3
+
+    client.close()
@@ -0,0 +1,148 @@
+import base64
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from solders.solders import Keypair, VersionedTransaction
+
+from jup_python_sdk.clients.ultra_api_client import UltraApiClient
+from jup_python_sdk.signing.keyring import Keyring
+from jup_python_sdk.signing.signature_splice import (
+    parse_transaction_layout,
+    splice_signature,
+    splice_signatures,
+)
+from jup_python_sdk.signing.signer import KeypairSigner
+from jup_python_sdk.signing.transaction_signing import sign_versioned_transaction
+
+
+def assert_signed(transaction_base64: str) -> VersionedTransaction:
+    transaction = VersionedTransaction.from_bytes(base64.b64decode(transaction_base64))
+    assert all(transaction.verify_with_results())
+    return transaction
+
+
+def test_sign_transactions_batch(
+    build_unsigned_transaction: Callable[..., str],
+) -> None:
+    """Test batch signing matches the per-transaction path and keeps order"""
+    keypair = Keypair()
+    client = UltraApiClient(signer=KeypairSigner(keypair))
+    transactions = [build_unsigned_transaction(keypair, i + 1) for i in range(5)]
+
+    signed = client.sign_transactions(transactions)
+
+    expected = [
+        client._serialize_versioned_transaction(client._sign_base64_transaction(tx))
+        for tx in transactions
+    ]
+    assert signed == expected
+    for transaction in signed:
+        assert_signed(transaction)
+
+    client.close()
+
+
+def test_sign_transactions_with_executor(
+    build_unsigned_transaction: Callable[..., str],
+) -> None:
+    """Test batch signing fanned out over a thread pool keeps input order"""
+    keypair = Keypair()
+    client = UltraApiClient(signer=KeypairSigner(keypair))
+    transactions = [build_unsigned_transaction(keypair, i + 1) for i in range(10)]
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        signed = client.sign_transactions(transactions, executor=pool, chunk_size=3)
+
+    assert signed == client.sign_transactions(transactions)
+
+    client.close()
+
+
+def test_splice_signature_matches_solders_path(
+    build_unsigned_transaction: Callable[..., str],
+) -> None:
+    """Test the in-place signature splice yields the solders-signed bytes"""
+    keypair = Keypair()
+    client = UltraApiClient(signer=KeypairSigner(keypair))
+    transaction = build_unsigned_transaction(keypair)
+
+    spliced = splice_signature(base64.b64decode(transaction), keypair)
+    rebuilt = client._sign_base64_transaction(transaction)
+
+    assert spliced is not None
+    assert bytes(spliced) == bytes(rebuilt)
+    assert client.sign_transaction(transaction) == (
+        client._serialize_versioned_transaction(rebuilt)
+    )
+
+    client.close()
+
+
+def test_splice_signature_rejects_unexpected_layout(
+    build_unsigned_transaction: Callable[..., str],
+) -> None:
+    """Test the splice declines inputs so callers fall back to solders"""
+    keypair = Keypair()
+    transaction = base64.b64decode(build_unsigned_transaction(keypair))
+
+    # Not a signer of this transaction
+    assert splice_signature(transaction, Keypair()) is None
+    # Unsupported message version
+    versioned = bytearray(transaction)
+    versioned[1 + 64] = 0x81
+    assert splice_signature(bytes(versioned), keypair) is None
+    # Truncated input
+    assert splice_signature(transaction[:70], keypair) is None
+    assert parse_transaction_layout(b"") is None
+
+
+def test_keyring_signs_every_required_signer(
+    build_unsigned_transaction: Callable[..., str],
+) -> None:
+    """Test a keyring fills all of its wallets' slots in one call"""
+    payer, co_signer = Keypair(), Keypair()
+    keyring = Keyring([payer, KeypairSigner(co_signer)])
+    client = UltraApiClient(signer=keyring)
+    transaction = build_unsigned_transaction(payer, 1, co_signer)
+
+    signed = assert_signed(client.sign_transaction(transaction))
+
+    # The solders fallback produces the same signatures
+    rebuilt = sign_versioned_transaction(
+        VersionedTransaction.from_bytes(base64.b64decode(transaction)),
+        keyring.signing_keys,
+    )
+    assert rebuilt.signatures == signed.signatures
+
+    client.close()
+
+
+def test_keyring_partial_signing_and_lookup(
+    build_unsigned_transaction: Callable[..., str],
+) -> None:
+    """Test a keyring signs only the slots it holds keys for"""
+    payer, co_signer = Keypair(), Keypair()
+    keyring = Keyring()
+    keyring.add(co_signer)
+    transaction = base64.b64decode(build_unsigned_transaction(payer, 1, co_signer))
+
+    spliced = splice_signatures(transaction, keyring.signing_keys)
+    assert spliced is not None
+    signed = VersionedTransaction.from_bytes(bytes(spliced))
+    assert signed.verify_with_results() == [False, True]
+
+    assert str(co_signer.pubkey()) in keyring
+    assert keyring.get(co_signer.pubkey()) == co_signer
+    assert keyring.pubkey == co_signer.pubkey()
+
+    keyring.add(payer)
+    with pytest.raises(ValueError):
+        _ = keyring.pubkey_str
+    keyring.remove(str(payer.pubkey()))
+    assert len(keyring) == 1
+
+    with pytest.raises(ValueError):
+        sign_versioned_transaction(
+            VersionedTransaction.from_bytes(transaction), Keyring().signing_keys
+        )